@@ -11,19 +11,66 @@ FUNCIONAMIENTO CORRECTO:
    - Lo agrega/actualiza en la frontera
 4. Repite hasta encontrar el objetivo
 """
-import heapq
+import importlib
+from colas_prioridad import crear_cola
 from funciones_astar import (
     calcular_peso_movimiento,
-    calcular_heuristica,
+    crear_heuristica,
     calcular_funcion_costo,
-    obtener_vecinos,
     reconstruir_camino
 )
+from mascara_vecinos import MascaraPerezosa
+from eventos_busqueda import (
+    EXPANDIR, GENERAR, ACTUALIZAR, ENCONTRADO,
+    evento, evento_agotado, eventos_desde_pasos
+)
+
+
+# Motores disponibles: nombre -> (módulo, clase)
+# Se importan bajo demanda para no cargar motores que no se usan
+MOTORES = {
+    'diccionarios': ('algoritmo_astar', 'AlgoritmoAStar'),
+    'arreglos': ('motor_arreglos', 'AlgoritmoAStarArreglos'),
+    'jps': ('busqueda_jps', 'AlgoritmoJPS'),
+    'jps+': ('busqueda_jps', 'AlgoritmoJPSPlus'),
+    'bidireccional': ('busqueda_bidireccional', 'AlgoritmoAStarBidireccional'),
+    'ara': ('busqueda_anytime', 'AlgoritmoARAStar'),
+    'ida': ('busqueda_ida', 'AlgoritmoIDAStar'),
+    'theta': ('busqueda_theta', 'AlgoritmoThetaStar'),
+    'lazy-theta': ('busqueda_theta', 'AlgoritmoLazyThetaStar'),
+}
+
+
+def resolver_motor(motor):
+    """
+    Obtiene la clase que implementa un motor de búsqueda
+    
+    Args:
+        motor: Nombre del motor (clave de MOTORES)
+    
+    Returns:
+        type: Clase del motor
+    """
+    if motor not in MOTORES:
+        raise ValueError(
+            f"Motor desconocido: {motor!r}. Opciones: {', '.join(MOTORES)}"
+        )
+    modulo, clase = MOTORES[motor]
+    return getattr(importlib.import_module(modulo), clase)
 
 
 class AlgoritmoAStar:
+    def __new__(cls, *args, motor='diccionarios', **kwargs):
+        # AlgoritmoAStar(..., motor='arreglos') construye directamente el
+        # motor elegido; las subclases se construyen normalmente
+        if cls is AlgoritmoAStar and motor != 'diccionarios':
+            cls = resolver_motor(motor)
+        return super().__new__(cls)
+    
     def __init__(self, inicio, fin, filas, columnas, obstaculos, 
-                 config_costos, permitir_diagonal=False, tipo_heuristica='manhattan'):
+                 config_costos, permitir_diagonal=False, tipo_heuristica='manhattan',
+                 motor='diccionarios', cola='heapq', mascara=None, campos=None,
+                 tabla_alt=None, componentes=None):
         """
         Inicializa el algoritmo A*
         
@@ -35,7 +82,32 @@ class AlgoritmoAStar:
             obstaculos: Set de tuplas con posiciones bloqueadas
             config_costos: Dict con costos {'horizontal', 'vertical', 'diagonal'}
             permitir_diagonal: Si True, permite movimientos en 8 direcciones
-            tipo_heuristica: Tipo de heurística a usar
+            tipo_heuristica: Tipo de heurística a usar ('manhattan',
+                             'euclidiana', 'octile', 'chebyshev' o 'alt')
+            motor: Motor de búsqueda (clave de MOTORES).
+                   'arreglos' usa buffers planos, recomendado para mapas grandes.
+                   'jps' / 'jps+' usan Jump Point Search (costo uniforme y diagonal).
+                   'bidireccional' busca a la vez desde el inicio y desde el fin.
+                   'ara' es anytime: camino rápido con heurística inflada que
+                   se mejora hasta agotar un presupuesto (ver busqueda_anytime).
+                   'ida' es IDA* con memoria acotada, para mapas enormes.
+                   'theta' / 'lazy-theta' dan caminos en cualquier ángulo
+            cola: Cola de prioridad de la frontera ('heapq', 'indexada',
+                  'indexada4', 'buckets'). Las indexadas actualizan la
+                  prioridad en su lugar en vez de duplicar entradas;
+                  'buckets' usa cubetas con costos escalados a enteros
+            mascara: MascaraVecinos ya construida para estos obstáculos
+                     (para compartirla entre consultas). Si es None se usa
+                     una MascaraPerezosa, que solo guarda las máscaras de
+                     las celdas visitadas
+            campos: CacheCamposHeuristicos compartida entre consultas. Si se
+                    indica, H se consulta en el campo precalculado del fin
+                    en lugar de calcularse nodo a nodo
+            tabla_alt: TablaALT de heuristica_alt, obligatoria con
+                       tipo_heuristica='alt'
+            componentes: ComponentesConexas de estos obstáculos. Si inicio y
+                         fin están en componentes distintas la búsqueda
+                         termina sin camino en el primer paso
         """
         self.inicio = inicio
         self.fin = fin
@@ -45,9 +117,21 @@ class AlgoritmoAStar:
         self.config_costos = config_costos
         self.permitir_diagonal = permitir_diagonal
         self.tipo_heuristica = tipo_heuristica
+        self.motor = motor
+        self.cola = cola
+        
+        # Movimientos legales por celda. Sin mascara= se calculan al vuelo
+        # sobre los obstáculos y se guardan solo los de celdas visitadas
+        if mascara is None:
+            mascara = MascaraPerezosa(filas, columnas, obstaculos)
+        self.mascara = mascara
+        
+        # Heurística con el objetivo y los costos ya fijados
+        self._preparar_heuristica(campos, tabla_alt)
+        self.heuristica = self._heuristica_hacia(fin)
         
         # Estructuras de datos principales
-        self.frontera = []           # Cola de prioridad (heap) - ordena por F
+        self.frontera = self._crear_cola()  # Cola de prioridad - ordena por F
         self.vino_de = {}           # Para reconstruir el camino
         self.costo_g = {}           # Costo acumulado desde inicio (G)
         self.costo_h = {}           # Heurística (H)
@@ -60,29 +144,79 @@ class AlgoritmoAStar:
         # Estadísticas
         self.nodos_explorados = 0
         self.vecinos_totales_evaluados = 0
+        self.extracciones_obsoletas = 0  # Entradas duplicadas descartadas
         
         # Inicializar
         self.inicializar()
+        self._comprobar_componentes(componentes)
+    
+    def _comprobar_componentes(self, componentes):
+        """Vacía la búsqueda si inicio y fin están en componentes distintas"""
+        self.componentes = componentes
+        self.inalcanzable = False
+        if componentes is not None:
+            componentes.comprobar_dimensiones(self.filas, self.columnas)
+            if not componentes.conectados(self.inicio, self.fin):
+                self.inalcanzable = True
+                self._vaciar_frontera()
+    
+    def _crear_cola(self):
+        """Cola de prioridad vacía del tipo elegido para la frontera"""
+        return crear_cola(self.cola, self.config_costos)
+    
+    def _vaciar_frontera(self):
+        """Deja la frontera vacía: el siguiente paso informa que no hay camino"""
+        self.frontera = self._crear_cola()
+    
+    def _preparar_heuristica(self, campos, tabla_alt):
+        """Guarda y valida las fuentes de la heurística"""
+        if self.tipo_heuristica == 'alt':
+            if tabla_alt is None:
+                raise ValueError(
+                    "La heurística 'alt' requiere tabla_alt "
+                    "(ver heuristica_alt.precalcular_alt)"
+                )
+            tabla_alt.comprobar_compatible(self.filas, self.columnas,
+                                           self.config_costos,
+                                           self.permitir_diagonal, self.mascara)
+        elif campos is not None:
+            campos.comprobar_dimensiones(self.filas, self.columnas)
+        self.campos = campos
+        self.tabla_alt = tabla_alt
+    
+    def _heuristica_hacia(self, objetivo, indices=False):
+        """
+        Crea la función heurística hacia un objetivo
+        
+        Args:
+            objetivo: Tupla (fila, col) del objetivo
+            indices: Si True, la función recibe índices planos
+        
+        Returns:
+            callable: h(nodo) -> float
+        """
+        if self.tipo_heuristica == 'alt':
+            return self.tabla_alt.crear_heuristica(objetivo, indices)
+        if self.campos is not None:
+            campo = self.campos.obtener(objetivo, self.tipo_heuristica,
+                                        self.config_costos)
+            return campo.heuristica_indice() if indices else campo.heuristica_nodo()
+        return crear_heuristica(self.tipo_heuristica, objetivo, self.config_costos,
+                                self.columnas if indices else None)
     
     def inicializar(self):
         """Inicializa el nodo de inicio en todas las estructuras"""
         # Calcular costos del nodo inicial
         self.costo_g[self.inicio] = 0
-        self.costo_h[self.inicio] = calcular_heuristica(
-            self.inicio, self.fin, self.config_costos, self.tipo_heuristica
-        )
+        self.costo_h[self.inicio] = self.heuristica(self.inicio)
         self.costo_f[self.inicio] = calcular_funcion_costo(
             self.costo_g[self.inicio],
             self.costo_h[self.inicio]
         )
         
         # Agregar a la frontera
-        # Formato: (F, contador, nodo)
-        heapq.heappush(self.frontera, (
-            self.costo_f[self.inicio], 
-            self.contador, 
-            self.inicio
-        ))
+        # Formato de las entradas: (F, contador, nodo)
+        self.frontera.insertar(self.inicio, self.costo_f[self.inicio], self.contador)
         self.contador += 1
     
     def ejecutar_paso(self):
@@ -110,18 +244,18 @@ class AlgoritmoAStar:
                   - encontrado: True si llegamos al objetivo
         """
         
-        # Verificar que haya nodos en la frontera
-        if not self.frontera:
-            return None, [], False
-        
         # 1. EXTRAER el nodo con menor F de la frontera
-        f_actual, _, actual = heapq.heappop(self.frontera)
-        
         # 2. Si ya lo exploramos completamente, saltarlo
-        if actual in self.cerrado:
-            # Esto puede pasar si agregamos el mismo nodo múltiples veces
-            # con diferentes valores de F
-            return self.ejecutar_paso()  # Recursión para obtener el siguiente
+        #    Esto puede pasar con la cola 'heapq', que agrega el mismo nodo
+        #    varias veces con diferentes valores de F
+        while self.frontera:
+            f_actual, _, actual = self.frontera.extraer()
+            if actual not in self.cerrado:
+                break
+            self.extracciones_obsoletas += 1
+        else:
+            # La frontera está vacía
+            return None, [], False
         
         # 3. MARCAR como explorado
         self.cerrado.add(actual)
@@ -132,13 +266,8 @@ class AlgoritmoAStar:
             return actual, [], True
         
         # 5. OBTENER TODOS LOS VECINOS VÁLIDOS
-        vecinos = obtener_vecinos(
-            actual, 
-            self.filas, 
-            self.columnas, 
-            self.obstaculos, 
-            self.permitir_diagonal
-        )
+        # (mismas reglas que obtener_vecinos, leídas de la máscara precompilada)
+        vecinos = self.mascara.vecinos(actual, self.permitir_diagonal)
         
         # Lista para retornar los vecinos que se exploraron en este paso
         vecinos_explorados = []
@@ -165,9 +294,7 @@ class AlgoritmoAStar:
                 self.costo_g[vecino] = nuevo_costo_g
                 
                 # CALCULAR heurística H
-                self.costo_h[vecino] = calcular_heuristica(
-                    vecino, self.fin, self.config_costos, self.tipo_heuristica
-                )
+                self.costo_h[vecino] = self.heuristica(vecino)
                 
                 # CALCULAR función de costo F = G + H
                 self.costo_f[vecino] = calcular_funcion_costo(
@@ -175,12 +302,9 @@ class AlgoritmoAStar:
                     self.costo_h[vecino]
                 )
                 
-                # AGREGAR a la frontera con prioridad F
-                # El heap automáticamente mantiene el orden por F menor
-                heapq.heappush(
-                    self.frontera,
-                    (self.costo_f[vecino], self.contador, vecino)
-                )
+                # AGREGAR a la frontera con prioridad F (o mejorar su F)
+                # La cola automáticamente mantiene el orden por F menor
+                self.frontera.insertar(vecino, self.costo_f[vecino], self.contador)
                 self.contador += 1
                 
                 # GUARDAR de dónde venimos (para reconstruir el camino)
@@ -194,7 +318,79 @@ class AlgoritmoAStar:
         
         # Retornar información del paso
         return actual, vecinos_explorados, False
-    
+
+    def iterar_eventos(self):
+        """
+        Ejecuta la búsqueda como un flujo de eventos (ver eventos_busqueda)
+
+        Hace lo mismo que llamar a ejecutar_paso hasta terminar, pero cada
+        vecino agregado o mejorado se informa en el momento con su G, H y F,
+        sin volver a leer los diccionarios de costos.
+
+        Los motores que redefinen ejecutar_paso (y no este método) obtienen
+        sus eventos a partir de sus pasos.
+
+        Yields:
+            Evento: EXPANDIR, GENERAR y ACTUALIZAR; termina con ENCONTRADO
+                    o AGOTADO
+        """
+        if type(self).ejecutar_paso is not AlgoritmoAStar.ejecutar_paso:
+            yield from eventos_desde_pasos(self)
+            return
+
+        frontera = self.frontera
+        cerrado = self.cerrado
+        costo_g, costo_h, costo_f = self.costo_g, self.costo_h, self.costo_f
+        vino_de = self.vino_de
+        heuristica = self.heuristica
+        vecinos_de = self.mascara.vecinos
+        diagonal = self.permitir_diagonal
+        config_costos = self.config_costos
+        fin = self.fin
+
+        while True:
+            while frontera:
+                _, _, actual = frontera.extraer()
+                if actual not in cerrado:
+                    break
+                self.extracciones_obsoletas += 1
+            else:
+                yield evento_agotado()
+                return
+
+            cerrado.add(actual)
+            self.nodos_explorados += 1
+            g_actual = costo_g[actual]
+            datos = (actual, g_actual, costo_h[actual], costo_f[actual], vino_de.get(actual))
+
+            if actual == fin:
+                yield evento(EXPANDIR, *datos)
+                yield evento(ENCONTRADO, *datos)
+                return
+
+            # Los eventos del paso se emiten al terminarlo (ver eventos_busqueda)
+            generados = []
+            for vecino in vecinos_de(actual, diagonal):
+                if vecino in cerrado:
+                    continue
+                nuevo_costo_g = g_actual + calcular_peso_movimiento(actual, vecino, config_costos)
+                anterior = costo_g.get(vecino)
+                if anterior is None or nuevo_costo_g < anterior:
+                    h = heuristica(vecino)
+                    f = calcular_funcion_costo(nuevo_costo_g, h)
+                    costo_g[vecino] = nuevo_costo_g
+                    costo_h[vecino] = h
+                    costo_f[vecino] = f
+                    frontera.insertar(vecino, f, self.contador)
+                    self.contador += 1
+                    vino_de[vecino] = actual
+                    self.vecinos_totales_evaluados += 1
+                    generados.append(evento(GENERAR if anterior is None else ACTUALIZAR,
+                                            vecino, nuevo_costo_g, h, f, actual))
+
+            yield evento(EXPANDIR, *datos)
+            yield from generados
+
     def ejecutar_completo(self):
         """
         Ejecuta el algoritmo completo hasta encontrar el camino
@@ -211,7 +407,7 @@ class AlgoritmoAStar:
             
             if encontrado:
                 # ¡Éxito! Reconstruir el camino
-                camino = reconstruir_camino(self.vino_de, self.inicio, self.fin)
+                camino = self.reconstruir()
                 costos = {
                     'g': self.costo_g,
                     'h': self.costo_h,
@@ -222,6 +418,15 @@ class AlgoritmoAStar:
         # La frontera se vació sin encontrar el objetivo
         return False, [], self.nodos_explorados, {}
     
+    def reconstruir(self):
+        """
+        Camino encontrado, sin inicio ni fin
+        
+        Returns:
+            list: Lista de nodos como la de reconstruir_camino
+        """
+        return reconstruir_camino(self.vino_de, self.inicio, self.fin)
+    
     def obtener_info_frontera(self, limite=10):
         """
         Obtiene información sobre los primeros nodos en la frontera
@@ -251,7 +456,11 @@ class AlgoritmoAStar:
             'nodos_en_frontera': len(self.frontera),
             'nodos_cerrados': len(self.cerrado),
             'vecinos_evaluados': self.vecinos_totales_evaluados,
-            'costo_g_objetivo': self.costo_g.get(self.fin, None)
+            'costo_g_objetivo': self.costo_g.get(self.fin, None),
+            'extracciones_obsoletas': self.extracciones_obsoletas,
+            'inserciones_frontera': self.frontera.inserciones,
+            'tamano_maximo_frontera': self.frontera.tamano_maximo,
+            'inalcanzable': self.inalcanzable
         }
     
     def verificar_consistencia(self):
@@ -0,0 +1,249 @@
+"""
+Línea de comandos sin interfaz gráfica
+
+    python -m astar resolver mapa.map consultas.txt --diagonal --procesos 4
+    python -m astar solve mapa.map consultas.txt --formato csv > resultados.csv
+
+main.py siempre abre la ventana de Tk. Este módulo resuelve lotes de
+consultas sin importar tkinter (ni interfaz_grafica), así que funciona en
+servidores sin pantalla y arranca rápido: los módulos pesados (procesos,
+memoria compartida, formatos de MovingAI) solo se importan si se usan.
+
+MAPA (se detecta por el contenido):
+- MapaBits guardado con MapaBits.guardar (binario)
+- .map de MovingAI (cabecera type/height/width/map)
+- texto plano: una línea por fila; '.', 'G', 'S' y '0' son libres y
+  cualquier otro carácter es obstáculo (las filas cortas se completan
+  con celdas libres)
+
+CONSULTAS:
+- texto: una consulta por línea, "fila_inicio col_inicio fila_fin col_fin"
+  (separadas por espacios o comas); '#' inicia un comentario
+- .scen de MovingAI (empieza con "version")
+
+SALIDA:
+Un resultado por consulta, en el orden de las consultas y a medida que
+se resuelven: JSON lines (por defecto) o CSV con cabecera.
+"""
+import argparse
+import csv
+import json
+import sys
+
+from algoritmo_astar import MOTORES
+from funciones_astar import HEURISTICAS
+from mapa_bits import MapaBits
+
+# Caracteres libres en los mapas de texto plano
+LIBRES = frozenset('.GS0')
+
+COLUMNAS_CSV = ('consulta', 'fila_inicio', 'col_inicio', 'fila_fin', 'col_fin',
+                'exito', 'costo', 'nodos_explorados', 'longitud', 'inalcanzable')
+
+
+# ===== ENTRADA =====
+
+def cargar_cuadricula(ruta):
+    """
+    Lee un mapa en cualquiera de los formatos aceptados
+
+    Returns:
+        tuple: (filas, columnas, obstaculos)
+    """
+    with open(ruta, 'rb') as archivo:
+        firma = archivo.read(4)
+    if firma == b'MAP1':
+        mapa = MapaBits.cargar(ruta)
+        return mapa.filas, mapa.columnas, mapa
+
+    with open(ruta, encoding='utf-8') as archivo:
+        lineas = archivo.read().splitlines()
+    if any(linea.strip() == 'map' for linea in lineas[:8]):
+        from benchmark import cargar_mapa
+        return cargar_mapa(ruta)
+
+    while lineas and not lineas[-1].strip():
+        lineas.pop()
+    if not lineas:
+        raise ValueError(f"{ruta}: el mapa está vacío")
+    filas = len(lineas)
+    columnas = max(len(linea) for linea in lineas)
+    mapa = MapaBits(filas, columnas)
+    bloqueado = mapa.bloqueado
+    for fila, linea in enumerate(lineas):
+        base = fila * columnas
+        for col, caracter in enumerate(linea):
+            if caracter not in LIBRES:
+                bloqueado[base + col] = 1
+    return filas, columnas, mapa
+
+
+def cargar_consultas(ruta):
+    """
+    Lee las consultas
+
+    Returns:
+        list: Tuplas ((fila, col), (fila, col))
+    """
+    with open(ruta, encoding='utf-8') as archivo:
+        lineas = archivo.read().splitlines()
+    if lineas and lineas[0].split()[:1] == ['version']:
+        from benchmark import cargar_escenarios
+        return [(escenario['inicio'], escenario['fin'])
+                for escenario in cargar_escenarios(ruta)]
+
+    consultas = []
+    for numero, linea in enumerate(lineas, 1):
+        linea = linea.split('#', 1)[0].replace(',', ' ').split()
+        if not linea:
+            continue
+        try:
+            fila_inicio, col_inicio, fila_fin, col_fin = map(int, linea)
+        except ValueError:
+            raise ValueError(
+                f"{ruta}:{numero}: se esperaban 4 enteros "
+                "(fila_inicio col_inicio fila_fin col_fin)"
+            ) from None
+        consultas.append(((fila_inicio, col_inicio), (fila_fin, col_fin)))
+    return consultas
+
+
+def _validar_consultas(consultas, filas, columnas, obstaculos):
+    for numero, (inicio, fin) in enumerate(consultas):
+        for nodo in (inicio, fin):
+            if not (0 <= nodo[0] < filas and 0 <= nodo[1] < columnas):
+                raise ValueError(f"Consulta {numero}: {nodo} está fuera del mapa "
+                                 f"de {filas}x{columnas}")
+            if nodo in obstaculos:
+                raise ValueError(f"Consulta {numero}: {nodo} es un obstáculo")
+
+
+# ===== SALIDA =====
+
+class SalidaJSON:
+    """Un objeto JSON por línea"""
+
+    def __init__(self, archivo, con_camino):
+        self.archivo = archivo
+        self.con_camino = con_camino
+
+    def escribir(self, registro):
+        if not self.con_camino:
+            registro.pop('camino')
+        self.archivo.write(json.dumps(registro, ensure_ascii=False) + '\n')
+        self.archivo.flush()
+
+
+class SalidaCSV:
+    """CSV con cabecera; el camino va como "f:c;f:c;..." """
+
+    def __init__(self, archivo, con_camino):
+        self.archivo = archivo
+        self.con_camino = con_camino
+        self.escritor = csv.writer(archivo)
+        self.escritor.writerow(COLUMNAS_CSV + (('camino',) if con_camino else ()))
+
+    def escribir(self, registro):
+        (fila_inicio, col_inicio), (fila_fin, col_fin) = registro['inicio'], registro['fin']
+        fila = [registro['consulta'], fila_inicio, col_inicio, fila_fin, col_fin,
+                int(registro['exito']), '' if registro['costo'] is None else registro['costo'],
+                registro['nodos_explorados'], registro['longitud'],
+                int(registro['inalcanzable'])]
+        if self.con_camino:
+            fila.append(';'.join(f"{f}:{c}" for f, c in registro['camino']))
+        self.escritor.writerow(fila)
+        self.archivo.flush()
+
+
+SALIDAS = {'jsonl': SalidaJSON, 'csv': SalidaCSV}
+
+
+# ===== COMANDOS =====
+
+def resolver(opciones, salida):
+    """Resuelve las consultas y escribe un registro por consulta"""
+    filas, columnas, obstaculos = cargar_cuadricula(opciones.mapa)
+    consultas = cargar_consultas(opciones.consultas)
+    _validar_consultas(consultas, filas, columnas, obstaculos)
+
+    horizontal, vertical, diagonal = opciones.costos
+    config_costos = {'horizontal': horizontal, 'vertical': vertical, 'diagonal': diagonal}
+    tipo_heuristica = opciones.heuristica or ('octile' if opciones.diagonal else 'manhattan')
+
+    from busqueda_lotes import iterar_lote
+    resultados = iterar_lote(
+        filas, columnas, obstaculos, consultas, config_costos,
+        opciones.diagonal, tipo_heuristica, opciones.motor, opciones.procesos,
+        usar_componentes=not opciones.sin_componentes
+    )
+    escritor = SALIDAS[opciones.formato](salida, opciones.camino)
+    for numero, ((inicio, fin), resultado) in enumerate(zip(consultas, resultados)):
+        exito, camino, costo, estadisticas = resultado
+        if exito:
+            camino = [inicio] + camino + [fin] if inicio != fin else [inicio]
+        escritor.escribir({
+            'consulta': numero,
+            'inicio': inicio,
+            'fin': fin,
+            'exito': exito,
+            'costo': costo,
+            'nodos_explorados': estadisticas['nodos_explorados'],
+            'longitud': len(camino),
+            'inalcanzable': bool(estadisticas.get('inalcanzable')),
+            'camino': camino
+        })
+
+
+def crear_parser():
+    parser = argparse.ArgumentParser(
+        prog='python -m astar',
+        description="Búsqueda de caminos A* por lotes, sin interfaz gráfica"
+    )
+    comandos = parser.add_subparsers(dest='comando', required=True)
+
+    comando = comandos.add_parser('resolver', aliases=['solve'],
+                                  help="Resuelve un archivo de consultas sobre un mapa")
+    comando.add_argument('mapa', help="Archivo del mapa (MapaBits, .map o texto)")
+    comando.add_argument('consultas', help="Archivo de consultas (texto o .scen)")
+    comando.add_argument('--motor', choices=list(MOTORES), default='diccionarios')
+    comando.add_argument('--heuristica', choices=HEURISTICAS,
+                         help="Por defecto, octile con --diagonal y manhattan sin ella")
+    comando.add_argument('--diagonal', action='store_true',
+                         help="Permite movimientos en 8 direcciones")
+    comando.add_argument('--costos', nargs=3, type=float, default=(1.0, 1.0, 1.4),
+                         metavar=('HORIZONTAL', 'VERTICAL', 'DIAGONAL'))
+    comando.add_argument('--procesos', type=int, default=1,
+                         help="Procesos en paralelo (0 = uno por núcleo)")
+    comando.add_argument('--sin-componentes', action='store_true',
+                         help="No etiqueta componentes conexas (mapas enormes)")
+    comando.add_argument('--formato', choices=list(SALIDAS), default='jsonl')
+    comando.add_argument('--camino', action='store_true',
+                         help="Incluye el camino completo en cada resultado")
+    comando.add_argument('--salida', help="Archivo de salida (por defecto, stdout)")
+    return parser
+
+
+def main(argumentos=None):
+    parser = crear_parser()
+    opciones = parser.parse_args(argumentos)
+    if opciones.procesos == 0:
+        opciones.procesos = None
+
+    salida = sys.stdout
+    try:
+        if opciones.salida:
+            salida = open(opciones.salida, 'w', encoding='utf-8', newline='')
+        resolver(opciones, salida)
+    except BrokenPipeError:
+        # La salida se cerró antes de tiempo (por ejemplo, '| head')
+        sys.stderr.close()
+    except (OSError, ValueError) as error:
+        parser.exit(2, f"{parser.prog}: error: {error}\n")
+    finally:
+        if salida is not sys.stdout:
+            salida.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,356 @@
+"""
+Benchmark con mapas y escenarios de MovingAI
+
+Carga los formatos estándar del benchmark de pathfinding de MovingAI
+(https://movingai.com/benchmarks/) y ejecuta sus escenarios con cada
+combinación de motor y heurística:
+
+    .map   type octile / height H / width W / map / H filas de W caracteres
+    .scen  version 1 / cubeta  mapa  ancho  alto  x0  y0  x1  y1  costo_optimo
+
+En los .map son transitables '.', 'G' y 'S'; cualquier otro carácter
+('@', 'O', 'T', 'W', ...) es obstáculo. Las coordenadas de los escenarios
+son (x, y) = (columna, fila).
+
+Los costos de referencia de MovingAI son octiles (recto 1, diagonal raíz
+de 2) sin cortar esquinas, la misma regla de puede_moverse_diagonal, así
+que la BRECHA de optimalidad (costo / costo_optimo - 1) es 0 para un
+motor óptimo con heurística admisible.
+
+Por combinación se informa: expansiones, tiempo de reloj, memoria pico
+(tracemalloc, en una segunda ejecución para no distorsionar el tiempo) y
+brecha media y máxima.
+
+NÚMERO REPRODUCIBLE:
+'huella' es la suma de expansiones de toda la ejecución. No depende de la
+máquina ni de la carga (el tiempo sí), así que dos versiones con los
+mismos archivos y opciones solo dan la misma huella si exploran igual.
+
+Uso:
+    python benchmark.py arena.map.scen --motores arreglos jps --limite 200
+"""
+import argparse
+import json
+import math
+import os
+import time
+import tracemalloc
+
+from algoritmo_astar import AlgoritmoAStar
+from busqueda_jps import precalcular_saltos
+from mascara_vecinos import MascaraVecinos
+
+# Costos con los que MovingAI calcula costo_optimo
+CONFIG_MOVINGAI = {'horizontal': 1.0, 'vertical': 1.0, 'diagonal': math.sqrt(2)}
+
+# Caracteres transitables en los .map
+TRANSITABLES = frozenset('.GS')
+
+MOTORES_BENCHMARK = ('diccionarios', 'arreglos', 'bidireccional', 'jps', 'jps+')
+HEURISTICAS_BENCHMARK = ('octile', 'euclidiana', 'chebyshev', 'manhattan')
+
+# Diferencia de costo que no cuenta como brecha (los .scen traen 8 decimales)
+TOLERANCIA_COSTO = 1e-6
+
+
+# ===== CARGA DE ARCHIVOS =====
+
+def cargar_mapa(ruta):
+    """
+    Lee un archivo .map de MovingAI
+
+    Args:
+        ruta: Ruta del archivo
+
+    Returns:
+        tuple: (filas, columnas, obstaculos) con obstaculos un set de
+               tuplas (fila, col), como los recibe AlgoritmoAStar
+    """
+    with open(ruta, encoding='ascii') as archivo:
+        lineas = archivo.read().splitlines()
+
+    cabecera = {}
+    for numero, linea in enumerate(lineas):
+        partes = linea.split()
+        if partes == ['map']:
+            inicio_celdas = numero + 1
+            break
+        if len(partes) == 2:
+            cabecera[partes[0]] = partes[1]
+    else:
+        raise ValueError(f"{ruta}: falta la línea 'map'")
+
+    try:
+        filas = int(cabecera['height'])
+        columnas = int(cabecera['width'])
+    except (KeyError, ValueError):
+        raise ValueError(f"{ruta}: cabecera sin height/width válidos") from None
+
+    celdas = lineas[inicio_celdas:inicio_celdas + filas]
+    if len(celdas) < filas or any(len(fila) < columnas for fila in celdas):
+        raise ValueError(f"{ruta}: el mapa no tiene {filas}x{columnas} celdas")
+
+    obstaculos = {
+        (fila, col)
+        for fila, texto in enumerate(celdas)
+        for col, caracter in enumerate(texto[:columnas])
+        if caracter not in TRANSITABLES
+    }
+    return filas, columnas, obstaculos
+
+
+def cargar_escenarios(ruta):
+    """
+    Lee un archivo .scen de MovingAI (version 1)
+
+    Args:
+        ruta: Ruta del archivo
+
+    Returns:
+        list: Un dict por escenario con cubeta, mapa, filas, columnas,
+              inicio, fin (tuplas (fila, col)) y costo_optimo
+    """
+    escenarios = []
+    with open(ruta, encoding='ascii') as archivo:
+        for numero, linea in enumerate(archivo, 1):
+            partes = linea.split()
+            if not partes or partes[0] == 'version':
+                continue
+            if len(partes) != 9:
+                raise ValueError(f"{ruta}:{numero}: se esperaban 9 campos")
+            cubeta, mapa, ancho, alto, x0, y0, x1, y1 = partes[:8]
+            escenarios.append({
+                'cubeta': int(cubeta),
+                'mapa': mapa,
+                'filas': int(alto),
+                'columnas': int(ancho),
+                'inicio': (int(y0), int(x0)),
+                'fin': (int(y1), int(x1)),
+                'costo_optimo': float(partes[8])
+            })
+    return escenarios
+
+
+def _ruta_mapa(nombre, ruta_escenarios, directorio_mapas):
+    """Busca el .map de un escenario (ruta relativa o solo el nombre)"""
+    base = directorio_mapas or os.path.dirname(ruta_escenarios)
+    candidatos = [os.path.join(base, nombre),
+                  os.path.join(base, os.path.basename(nombre))]
+    for candidato in candidatos:
+        if os.path.exists(candidato):
+            return candidato
+    raise FileNotFoundError(f"No se encontró el mapa {nombre!r} (buscado en {base})")
+
+
+# ===== EJECUCIÓN =====
+
+def preparar_mapa(filas, columnas, obstaculos, con_saltos=False):
+    """
+    Preprocesa un mapa una sola vez para todos sus escenarios
+
+    La máscara de vecinos (y la tabla de JPS+) se comparte entre consultas,
+    así que su construcción no cuenta en el tiempo de ninguna búsqueda.
+
+    Returns:
+        dict: filas, columnas, obstaculos, mascara y tabla_saltos (None si
+              no se pidió)
+    """
+    mascara = MascaraVecinos(filas, columnas, obstaculos)
+    mascara.precalcular()
+    return {
+        'filas': filas,
+        'columnas': columnas,
+        'obstaculos': obstaculos,
+        'mascara': mascara,
+        'tabla_saltos': precalcular_saltos(filas, columnas, obstaculos) if con_saltos else None
+    }
+
+
+def ejecutar_escenario(escenario, mapa, motor, tipo_heuristica, medir_memoria=True):
+    """
+    Resuelve un escenario y mide la búsqueda
+
+    Args:
+        escenario: Dict de cargar_escenarios
+        mapa: Dict de preparar_mapa
+        motor: Motor de AlgoritmoAStar
+        tipo_heuristica: Heurística a usar
+        medir_memoria: Si True, repite la búsqueda con tracemalloc
+
+    Returns:
+        dict: exito, costo, expansiones, segundos, memoria_pico (bytes o
+              None) y brecha (None si no hubo camino)
+    """
+    opciones = {'mascara': mapa['mascara']}
+    if motor == 'jps+':
+        opciones['tabla_saltos'] = mapa['tabla_saltos']
+
+    def resolver():
+        algoritmo = AlgoritmoAStar(
+            escenario['inicio'], escenario['fin'], mapa['filas'], mapa['columnas'],
+            mapa['obstaculos'], CONFIG_MOVINGAI, True, tipo_heuristica,
+            motor=motor, **opciones
+        )
+        exito, _, nodos, _ = algoritmo.ejecutar_completo()
+        return exito, nodos, algoritmo.obtener_estadisticas()['costo_g_objetivo']
+
+    inicio = time.perf_counter()
+    exito, expansiones, costo = resolver()
+    segundos = time.perf_counter() - inicio
+
+    memoria_pico = None
+    if medir_memoria:
+        tracemalloc.start()
+        try:
+            resolver()
+            memoria_pico = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    brecha = None
+    if exito:
+        optimo = escenario['costo_optimo']
+        brecha = 0.0
+        if abs(costo - optimo) > TOLERANCIA_COSTO and optimo > 0:
+            brecha = costo / optimo - 1
+    return {
+        'exito': exito,
+        'costo': costo if exito else None,
+        'expansiones': expansiones,
+        'segundos': segundos,
+        'memoria_pico': memoria_pico,
+        'brecha': brecha
+    }
+
+
+def ejecutar_benchmark(rutas_escenarios, motores=MOTORES_BENCHMARK,
+                       heuristicas=HEURISTICAS_BENCHMARK, directorio_mapas=None,
+                       limite=None, medir_memoria=True):
+    """
+    Ejecuta los escenarios con cada combinación de motor y heurística
+
+    Args:
+        rutas_escenarios: Lista de archivos .scen
+        motores: Motores de AlgoritmoAStar a comparar
+        heuristicas: Heurísticas a comparar
+        directorio_mapas: Dónde buscar los .map (por defecto, junto a cada .scen)
+        limite: Máximo de escenarios por archivo .scen (los primeros)
+        medir_memoria: Si True, mide la memoria pico de cada búsqueda
+
+    Returns:
+        tuple: (resultados, resumen). resultados es una lista de dicts por
+               (escenario, motor, heurística); resumen agrupa por
+               (motor, heurística) e incluye la huella total
+    """
+    mapas = {}
+    resultados = []
+    for ruta_escenarios in rutas_escenarios:
+        escenarios = cargar_escenarios(ruta_escenarios)[:limite]
+        for numero, escenario in enumerate(escenarios):
+            ruta = _ruta_mapa(escenario['mapa'], ruta_escenarios, directorio_mapas)
+            if ruta not in mapas:
+                mapas[ruta] = preparar_mapa(*cargar_mapa(ruta),
+                                            con_saltos='jps+' in motores)
+            mapa = mapas[ruta]
+            if (escenario['filas'], escenario['columnas']) != (mapa['filas'], mapa['columnas']):
+                raise ValueError(
+                    f"{ruta_escenarios}: el escenario {numero} es de "
+                    f"{escenario['filas']}x{escenario['columnas']} y el mapa de "
+                    f"{mapa['filas']}x{mapa['columnas']}"
+                )
+            for motor in motores:
+                for tipo_heuristica in heuristicas:
+                    resultado = ejecutar_escenario(escenario, mapa, motor,
+                                                   tipo_heuristica, medir_memoria)
+                    resultado.update({
+                        'escenarios': os.path.basename(ruta_escenarios),
+                        'numero': numero,
+                        'cubeta': escenario['cubeta'],
+                        'costo_optimo': escenario['costo_optimo'],
+                        'motor': motor,
+                        'heuristica': tipo_heuristica
+                    })
+                    resultados.append(resultado)
+    return resultados, resumir(resultados)
+
+
+def resumir(resultados):
+    """
+    Agrupa resultados por (motor, heurística)
+
+    Returns:
+        dict: {'combinaciones': [...], 'huella': suma de expansiones}
+    """
+    grupos = {}
+    for resultado in resultados:
+        grupos.setdefault((resultado['motor'], resultado['heuristica']), []).append(resultado)
+
+    combinaciones = []
+    for (motor, tipo_heuristica), grupo in grupos.items():
+        brechas = [r['brecha'] for r in grupo if r['brecha'] is not None]
+        memorias = [r['memoria_pico'] for r in grupo if r['memoria_pico'] is not None]
+        combinaciones.append({
+            'motor': motor,
+            'heuristica': tipo_heuristica,
+            'escenarios': len(grupo),
+            'resueltos': sum(r['exito'] for r in grupo),
+            'expansiones': sum(r['expansiones'] for r in grupo),
+            'segundos': sum(r['segundos'] for r in grupo),
+            'memoria_pico': max(memorias) if memorias else None,
+            'brecha_media': sum(brechas) / len(brechas) if brechas else None,
+            'brecha_maxima': max(brechas) if brechas else None,
+            'suboptimos': sum(brecha > 0 for brecha in brechas)
+        })
+    return {
+        'combinaciones': combinaciones,
+        'huella': sum(r['expansiones'] for r in resultados)
+    }
+
+
+# ===== SALIDA =====
+
+def formatear_resumen(resumen):
+    """Tabla de texto con el resumen"""
+    lineas = [
+        f"{'motor':<14}{'heurística':<12}{'resueltos':>11}{'expansiones':>14}"
+        f"{'segundos':>11}{'memoria KiB':>13}{'brecha media':>14}{'brecha máx':>12}"
+    ]
+    for c in resumen['combinaciones']:
+        memoria = '-' if c['memoria_pico'] is None else f"{c['memoria_pico'] / 1024:.0f}"
+        media = '-' if c['brecha_media'] is None else f"{c['brecha_media']:.4%}"
+        maxima = '-' if c['brecha_maxima'] is None else f"{c['brecha_maxima']:.4%}"
+        lineas.append(
+            f"{c['motor']:<14}{c['heuristica']:<12}"
+            f"{c['resueltos']:>5}/{c['escenarios']:<5}{c['expansiones']:>14}"
+            f"{c['segundos']:>11.3f}{memoria:>13}{media:>14}{maxima:>12}"
+        )
+    lineas.append(f"huella (expansiones totales): {resumen['huella']}")
+    return '\n'.join(lineas)
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Benchmark con escenarios de MovingAI")
+    parser.add_argument('escenarios', nargs='+', help="Archivos .scen")
+    parser.add_argument('--mapas', help="Directorio de los .map")
+    parser.add_argument('--motores', nargs='+', default=list(MOTORES_BENCHMARK))
+    parser.add_argument('--heuristicas', nargs='+', default=list(HEURISTICAS_BENCHMARK))
+    parser.add_argument('--limite', type=int, help="Escenarios por archivo .scen")
+    parser.add_argument('--sin-memoria', action='store_true',
+                        help="No medir memoria pico (más rápido)")
+    parser.add_argument('--json', help="Escribe cada resultado como JSON lines")
+    opciones = parser.parse_args(argumentos)
+
+    resultados, resumen = ejecutar_benchmark(
+        opciones.escenarios, opciones.motores, opciones.heuristicas,
+        opciones.mapas, opciones.limite, not opciones.sin_memoria
+    )
+    if opciones.json:
+        with open(opciones.json, 'w', encoding='utf-8') as salida:
+            for resultado in resultados:
+                salida.write(json.dumps(resultado, ensure_ascii=False) + '\n')
+    print(formatear_resumen(resumen))
+    return resumen
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,304 @@
+"""
+A* anytime (ARA*: Anytime Repairing A*)
+
+Empieza con la heurística inflada por un peso epsilon > 1:
+    F = G + epsilon * H
+Con H admisible, el primer camino cuesta como máximo epsilon veces el
+óptimo y se encuentra expandiendo muchos menos nodos. Después epsilon
+baja paso a paso y cada iteración MEJORA el camino reutilizando los
+costos G de las anteriores:
+
+- Un nodo que mejora su G después de cerrarse en la iteración actual no
+  vuelve a la frontera: pasa a la lista de INCONSISTENTES.
+- Al empezar la siguiente iteración, frontera + inconsistentes se reordenan
+  con el nuevo epsilon y el conjunto cerrado se vacía.
+
+COTA DE SUBOPTIMALIDAD:
+Ningún camino cuesta menos que min(G + H) sobre frontera e inconsistentes,
+así que el camino actual cuesta como máximo
+    cota = min(epsilon, G(fin) / min(G + H))
+veces el óptimo. La búsqueda termina al llegar a cota 1 (camino óptimo) o
+al agotar el presupuesto de tiempo o de expansiones; en ese caso devuelve
+el mejor camino encontrado hasta el momento.
+
+Uso:
+    algoritmo = AlgoritmoAStar(inicio, fin, filas, columnas, obstaculos,
+                               config_costos, motor='ara', peso_inicial=3.0,
+                               presupuesto_tiempo=0.05)
+    exito, camino, nodos, costos = algoritmo.ejecutar_completo()
+    print(algoritmo.cota)
+"""
+import time
+
+from algoritmo_astar import AlgoritmoAStar
+from funciones_astar import calcular_peso_movimiento
+
+INFINITO = float('inf')
+
+
+class AlgoritmoARAStar(AlgoritmoAStar):
+    """
+    A* anytime con peso decreciente (ARA*).
+
+    Se obtiene con AlgoritmoAStar(..., motor='ara'). ejecutar_paso expande un
+    nodo por llamada (encontrado=True solo cuando la búsqueda TERMINA con un
+    camino); cada camino intermedio queda en self.soluciones.
+    costo_f guarda la prioridad inflada G + epsilon * H.
+    """
+
+    def __init__(self, inicio, fin, filas, columnas, obstaculos,
+                 config_costos, permitir_diagonal=False, tipo_heuristica='manhattan',
+                 motor='ara', cola='heapq', mascara=None, campos=None,
+                 tabla_alt=None, componentes=None, peso_inicial=2.5,
+                 decremento=0.5, presupuesto_tiempo=None,
+                 presupuesto_expansiones=None):
+        """
+        Args:
+            (los de AlgoritmoAStar, más:)
+            peso_inicial: Epsilon de la primera iteración (>= 1)
+            decremento: Cuánto baja epsilon entre iteraciones (> 0)
+            presupuesto_tiempo: Segundos de reloj desde el primer paso
+                                (None = sin límite)
+            presupuesto_expansiones: Máximo de nodos expandidos en total
+                                     (None = sin límite)
+        """
+        if peso_inicial < 1:
+            raise ValueError("peso_inicial debe ser al menos 1")
+        if decremento <= 0:
+            raise ValueError("decremento debe ser positivo")
+
+        self.epsilon = float(peso_inicial)
+        self.decremento = decremento
+        self.presupuesto_tiempo = presupuesto_tiempo
+        self.presupuesto_expansiones = presupuesto_expansiones
+
+        self.abiertos = set()          # Nodos en la frontera de esta iteración
+        self.inconsistentes = set()    # Mejorados después de cerrarse
+        self.cota = INFINITO           # Cota de suboptimalidad del mejor camino
+        self.soluciones = []           # (epsilon, cota, costo, camino, segundos)
+        self.iteraciones = 1
+        self.terminado = False
+        self.motivo_fin = None         # 'optimo', 'tiempo', 'expansiones', 'sin_camino'
+        self._reloj_inicio = None
+
+        super().__init__(inicio, fin, filas, columnas, obstaculos,
+                         config_costos, permitir_diagonal, tipo_heuristica,
+                         motor=motor, cola=cola, mascara=mascara, campos=campos,
+                         tabla_alt=tabla_alt, componentes=componentes)
+
+    def inicializar(self):
+        """Inicializa el inicio con la prioridad inflada"""
+        self.costo_g[self.inicio] = 0
+        self.costo_h[self.inicio] = self.heuristica(self.inicio)
+        self._abrir(self.inicio)
+
+    def _vaciar_frontera(self):
+        super()._vaciar_frontera()
+        self.abiertos.clear()
+
+    # ===== UTILIDADES =====
+
+    def _abrir(self, nodo):
+        """Agrega o mejora un nodo en la frontera con F = G + epsilon * H"""
+        self.costo_f[nodo] = self.costo_g[nodo] + self.epsilon * self.costo_h[nodo]
+        self.frontera.insertar(nodo, self.costo_f[nodo], self.contador)
+        self.contador += 1
+        self.abiertos.add(nodo)
+
+    def _descartar_obsoletos(self):
+        """Quita de la cima las entradas de nodos que ya salieron de la frontera"""
+        frontera = self.frontera
+        while frontera and frontera.tope()[2] not in self.abiertos:
+            frontera.extraer()
+            self.extracciones_obsoletas += 1
+
+    def _presupuesto_agotado(self):
+        if (self.presupuesto_expansiones is not None
+                and self.nodos_explorados >= self.presupuesto_expansiones):
+            return 'expansiones'
+        if (self.presupuesto_tiempo is not None
+                and time.perf_counter() - self._reloj_inicio >= self.presupuesto_tiempo):
+            return 'tiempo'
+        return None
+
+    def _cota_inferior(self):
+        """min(G + H) sobre frontera e inconsistentes: ningún camino cuesta menos"""
+        costo_g, costo_h = self.costo_g, self.costo_h
+        return min((costo_g[nodo] + costo_h[nodo]
+                    for nodo in self.abiertos | self.inconsistentes),
+                   default=INFINITO)
+
+    # ===== ITERACIONES =====
+
+    def _publicar(self, iteracion_completa):
+        """
+        Registra el camino actual si mejora al anterior
+
+        Args:
+            iteracion_completa: True si la iteración de este epsilon terminó
+                                (su camino ya cumple la cota epsilon)
+        """
+        costo = self.costo_g.get(self.fin, INFINITO)
+        if costo == INFINITO:
+            return
+
+        cota = self.cota
+        if iteracion_completa:
+            cota = min(cota, self.epsilon)
+        inferior = self._cota_inferior()
+        if costo <= inferior:
+            cota = 1.0
+        elif inferior > 0:
+            cota = min(cota, costo / inferior)
+        cota = max(cota, 1.0)
+
+        anterior = self.soluciones[-1] if self.soluciones else None
+        if anterior is None or costo < anterior[2] or cota < anterior[1]:
+            camino = self.reconstruir()
+            segundos = time.perf_counter() - self._reloj_inicio
+            self.soluciones.append((self.epsilon, cota, costo, camino, segundos))
+        self.cota = cota
+
+    def _siguiente_iteracion(self):
+        """Baja epsilon y reordena frontera + inconsistentes; vacía el cerrado"""
+        self.epsilon = max(1.0, self.epsilon - self.decremento)
+        pendientes = self.abiertos | self.inconsistentes
+        self.abiertos = set()
+        self.inconsistentes = set()
+        self.cerrado = set()
+        self.frontera = self._crear_cola()
+        for nodo in pendientes:
+            self._abrir(nodo)
+        self.iteraciones += 1
+
+    def _terminar(self, motivo):
+        if not self.terminado:
+            self.terminado = True
+            self.motivo_fin = motivo
+            if motivo != 'optimo':
+                self._publicar(iteracion_completa=False)
+        if self.soluciones:
+            return self.fin, [], True
+        return None, [], False
+
+    # ===== BÚSQUEDA =====
+
+    def ejecutar_paso(self):
+        """
+        Ejecuta UN PASO de ARA*: expande un nodo de la iteración actual
+
+        Cuando la iteración termina (G(fin) <= menor F de la frontera) publica
+        el camino y, si la cota aún es mayor que 1, empieza la siguiente.
+
+        Returns:
+            tuple: (nodo_actual, lista_vecinos_explorados, encontrado)
+                   encontrado es True cuando la búsqueda terminó con camino;
+                   (None, [], False) si terminó sin camino
+        """
+        if self.terminado:
+            return self._terminar(self.motivo_fin)
+        if self._reloj_inicio is None:
+            self._reloj_inicio = time.perf_counter()
+
+        while True:
+            motivo = self._presupuesto_agotado()
+            if motivo:
+                return self._terminar(motivo)
+
+            self._descartar_obsoletos()
+            costo_fin = self.costo_g.get(self.fin, INFINITO)
+            if self.frontera and self.frontera.tope()[0] < costo_fin:
+                break
+
+            # La iteración de este epsilon terminó
+            if costo_fin == INFINITO:
+                return self._terminar('sin_camino')
+            self._publicar(iteracion_completa=True)
+            if self.cota <= 1.0:
+                return self._terminar('optimo')
+            self._siguiente_iteracion()
+
+        _, _, actual = self.frontera.extraer()
+        self.abiertos.discard(actual)
+        self.cerrado.add(actual)
+        self.nodos_explorados += 1
+
+        vecinos_explorados = []
+        g_actual = self.costo_g[actual]
+        for vecino in self.mascara.vecinos(actual, self.permitir_diagonal):
+            nuevo_costo_g = g_actual + calcular_peso_movimiento(
+                actual, vecino, self.config_costos
+            )
+            if nuevo_costo_g >= self.costo_g.get(vecino, INFINITO):
+                continue
+
+            self.costo_g[vecino] = nuevo_costo_g
+            self.vino_de[vecino] = actual
+            if vecino not in self.costo_h:
+                self.costo_h[vecino] = self.heuristica(vecino)
+            if vecino in self.cerrado:
+                # Ya cerrado en esta iteración: se reordena en la siguiente
+                self.inconsistentes.add(vecino)
+            else:
+                self._abrir(vecino)
+            vecinos_explorados.append(vecino)
+            self.vecinos_totales_evaluados += 1
+
+        return actual, vecinos_explorados, False
+
+    def iterar_soluciones(self):
+        """
+        Generador de caminos cada vez mejores
+
+        Yields:
+            tuple: (cota, costo, camino) cada vez que se publica un camino;
+                   termina cuando la búsqueda termina
+        """
+        publicadas = len(self.soluciones)
+        while not self.terminado:
+            self.ejecutar_paso()
+            while publicadas < len(self.soluciones):
+                _, cota, costo, camino, _ = self.soluciones[publicadas]
+                publicadas += 1
+                yield cota, costo, list(camino)
+
+    def ejecutar_completo(self):
+        """
+        Mejora el camino hasta la cota 1 o hasta agotar el presupuesto
+
+        Returns:
+            tuple: (exito, camino, nodos_explorados, costos) con el mejor
+                   camino encontrado
+        """
+        for _ in self.iterar_soluciones():
+            pass
+        if not self.soluciones:
+            return False, [], self.nodos_explorados, {}
+        costos = {
+            'g': self.costo_g,
+            'h': self.costo_h,
+            'f': self.costo_f
+        }
+        return True, list(self.soluciones[-1][3]), self.nodos_explorados, costos
+
+    def obtener_estadisticas(self):
+        """
+        Obtiene estadísticas del estado actual del algoritmo
+
+        Returns:
+            dict: Diccionario con estadísticas (las de AlgoritmoAStar más las
+                  de las iteraciones anytime)
+        """
+        estadisticas = super().obtener_estadisticas()
+        if self.soluciones:
+            # Costo del camino publicado, no del G(fin) de una iteración a medias
+            estadisticas['costo_g_objetivo'] = self.soluciones[-1][2]
+        estadisticas.update({
+            'epsilon': self.epsilon,
+            'cota_suboptimalidad': self.cota if self.soluciones else None,
+            'iteraciones': self.iteraciones,
+            'soluciones': len(self.soluciones),
+            'inconsistentes': len(self.inconsistentes),
+            'motivo_fin': self.motivo_fin
+        })
+        return estadisticas
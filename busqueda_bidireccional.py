@@ -0,0 +1,223 @@
+"""
+A* bidireccional
+
+Hace crecer dos fronteras: una desde el inicio (hacia el fin) y otra desde
+el fin (hacia el inicio). En cada paso se expande la frontera más pequeña.
+
+CONDICIÓN DE PARADA:
+mejor_costo es el menor G_directo(v) + G_inverso(v) visto hasta ahora.
+Cualquier camino que aún no se conoce pasa por un nodo abierto de CADA
+frontera, así que cuesta al menos max(F_min_directa, F_min_inversa).
+Cuando mejor_costo <= ese máximo el camino encontrado es óptimo
+(con heurísticas admisibles y consistentes, igual que AlgoritmoAStar).
+
+Como los movimientos de la cuadrícula son simétricos (mismos costos y misma
+regla diagonal en ambos sentidos), la búsqueda inversa usa la misma
+máscara de vecinos que la directa.
+"""
+from algoritmo_astar import AlgoritmoAStar
+from colas_prioridad import crear_cola
+from funciones_astar import (
+    calcular_peso_movimiento,
+    calcular_funcion_costo,
+    reconstruir_camino_bidireccional
+)
+
+INFINITO = float('inf')
+
+
+class AlgoritmoAStarBidireccional(AlgoritmoAStar):
+    """
+    A* bidireccional.
+
+    Se obtiene con AlgoritmoAStar(..., motor='bidireccional'). Las
+    estructuras de la búsqueda directa son las de AlgoritmoAStar
+    (frontera, costo_g, ...); las de la inversa llevan el sufijo _inverso.
+    """
+
+    def __init__(self, inicio, fin, filas, columnas, obstaculos,
+                 config_costos, permitir_diagonal=False, tipo_heuristica='manhattan',
+                 motor='bidireccional', cola='heapq', mascara=None, campos=None,
+                 tabla_alt=None, componentes=None):
+        # Estructuras de la búsqueda inversa (desde el fin)
+        self.frontera_inversa = crear_cola(cola, config_costos)
+        self.vino_de_inverso = {}
+        self.costo_g_inverso = {}
+        self.costo_h_inverso = {}
+        self.costo_f_inverso = {}
+        self.cerrado_inverso = set()
+
+        # Mejor camino conocido que une ambas búsquedas
+        self.mejor_costo = INFINITO
+        self.encuentro = None
+
+        # Estadísticas por sentido
+        self.nodos_explorados_directa = 0
+        self.nodos_explorados_inversa = 0
+
+        super().__init__(inicio, fin, filas, columnas, obstaculos,
+                         config_costos, permitir_diagonal, tipo_heuristica,
+                         motor=motor, cola=cola, mascara=mascara, campos=campos,
+                         tabla_alt=tabla_alt, componentes=componentes)
+
+    def inicializar(self):
+        """Inicializa el inicio en la búsqueda directa y el fin en la inversa"""
+        super().inicializar()
+
+        self.heuristica_inversa = self._heuristica_hacia(self.inicio)
+        self.costo_g_inverso[self.fin] = 0
+        self.costo_h_inverso[self.fin] = self.heuristica_inversa(self.fin)
+        self.costo_f_inverso[self.fin] = self.costo_h_inverso[self.fin]
+        self.frontera_inversa.insertar(self.fin, self.costo_f_inverso[self.fin],
+                                       self.contador)
+        self.contador += 1
+
+        if self.inicio == self.fin:
+            self.mejor_costo = 0
+            self.encuentro = self.inicio
+
+    def _vaciar_frontera(self):
+        super()._vaciar_frontera()
+        self.frontera_inversa = self._crear_cola()
+
+    def _descartar_obsoletos(self, frontera, cerrado):
+        """Quita de la cima del heap los nodos ya cerrados"""
+        while frontera and frontera.tope()[2] in cerrado:
+            frontera.extraer()
+            self.extracciones_obsoletas += 1
+
+    def _expandir(self, directa):
+        """
+        Expande el mejor nodo de una de las dos búsquedas
+
+        Args:
+            directa: True para la búsqueda desde el inicio, False para la inversa
+
+        Returns:
+            tuple: (nodo_actual, vecinos_explorados)
+        """
+        if directa:
+            frontera, cerrado = self.frontera, self.cerrado
+            costo_g, costo_h, costo_f = self.costo_g, self.costo_h, self.costo_f
+            vino_de, heuristica = self.vino_de, self.heuristica
+            costo_g_otro = self.costo_g_inverso
+        else:
+            frontera, cerrado = self.frontera_inversa, self.cerrado_inverso
+            costo_g, costo_h = self.costo_g_inverso, self.costo_h_inverso
+            costo_f, vino_de = self.costo_f_inverso, self.vino_de_inverso
+            heuristica = self.heuristica_inversa
+            costo_g_otro = self.costo_g
+
+        _, _, actual = frontera.extraer()
+        cerrado.add(actual)
+        self.nodos_explorados += 1
+        if directa:
+            self.nodos_explorados_directa += 1
+        else:
+            self.nodos_explorados_inversa += 1
+
+        vecinos_explorados = []
+        for vecino in self.mascara.vecinos(actual, self.permitir_diagonal):
+            if vecino in cerrado:
+                continue
+
+            nuevo_costo_g = costo_g[actual] + calcular_peso_movimiento(
+                actual, vecino, self.config_costos
+            )
+            if vecino in costo_g and nuevo_costo_g >= costo_g[vecino]:
+                continue
+
+            costo_g[vecino] = nuevo_costo_g
+            costo_h[vecino] = heuristica(vecino)
+            costo_f[vecino] = calcular_funcion_costo(nuevo_costo_g, costo_h[vecino])
+            frontera.insertar(vecino, costo_f[vecino], self.contador)
+            self.contador += 1
+            vino_de[vecino] = actual
+            vecinos_explorados.append(vecino)
+            self.vecinos_totales_evaluados += 1
+
+            # ¿Este vecino ya lo alcanzó la otra búsqueda?
+            if vecino in costo_g_otro:
+                costo_total = nuevo_costo_g + costo_g_otro[vecino]
+                if costo_total < self.mejor_costo:
+                    self.mejor_costo = costo_total
+                    self.encuentro = vecino
+
+        return actual, vecinos_explorados
+
+    def ejecutar_paso(self):
+        """
+        Ejecuta UN PASO: expande un nodo de la frontera más pequeña
+
+        Returns:
+            tuple: (nodo_actual, lista_vecinos_explorados, encontrado)
+                   Cuando encontrado es True, nodo_actual es el nodo de encuentro
+        """
+        self._descartar_obsoletos(self.frontera, self.cerrado)
+        self._descartar_obsoletos(self.frontera_inversa, self.cerrado_inverso)
+
+        # Si una frontera se agotó, solo hay camino si ya se conocía uno
+        if not self.frontera or not self.frontera_inversa:
+            if self.encuentro is not None:
+                return self.encuentro, [], True
+            return None, [], False
+
+        # ¿Es óptimo el mejor camino conocido?
+        cota = max(self.frontera.tope()[0], self.frontera_inversa.tope()[0])
+        if self.mejor_costo <= cota:
+            return self.encuentro, [], True
+
+        directa = len(self.frontera) <= len(self.frontera_inversa)
+        actual, vecinos_explorados = self._expandir(directa)
+        return actual, vecinos_explorados, False
+
+    def reconstruir(self):
+        """Camino completo (sin inicio ni fin) a través del nodo de encuentro"""
+        return reconstruir_camino_bidireccional(
+            self.vino_de, self.vino_de_inverso,
+            self.inicio, self.fin, self.encuentro
+        )
+
+    def ejecutar_completo(self):
+        """
+        Ejecuta el algoritmo completo hasta encontrar el camino
+
+        Returns:
+            tuple: (exito, camino, nodos_explorados, costos)
+                   costos incluye 'g_inverso' con los G de la búsqueda inversa
+        """
+        while True:
+            actual, _, encontrado = self.ejecutar_paso()
+
+            if actual is None:
+                return False, [], self.nodos_explorados, {}
+
+            if encontrado:
+                costos = {
+                    'g': self.costo_g,
+                    'h': self.costo_h,
+                    'f': self.costo_f,
+                    'g_inverso': self.costo_g_inverso,
+                    'costo_total': self.mejor_costo
+                }
+                return True, self.reconstruir(), self.nodos_explorados, costos
+
+    def obtener_estadisticas(self):
+        """
+        Obtiene estadísticas del estado actual de ambas búsquedas
+
+        Returns:
+            dict: Diccionario con estadísticas
+        """
+        estadisticas = super().obtener_estadisticas()
+        estadisticas.update({
+            'nodos_en_frontera': len(self.frontera) + len(self.frontera_inversa),
+            'nodos_cerrados': len(self.cerrado) + len(self.cerrado_inverso),
+            'nodos_explorados_directa': self.nodos_explorados_directa,
+            'nodos_explorados_inversa': self.nodos_explorados_inversa,
+            'nodos_en_frontera_inversa': len(self.frontera_inversa),
+            'tamano_maximo_frontera_inversa': self.frontera_inversa.tamano_maximo,
+            'costo_g_objetivo': (self.mejor_costo
+                                 if self.encuentro is not None else None)
+        })
+        return estadisticas
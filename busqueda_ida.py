@@ -0,0 +1,274 @@
+"""
+IDA* con tabla de transposiciones acotada (modo de memoria limitada)
+
+A* guarda G, H y F de cada nodo visitado y una frontera con duplicados;
+en mapas muy grandes eso es lo que agota la memoria. IDA* hace búsquedas
+en profundidad con un umbral de F creciente:
+
+1. umbral = H(inicio)
+2. DFS desde el inicio sin pasar de F = G + H > umbral
+3. Si no se llegó al fin, umbral = menor F que se pasó del umbral y se repite
+
+Con H admisible el primer camino encontrado es óptimo.
+
+MEMORIA:
+Solo se guarda la rama actual de la DFS (con sus hasta 8 hijos por nivel)
+y una TABLA DE TRANSPOSICIONES {índice: menor G visto en esta iteración}
+con capacidad fija. La tabla evita reexplorar una celda a la que ya se
+llegó igual de barato por otra rama; cuando se llena, las celdas nuevas
+simplemente no se registran (se pierde poda, no corrección). El techo de
+memoria es O(profundidad + capacidad_tabla), independiente del mapa, a
+cambio de más expansiones que A*. Sin mascara= los vecinos se calculan al
+vuelo sobre los obstáculos (MascaraPerezosa con memorizar=False): una
+MascaraVecinos compartida reservaría 3 bytes por celda y la memoria de
+máscaras crecería con cada celda visitada.
+"""
+from algoritmo_astar import AlgoritmoAStar
+from mascara_vecinos import MascaraPerezosa
+
+INFINITO = float('inf')
+
+# Margen para comparar F con el umbral (ruido de punto flotante)
+TOLERANCIA = 1e-9
+
+
+class AlgoritmoIDAStar(AlgoritmoAStar):
+    """
+    IDA* sobre índices planos con tabla de transposiciones acotada.
+
+    Se obtiene con AlgoritmoAStar(..., motor='ida'). ejecutar_paso visita un
+    nodo de la DFS por llamada. No hay frontera ni conjunto cerrado: al
+    terminar, costo_g / costo_h / costo_f y vino_de solo contienen los
+    nodos del camino.
+    """
+
+    def __init__(self, inicio, fin, filas, columnas, obstaculos,
+                 config_costos, permitir_diagonal=False, tipo_heuristica='manhattan',
+                 motor='ida', cola='heapq', mascara=None, campos=None,
+                 tabla_alt=None, componentes=None, capacidad_tabla=1 << 18):
+        """
+        Args:
+            (los de AlgoritmoAStar, más:)
+            capacidad_tabla: Máximo de celdas en la tabla de transposiciones
+                             (0 la desactiva)
+        """
+        if capacidad_tabla < 0:
+            raise ValueError("capacidad_tabla no puede ser negativa")
+        self.capacidad_tabla = capacidad_tabla
+
+        self.umbral = None
+        self.iteraciones = 0
+        self.terminado = False
+        self.transposiciones = 0           # Ramas podadas por la tabla
+        self.profundidad_maxima = 0
+        self.tabla_llena = 0               # Celdas que no cupieron en la tabla
+
+        # Sin memoria de máscaras: crecería con cada celda visitada
+        if mascara is None:
+            mascara = MascaraPerezosa(filas, columnas, obstaculos, memorizar=False)
+        super().__init__(inicio, fin, filas, columnas, obstaculos,
+                         config_costos, permitir_diagonal, tipo_heuristica,
+                         motor=motor, cola=cola, mascara=mascara, campos=campos,
+                         tabla_alt=tabla_alt, componentes=componentes)
+
+    def inicializar(self):
+        """Prepara la primera iteración con umbral H(inicio)"""
+        columnas = self.columnas
+        self._movimientos = self.mascara.tabla_movimientos(self.config_costos,
+                                                           self.permitir_diagonal)
+        self._heuristica_indice = self._heuristica_hacia(self.fin, indices=True)
+        self._indice_inicio = self.inicio[0] * columnas + self.inicio[1]
+        self._indice_fin = self.fin[0] * columnas + self.fin[1]
+
+        self._pila = []               # Marcos [indice, g, hijos, siguiente_hijo]
+        self._en_rama = set()         # Índices de la rama actual (evita ciclos)
+        self._tabla = {}              # Tabla de transposiciones: indice -> G
+        self._siguiente_umbral = INFINITO
+        self._g_fin = None
+        self.umbral = self._heuristica_indice(self._indice_inicio)
+
+    def _vaciar_frontera(self):
+        # Sin frontera: la búsqueda ya termina sin camino
+        self.terminado = True
+
+    # ===== DFS =====
+
+    def _hijos(self, indice, g):
+        """Hijos (F, indice, G) ordenados por F: el fin se alcanza antes"""
+        heuristica = self._heuristica_indice
+        hijos = []
+        for delta, peso in self._movimientos[self.mascara.mascara(indice)]:
+            vecino = indice + delta
+            g_vecino = g + peso
+            hijos.append((g_vecino + heuristica(vecino), vecino, g_vecino))
+        hijos.sort()
+        return hijos
+
+    def _visitar(self, indice, g):
+        """Abre un nodo: lo registra en la rama y prepara sus hijos"""
+        self.nodos_explorados += 1
+        if indice == self._indice_fin:
+            self._g_fin = g
+            return True, []
+        hijos = self._hijos(indice, g)
+        self._pila.append([indice, g, hijos, 0])
+        self._en_rama.add(indice)
+        if len(self._pila) > self.profundidad_maxima:
+            self.profundidad_maxima = len(self._pila)
+        self.vecinos_totales_evaluados += len(hijos)
+        return False, [vecino for _, vecino, _ in hijos]
+
+    def _registrar(self, indice, g):
+        """
+        Consulta y actualiza la tabla de transposiciones
+
+        Returns:
+            bool: True si la celda ya se visitó en esta iteración con G <= g
+        """
+        tabla = self._tabla
+        anterior = tabla.get(indice)
+        if anterior is not None and anterior <= g + TOLERANCIA:
+            self.transposiciones += 1
+            return True
+        if anterior is not None or len(tabla) < self.capacidad_tabla:
+            tabla[indice] = g
+        else:
+            self.tabla_llena += 1
+        return False
+
+    def _nueva_iteracion(self):
+        """Reinicia la DFS desde el inicio con el siguiente umbral"""
+        if self.iteraciones:
+            self.umbral = self._siguiente_umbral
+        self._siguiente_umbral = INFINITO
+        self._tabla.clear()
+        self.iteraciones += 1
+        self._registrar(self._indice_inicio, 0.0)
+        return self._visitar(self._indice_inicio, 0.0)
+
+    def _paso_indices(self):
+        """
+        Visita el siguiente nodo de la DFS
+
+        Returns:
+            tuple: (indice_actual, indices_hijos, encontrado)
+                   indice_actual es -1 si no hay camino
+        """
+        pila = self._pila
+        while True:
+            if not pila:
+                if self.iteraciones and self._siguiente_umbral == INFINITO:
+                    self.terminado = True
+                    return -1, [], False
+                encontrado, hijos = self._nueva_iteracion()
+                return self._indice_inicio, hijos, encontrado
+
+            marco = pila[-1]
+            indice, g, hijos, siguiente = marco
+            if siguiente == len(hijos):
+                pila.pop()
+                self._en_rama.discard(indice)
+                continue
+            marco[3] = siguiente + 1
+
+            f_hijo, hijo, g_hijo = hijos[siguiente]
+            if hijo in self._en_rama:
+                continue
+            if f_hijo > self.umbral + TOLERANCIA:
+                if f_hijo < self._siguiente_umbral:
+                    self._siguiente_umbral = f_hijo
+                continue
+            if self._registrar(hijo, g_hijo):
+                continue
+
+            encontrado, nietos = self._visitar(hijo, g_hijo)
+            return hijo, nietos, encontrado
+
+    def _guardar_camino(self, g_fin):
+        """Deja en costo_g / vino_de solo la rama que llegó al fin"""
+        columnas = self.columnas
+        rama = [(divmod(indice, columnas), g) for indice, g, _, _ in self._pila]
+        rama.append((self.fin, g_fin))
+        self.costo_g.clear()
+        self.costo_h.clear()
+        self.costo_f.clear()
+        self.vino_de.clear()
+        anterior = None
+        for nodo, g in rama:
+            self.costo_g[nodo] = g
+            self.costo_h[nodo] = self.heuristica(nodo)
+            self.costo_f[nodo] = g + self.costo_h[nodo]
+            if anterior is not None:
+                self.vino_de[nodo] = anterior
+            anterior = nodo
+        self.terminado = True
+
+    # ===== CONTRATO DE AlgoritmoAStar =====
+
+    def ejecutar_paso(self):
+        """
+        Ejecuta UN PASO de IDA*: visita un nodo (mismo contrato que AlgoritmoAStar)
+
+        Returns:
+            tuple: (nodo_actual, lista_vecinos_explorados, encontrado)
+        """
+        if self.terminado:
+            if self.fin in self.costo_g:
+                return self.fin, [], True
+            return None, [], False
+
+        actual, hijos, encontrado = self._paso_indices()
+        if actual < 0:
+            return None, [], False
+        columnas = self.columnas
+        if encontrado:
+            self._guardar_camino(self._g_fin)
+        return (divmod(actual, columnas),
+                [divmod(hijo, columnas) for hijo in hijos],
+                encontrado)
+
+    def reconstruir(self):
+        """Camino de la rama que llegó al fin, sin inicio ni fin"""
+        return [divmod(indice, self.columnas) for indice, _, _, _ in self._pila[1:]]
+
+    def ejecutar_completo(self):
+        """
+        Ejecuta IDA* hasta encontrar el camino o agotar los umbrales
+
+        Returns:
+            tuple: (exito, camino, nodos_explorados, costos)
+                   costos solo contiene los nodos del camino
+        """
+        while True:
+            actual, _, encontrado = self.ejecutar_paso()
+            if actual is None:
+                return False, [], self.nodos_explorados, {}
+            if encontrado:
+                camino = self.reconstruir()
+                costos = {
+                    'g': self.costo_g,
+                    'h': self.costo_h,
+                    'f': self.costo_f
+                }
+                return True, camino, self.nodos_explorados, costos
+
+    def obtener_estadisticas(self):
+        """
+        Obtiene estadísticas del estado actual del algoritmo
+
+        Returns:
+            dict: Diccionario con estadísticas (las de AlgoritmoAStar más las
+                  de IDA*)
+        """
+        estadisticas = super().obtener_estadisticas()
+        estadisticas.update({
+            'iteraciones': self.iteraciones,
+            'umbral': self.umbral,
+            'profundidad_actual': len(self._pila),
+            'profundidad_maxima': self.profundidad_maxima,
+            'tamano_tabla': len(self._tabla),
+            'capacidad_tabla': self.capacidad_tabla,
+            'transposiciones': self.transposiciones,
+            'tabla_llena': self.tabla_llena
+        })
+        return estadisticas
@@ -0,0 +1,629 @@
+"""
+Jump Point Search (JPS) y JPS+ para cuadrículas de costo uniforme
+
+JPS evita expandir los caminos simétricos en espacio abierto: desde cada nodo
+"salta" en línea recta o en diagonal hasta encontrar un punto de salto
+(una celda con vecinos forzados, o el objetivo). Solo los puntos de salto
+entran a la frontera, así que en mapas abiertos se expanden muchos menos nodos.
+
+REGLA DIAGONAL:
+Se usa la misma restricción que funciones_astar.puede_moverse_diagonal
+(ambas celdas adyacentes deben estar libres), por lo que el costo del camino
+es el mismo que devuelve AlgoritmoAStar.
+
+JPS+:
+Precalcula, para cada celda y dirección, la distancia al siguiente punto de
+salto y a la siguiente pared. Los saltos rectos pasan a ser consultas O(1);
+el objetivo (que depende de la consulta) se resuelve con comprobaciones O(1)
+sobre las mismas tablas. Precalcularlas cuesta mucho más que una consulta:
+sin tabla_saltos= se reutiliza la de las últimas consultas sobre el mismo
+mapa (mismas dimensiones y obstáculos) y solo se calcula si no hay ninguna.
+
+Requisitos: permitir_diagonal=True y costo horizontal == costo vertical.
+"""
+import zlib
+from array import array
+from collections import OrderedDict
+
+from algoritmo_astar import AlgoritmoAStar
+from funciones_astar import (
+    calcular_funcion_costo,
+    reconstruir_camino
+)
+from mapa_bits import bytes_bloqueados
+from mascara_vecinos import BIT_MOVIMIENTO, MascaraVecinos
+
+# Las 8 direcciones (cambio_fila, cambio_columna) para el nodo inicial
+DIRECCIONES_SALTO = [
+    (0, 1), (1, 0), (0, -1), (-1, 0),
+    (1, 1), (1, -1), (-1, 1), (-1, -1)
+]
+
+
+def _signo(valor):
+    return (valor > 0) - (valor < 0)
+
+
+def validar_config_jps(config_costos, permitir_diagonal):
+    """
+    Verifica que la configuración permita usar JPS sin perder optimalidad
+
+    Raises:
+        ValueError: Si la configuración no es de costo uniforme con diagonales
+    """
+    if not permitir_diagonal:
+        raise ValueError("JPS requiere permitir_diagonal=True")
+    if config_costos['horizontal'] != config_costos['vertical']:
+        raise ValueError(
+            "JPS requiere costo horizontal igual al vertical "
+            f"(horizontal={config_costos['horizontal']}, "
+            f"vertical={config_costos['vertical']})"
+        )
+
+
+class AlgoritmoJPS(AlgoritmoAStar):
+    """
+    A* con Jump Point Search.
+
+    Se obtiene con AlgoritmoAStar(..., motor='jps'). Mantiene el contrato de
+    ejecutar_paso / ejecutar_completo; los "vecinos explorados" de cada paso
+    son los puntos de salto generados.
+    """
+
+    def __init__(self, inicio, fin, filas, columnas, obstaculos,
+                 config_costos, permitir_diagonal=True, tipo_heuristica='octile',
+                 motor='jps', cola='heapq', mascara=None, campos=None,
+                 tabla_alt=None, componentes=None):
+        validar_config_jps(config_costos, permitir_diagonal)
+
+        # Mapa de bloqueo plano y movimientos legales para los saltos
+        if mascara is None:
+            mascara = MascaraVecinos(filas, columnas, obstaculos)
+        self._bloqueado = mascara.bloqueado
+
+        self._costo_recto = config_costos['horizontal']
+        self._costo_diagonal = config_costos['diagonal']
+
+        # Los saltos diagonales y verticales repiten muchos saltos rectos;
+        # dentro de una consulta su resultado es fijo, así que se memorizan
+        self._saltos_horizontales = {}
+        self._saltos_verticales = {}
+
+        super().__init__(inicio, fin, filas, columnas, obstaculos,
+                         config_costos, permitir_diagonal, tipo_heuristica,
+                         motor=motor, cola=cola, mascara=mascara, campos=campos,
+                         tabla_alt=tabla_alt, componentes=componentes)
+
+    # ===== CONSULTAS DEL MAPA =====
+
+    def _libre(self, fila, col):
+        """True si la celda está dentro del tablero y no es obstáculo"""
+        return (0 <= fila < self.filas and 0 <= col < self.columnas
+                and not self._bloqueado[fila * self.columnas + col])
+
+    def _puede_diagonal(self, fila, col, df, dc):
+        """Regla diagonal de puede_moverse_diagonal, leída de la máscara"""
+        mascara = self.mascara.mascara(fila * self.columnas + col)
+        return bool(mascara & BIT_MOVIMIENTO[(df, dc)])
+
+    # ===== SALTOS =====
+
+    def _saltar_horizontal(self, fila, col, dc):
+        """Salta en horizontal desde (fila, col). Retorna la celda o None"""
+        memoria = self._saltos_horizontales
+        clave = (fila, col, dc)
+        if clave in memoria:
+            return memoria[clave]
+
+        libre = self._libre
+        recorridas = [clave]
+        resultado = None
+        while True:
+            col += dc
+            if not libre(fila, col):
+                break
+            if (fila, col) == self.fin:
+                resultado = (fila, col)
+                break
+            # Vecino forzado: celda lateral libre cuya anterior está bloqueada
+            if ((libre(fila - 1, col) and not libre(fila - 1, col - dc)) or
+                    (libre(fila + 1, col) and not libre(fila + 1, col - dc))):
+                resultado = (fila, col)
+                break
+            clave = (fila, col, dc)
+            if clave in memoria:
+                resultado = memoria[clave]
+                break
+            recorridas.append(clave)
+
+        # Todas las celdas recorridas llegan al mismo punto de salto
+        for clave in recorridas:
+            memoria[clave] = resultado
+        return resultado
+
+    def _saltar_vertical(self, fila, col, df):
+        """Salta en vertical desde (fila, col). Retorna la celda o None"""
+        memoria = self._saltos_verticales
+        clave = (fila, col, df)
+        if clave in memoria:
+            return memoria[clave]
+
+        libre = self._libre
+        recorridas = [clave]
+        resultado = None
+        while True:
+            fila += df
+            if not libre(fila, col):
+                break
+            if (fila, col) == self.fin:
+                resultado = (fila, col)
+                break
+            if ((libre(fila, col - 1) and not libre(fila - df, col - 1)) or
+                    (libre(fila, col + 1) and not libre(fila - df, col + 1))):
+                resultado = (fila, col)
+                break
+            # Sin cortar esquinas, los saltos verticales deben revisar
+            # también los saltos horizontales desde cada celda
+            if (self._saltar_horizontal(fila, col, 1) is not None or
+                    self._saltar_horizontal(fila, col, -1) is not None):
+                resultado = (fila, col)
+                break
+            clave = (fila, col, df)
+            if clave in memoria:
+                resultado = memoria[clave]
+                break
+            recorridas.append(clave)
+
+        for clave in recorridas:
+            memoria[clave] = resultado
+        return resultado
+
+    def _saltar_diagonal(self, fila, col, df, dc):
+        """Salta en diagonal desde (fila, col). Retorna la celda o None"""
+        while True:
+            if not self._puede_diagonal(fila, col, df, dc):
+                return None
+            fila += df
+            col += dc
+            if (fila, col) == self.fin:
+                return (fila, col)
+            if (self._saltar_horizontal(fila, col, dc) is not None or
+                    self._saltar_vertical(fila, col, df) is not None):
+                return (fila, col)
+
+    def _saltar(self, nodo, df, dc):
+        if df == 0:
+            return self._saltar_horizontal(nodo[0], nodo[1], dc)
+        if dc == 0:
+            return self._saltar_vertical(nodo[0], nodo[1], df)
+        return self._saltar_diagonal(nodo[0], nodo[1], df, dc)
+
+    def _direcciones_podadas(self, nodo):
+        """
+        Direcciones a explorar desde un nodo según la dirección de llegada
+        (poda de vecinos de JPS sin cortar esquinas)
+        """
+        fila, col = nodo
+        if nodo not in self.vino_de:
+            direcciones = []
+            for df, dc in DIRECCIONES_SALTO:
+                if df == 0 or dc == 0:
+                    if self._libre(fila + df, col + dc):
+                        direcciones.append((df, dc))
+                elif self._puede_diagonal(fila, col, df, dc):
+                    direcciones.append((df, dc))
+            return direcciones
+
+        padre = self.vino_de[nodo]
+        df = _signo(fila - padre[0])
+        dc = _signo(col - padre[1])
+        libre = self._libre
+        direcciones = []
+
+        if df != 0 and dc != 0:
+            vertical_libre = libre(fila + df, col)
+            horizontal_libre = libre(fila, col + dc)
+            if vertical_libre:
+                direcciones.append((df, 0))
+            if horizontal_libre:
+                direcciones.append((0, dc))
+            if vertical_libre and horizontal_libre and libre(fila + df, col + dc):
+                direcciones.append((df, dc))
+
+        elif dc != 0:
+            siguiente_libre = libre(fila, col + dc)
+            arriba_libre = libre(fila - 1, col)
+            abajo_libre = libre(fila + 1, col)
+            if siguiente_libre:
+                direcciones.append((0, dc))
+                if arriba_libre and libre(fila - 1, col + dc):
+                    direcciones.append((-1, dc))
+                if abajo_libre and libre(fila + 1, col + dc):
+                    direcciones.append((1, dc))
+            if arriba_libre:
+                direcciones.append((-1, 0))
+            if abajo_libre:
+                direcciones.append((1, 0))
+
+        else:
+            siguiente_libre = libre(fila + df, col)
+            derecha_libre = libre(fila, col + 1)
+            izquierda_libre = libre(fila, col - 1)
+            if siguiente_libre:
+                direcciones.append((df, 0))
+                if derecha_libre and libre(fila + df, col + 1):
+                    direcciones.append((df, 1))
+                if izquierda_libre and libre(fila + df, col - 1):
+                    direcciones.append((df, -1))
+            if derecha_libre:
+                direcciones.append((0, 1))
+            if izquierda_libre:
+                direcciones.append((0, -1))
+
+        return direcciones
+
+    def _costo_salto(self, desde, hacia):
+        """Costo de un salto en línea recta o diagonal pura"""
+        pasos = max(abs(hacia[0] - desde[0]), abs(hacia[1] - desde[1]))
+        if desde[0] != hacia[0] and desde[1] != hacia[1]:
+            return pasos * self._costo_diagonal
+        return pasos * self._costo_recto
+
+    # ===== PASOS DE LA BÚSQUEDA =====
+
+    def ejecutar_paso(self):
+        """
+        Ejecuta UN PASO de JPS: expande un punto de salto
+
+        Returns:
+            tuple: (nodo_actual, puntos_de_salto_generados, encontrado)
+        """
+        # Descartar entradas obsoletas de la frontera
+        while self.frontera:
+            _, _, actual = self.frontera.extraer()
+            if actual not in self.cerrado:
+                break
+            self.extracciones_obsoletas += 1
+        else:
+            return None, [], False
+
+        self.cerrado.add(actual)
+        self.nodos_explorados += 1
+
+        if actual == self.fin:
+            return actual, [], True
+
+        generados = []
+        for df, dc in self._direcciones_podadas(actual):
+            salto = self._saltar(actual, df, dc)
+            if salto is None or salto in self.cerrado:
+                continue
+
+            nuevo_costo_g = self.costo_g[actual] + self._costo_salto(actual, salto)
+            if salto not in self.costo_g or nuevo_costo_g < self.costo_g[salto]:
+                self.costo_g[salto] = nuevo_costo_g
+                self.costo_h[salto] = self.heuristica(salto)
+                self.costo_f[salto] = calcular_funcion_costo(
+                    nuevo_costo_g, self.costo_h[salto]
+                )
+                self.frontera.insertar(salto, self.costo_f[salto], self.contador)
+                self.contador += 1
+                self.vino_de[salto] = actual
+                generados.append(salto)
+                self.vecinos_totales_evaluados += 1
+
+        return actual, generados, False
+
+    def reconstruir_camino_completo(self):
+        """
+        Camino celda por celda (sin inicio ni fin), interpolando los saltos
+
+        Returns:
+            list: Lista de nodos como la de funciones_astar.reconstruir_camino
+        """
+        puntos = [self.inicio] + reconstruir_camino(self.vino_de, self.inicio, self.fin)
+        puntos.append(self.fin)
+        camino = []
+        for desde, hacia in zip(puntos, puntos[1:]):
+            df = _signo(hacia[0] - desde[0])
+            dc = _signo(hacia[1] - desde[1])
+            fila, col = desde
+            while (fila, col) != hacia:
+                fila += df
+                col += dc
+                camino.append((fila, col))
+        return camino[:-1]
+
+    def reconstruir(self):
+        """Camino celda por celda (ver reconstruir_camino_completo)"""
+        return self.reconstruir_camino_completo()
+
+    def ejecutar_completo(self):
+        """
+        Ejecuta la búsqueda completa
+
+        Returns:
+            tuple: (exito, camino, nodos_explorados, costos)
+                   camino incluye todas las celdas intermedias
+        """
+        while True:
+            actual, _, encontrado = self.ejecutar_paso()
+            if actual is None:
+                return False, [], self.nodos_explorados, {}
+            if encontrado:
+                costos = {
+                    'g': self.costo_g,
+                    'h': self.costo_h,
+                    'f': self.costo_f
+                }
+                return True, self.reconstruir(), self.nodos_explorados, costos
+
+
+class TablaSaltos:
+    """
+    Distancias de salto precalculadas para JPS+ (independientes del objetivo)
+
+    Para cada dirección se guardan dos arreglos planos:
+    - libre[d][i]: cuántos pasos se pueden dar desde i antes de chocar
+    - salto[d][i]: pasos hasta el siguiente punto de salto (0 = ninguno)
+
+    Se puede reutilizar para todas las consultas sobre el mismo mapa.
+    """
+
+    def __init__(self, filas, columnas, obstaculos):
+        self.filas = filas
+        self.columnas = columnas
+        self._bloqueado = bytes_bloqueados(filas, columnas, obstaculos)
+
+        self.libre = {}
+        self.salto = {}
+        self._precalcular_horizontales()
+        self._precalcular_verticales()
+        self._precalcular_diagonales()
+
+    def comprobar_compatible(self, filas, columnas, mascara):
+        """
+        Lanza ValueError si la tabla no corresponde a este mapa
+
+        Con otras dimensiones los índices planos apuntan a otras celdas, y
+        con otros obstáculos los saltos atravesarían paredes o se saltarían
+        puntos de salto.
+        """
+        if (filas, columnas) != (self.filas, self.columnas):
+            raise ValueError(
+                f"La tabla de saltos es de {self.filas}x{self.columnas}, "
+                f"no de {filas}x{columnas}"
+            )
+        if _bytes_mascara(mascara) != self._bloqueado:
+            raise ValueError("La tabla de saltos se calculó con otros obstáculos")
+
+    def _libre(self, fila, col):
+        return (0 <= fila < self.filas and 0 <= col < self.columnas
+                and not self._bloqueado[fila * self.columnas + col])
+
+    def _nuevas_tablas(self, direccion):
+        total = self.filas * self.columnas
+        self.libre[direccion] = array('i', [0]) * total
+        self.salto[direccion] = array('i', [0]) * total
+        return self.libre[direccion], self.salto[direccion]
+
+    def _precalcular_horizontales(self):
+        columnas = self.columnas
+        libre = self._libre
+        for dc in (1, -1):
+            tabla_libre, tabla_salto = self._nuevas_tablas((0, dc))
+            orden = range(columnas - 1, -1, -1) if dc == 1 else range(columnas)
+            for fila in range(self.filas):
+                for col in orden:
+                    siguiente = col + dc
+                    if not libre(fila, siguiente):
+                        continue
+                    i = fila * columnas + col
+                    j = fila * columnas + siguiente
+                    tabla_libre[i] = tabla_libre[j] + 1
+                    forzado = ((libre(fila - 1, siguiente) and not libre(fila - 1, col)) or
+                               (libre(fila + 1, siguiente) and not libre(fila + 1, col)))
+                    if forzado:
+                        tabla_salto[i] = 1
+                    elif tabla_salto[j]:
+                        tabla_salto[i] = tabla_salto[j] + 1
+
+    def _precalcular_verticales(self):
+        columnas = self.columnas
+        libre = self._libre
+        derecha = self.salto[(0, 1)]
+        izquierda = self.salto[(0, -1)]
+        for df in (1, -1):
+            tabla_libre, tabla_salto = self._nuevas_tablas((df, 0))
+            orden = range(self.filas - 1, -1, -1) if df == 1 else range(self.filas)
+            for col in range(columnas):
+                for fila in orden:
+                    siguiente = fila + df
+                    if not libre(siguiente, col):
+                        continue
+                    i = fila * columnas + col
+                    j = siguiente * columnas + col
+                    tabla_libre[i] = tabla_libre[j] + 1
+                    forzado = ((libre(siguiente, col - 1) and not libre(fila, col - 1)) or
+                               (libre(siguiente, col + 1) and not libre(fila, col + 1)))
+                    if forzado or derecha[j] or izquierda[j]:
+                        tabla_salto[i] = 1
+                    elif tabla_salto[j]:
+                        tabla_salto[i] = tabla_salto[j] + 1
+
+    def _precalcular_diagonales(self):
+        columnas = self.columnas
+        libre = self._libre
+        for df in (1, -1):
+            for dc in (1, -1):
+                tabla_libre, tabla_salto = self._nuevas_tablas((df, dc))
+                horizontal = self.salto[(0, dc)]
+                vertical = self.salto[(df, 0)]
+                orden_filas = range(self.filas - 1, -1, -1) if df == 1 else range(self.filas)
+                orden_cols = range(columnas - 1, -1, -1) if dc == 1 else range(columnas)
+                for fila in orden_filas:
+                    for col in orden_cols:
+                        if not (libre(fila + df, col + dc) and libre(fila + df, col)
+                                and libre(fila, col + dc)):
+                            continue
+                        i = fila * columnas + col
+                        j = (fila + df) * columnas + col + dc
+                        tabla_libre[i] = tabla_libre[j] + 1
+                        if horizontal[j] or vertical[j]:
+                            tabla_salto[i] = 1
+                        elif tabla_salto[j]:
+                            tabla_salto[i] = tabla_salto[j] + 1
+
+
+def precalcular_saltos(filas, columnas, obstaculos):
+    """
+    Precalcula las tablas de JPS+ para un mapa
+
+    Returns:
+        TablaSaltos: Tablas reutilizables con AlgoritmoAStar(..., motor='jps+',
+                     tabla_saltos=tabla)
+    """
+    return TablaSaltos(filas, columnas, obstaculos)
+
+
+def _bytes_mascara(mascara):
+    """Un byte por celda (1 = bloqueada) con los obstáculos de la máscara"""
+    bloqueado = mascara.bloqueado
+    if not isinstance(bloqueado, (bytes, bytearray)):
+        # MascaraPerezosa: el mismo contenido en bytes
+        bloqueado = bytes_bloqueados(mascara.filas, mascara.columnas, mascara.obstaculos)
+    return bloqueado
+
+
+# Tablas de las últimas consultas sin tabla_saltos=, (filas, columnas,
+# crc32 de los obstáculos) -> TablaSaltos. Cada tabla ocupa 64 bytes por
+# celda, así que solo se guardan unas pocas
+_TABLAS_RECIENTES = OrderedDict()
+_CAPACIDAD_TABLAS = 2
+
+
+def tabla_saltos_del_mapa(filas, columnas, obstaculos, mascara):
+    """
+    TablaSaltos para estos obstáculos, reutilizando la de una consulta
+    anterior sobre el mismo mapa si sigue en la caché
+
+    Args:
+        filas: Número de filas de la cuadrícula
+        columnas: Número de columnas de la cuadrícula
+        obstaculos: Set de tuplas con posiciones bloqueadas (o MapaBits)
+        mascara: MascaraVecinos de esos obstáculos (identifica el mapa sin
+                 volver a recorrerlos)
+
+    Returns:
+        TablaSaltos
+    """
+    bloqueado = _bytes_mascara(mascara)
+    clave = (filas, columnas, zlib.crc32(bloqueado))
+    tabla = _TABLAS_RECIENTES.get(clave)
+    # El crc solo localiza la tabla: se compara el mapa completo
+    if tabla is not None and tabla._bloqueado == bloqueado:
+        _TABLAS_RECIENTES.move_to_end(clave)
+        return tabla
+    tabla = TablaSaltos(filas, columnas, obstaculos)
+    _TABLAS_RECIENTES[clave] = tabla
+    while len(_TABLAS_RECIENTES) > _CAPACIDAD_TABLAS:
+        _TABLAS_RECIENTES.popitem(last=False)
+    return tabla
+
+
+class AlgoritmoJPSPlus(AlgoritmoJPS):
+    """
+    JPS+ : JPS con saltos rectos precalculados.
+
+    Se obtiene con AlgoritmoAStar(..., motor='jps+'). Si no se pasa
+    tabla_saltos se reutiliza la de una consulta reciente sobre el mismo
+    mapa o se calcula una (tabla_saltos_del_mapa). Una tabla_saltos de otro
+    mapa lanza ValueError.
+    """
+
+    def __init__(self, inicio, fin, filas, columnas, obstaculos,
+                 config_costos, permitir_diagonal=True, tipo_heuristica='octile',
+                 motor='jps+', cola='heapq', mascara=None, campos=None,
+                 tabla_alt=None, componentes=None, tabla_saltos=None):
+        validar_config_jps(config_costos, permitir_diagonal)
+        if mascara is None:
+            mascara = MascaraVecinos(filas, columnas, obstaculos)
+        if tabla_saltos is None:
+            tabla_saltos = tabla_saltos_del_mapa(filas, columnas, obstaculos, mascara)
+        else:
+            tabla_saltos.comprobar_compatible(filas, columnas, mascara)
+        self.tabla_saltos = tabla_saltos
+        super().__init__(inicio, fin, filas, columnas, obstaculos,
+                         config_costos, permitir_diagonal, tipo_heuristica,
+                         motor=motor, cola=cola, mascara=mascara, campos=campos,
+                         tabla_alt=tabla_alt, componentes=componentes)
+
+    def _alcanza_objetivo_horizontal(self, fila, col):
+        """True si desde (fila, col) un salto horizontal llega al objetivo"""
+        fila_fin, col_fin = self.fin
+        if fila != fila_fin or col == col_fin:
+            return False
+        dc = _signo(col_fin - col)
+        libre = self.tabla_saltos.libre[(0, dc)][fila * self.columnas + col]
+        return abs(col_fin - col) <= libre
+
+    def _saltar_horizontal(self, fila, col, dc):
+        i = fila * self.columnas + col
+        distancia = self.tabla_saltos.salto[(0, dc)][i]
+        fila_fin, col_fin = self.fin
+        if fila == fila_fin and 0 < (col_fin - col) * dc <= self.tabla_saltos.libre[(0, dc)][i]:
+            hasta_fin = abs(col_fin - col)
+            if not distancia or hasta_fin < distancia:
+                distancia = hasta_fin
+        if not distancia:
+            return None
+        return (fila, col + distancia * dc)
+
+    def _saltar_vertical(self, fila, col, df):
+        i = fila * self.columnas + col
+        distancia = self.tabla_saltos.salto[(df, 0)][i]
+        fila_fin, col_fin = self.fin
+        if 0 < (fila_fin - fila) * df <= self.tabla_saltos.libre[(df, 0)][i]:
+            # En la fila del objetivo, el objetivo está en la columna o a
+            # alcance de un salto horizontal
+            if col == col_fin or self._alcanza_objetivo_horizontal(fila_fin, col):
+                hasta_fin = abs(fila_fin - fila)
+                if not distancia or hasta_fin < distancia:
+                    distancia = hasta_fin
+        if not distancia:
+            return None
+        return (fila + distancia * df, col)
+
+    def _saltar_diagonal(self, fila, col, df, dc):
+        tabla = self.tabla_saltos
+        i = fila * self.columnas + col
+        limite = tabla.salto[(df, dc)][i] or tabla.libre[(df, dc)][i]
+        if not limite:
+            return None
+
+        # Buscar la primera celda de la diagonal donde el objetivo hace
+        # que un salto recto tenga éxito (solo si el objetivo está por delante)
+        fila_fin, col_fin = self.fin
+        if (fila_fin - fila) * df > 0 or (col_fin - col) * dc > 0:
+            for pasos in range(1, limite + 1):
+                fila_p = fila + pasos * df
+                col_p = col + pasos * dc
+                if (fila_p, col_p) == self.fin:
+                    return self.fin
+                if self._saltar_objetivo_desde(fila_p, col_p, df, dc):
+                    return (fila_p, col_p)
+
+        if tabla.salto[(df, dc)][i]:
+            return (fila + limite * df, col + limite * dc)
+        return None
+
+    def _saltar_objetivo_desde(self, fila, col, df, dc):
+        """True si el objetivo vuelve exitoso un salto recto desde (fila, col)"""
+        tabla = self.tabla_saltos
+        i = fila * self.columnas + col
+        fila_fin, col_fin = self.fin
+        if fila == fila_fin and 0 < (col_fin - col) * dc <= tabla.libre[(0, dc)][i]:
+            return True
+        if 0 < (fila_fin - fila) * df <= tabla.libre[(df, 0)][i]:
+            return col == col_fin or self._alcanza_objetivo_horizontal(fila_fin, col)
+        return False
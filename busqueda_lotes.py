@@ -0,0 +1,216 @@
+"""
+Resolución de lotes de consultas en paralelo
+
+Reparte una lista de pares (inicio, fin) sobre el mismo mapa entre varios
+procesos con ProcessPoolExecutor.
+
+MEMORIA COMPARTIDA:
+El mapa de obstáculos (un byte por celda) se copia UNA vez a un bloque de
+multiprocessing.shared_memory. Cada proceso trabajador mantiene el bloque
+abierto y lo usa directamente como MapaBits, con una MascaraPerezosa
+encima: ningún trabajador reserva memoria por celda. Las tareas solo
+llevan los pares (inicio, fin). Por lo mismo el motor por defecto es
+'diccionarios': sus consultas cuestan lo que expanden, no el área del mapa.
+
+Con usar_componentes (por defecto) el proceso principal etiqueta las
+componentes conexas una sola vez y las copia a un segundo bloque con el
+tipo entero más pequeño que las admite (etiquetas_compactas); los
+trabajadores las consultan ahí (EtiquetasComponentes) y descartan en O(1)
+los pares sin camino, sin construir el motor.
+
+Uso:
+    resultados = resolver_lote(filas, columnas, obstaculos, pares, config_costos)
+    for exito, camino, costo, estadisticas in resultados:
+        ...
+
+iterar_lote() entrega los mismos resultados a medida que terminan (en el
+mismo orden), para procesar lotes grandes sin esperar al último.
+"""
+import math
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from algoritmo_astar import AlgoritmoAStar
+from componentes_conexas import ComponentesConexas, EtiquetasComponentes
+from mapa_bits import MapaBits, bytes_bloqueados
+from mascara_vecinos import MascaraPerezosa
+
+# Mapa del proceso trabajador (se llena en _iniciar_trabajador)
+_mapa_trabajador = {}
+
+
+def _adjuntar_memoria(nombre):
+    """Abre un bloque de memoria compartida creado por otro proceso"""
+    try:
+        return shared_memory.SharedMemory(name=nombre, track=False)  # Python 3.13+
+    except TypeError:
+        # Antes de 3.13 abrirlo también lo registra, pero en el mismo
+        # resource_tracker del proceso principal, que lo borra con unlink()
+        return shared_memory.SharedMemory(name=nombre)
+
+
+def _iniciar_trabajador(nombre_mapa, nombre_etiquetas, tipo_etiqueta,
+                        total_componentes, filas, columnas):
+    """Abre los bloques compartidos y prepara el mapa del trabajador sin copiarlos"""
+    total = filas * columnas
+    memorias = [_adjuntar_memoria(nombre_mapa)]
+    obstaculos = MapaBits(filas, columnas, memorias[0].buf[:total])
+    componentes = None
+    if nombre_etiquetas is not None:
+        memorias.append(_adjuntar_memoria(nombre_etiquetas))
+        tamano = total * array(tipo_etiqueta).itemsize
+        etiquetas = memorias[1].buf[:tamano].cast(tipo_etiqueta)
+        componentes = EtiquetasComponentes(filas, columnas, etiquetas, total_componentes)
+    _preparar_mapa(filas, columnas, obstaculos, componentes)
+    # Los bloques quedan abiertos mientras viva el proceso
+    _mapa_trabajador['memorias'] = memorias
+
+
+def _preparar_mapa(filas, columnas, obstaculos, componentes):
+    _mapa_trabajador.update(
+        filas=filas, columnas=columnas, obstaculos=obstaculos,
+        mascara=MascaraPerezosa(filas, columnas, obstaculos),
+        componentes=componentes
+    )
+
+
+def _resolver_bloque(pares, config_costos, permitir_diagonal, tipo_heuristica, motor):
+    """Resuelve un bloque de pares con el mapa del trabajador"""
+    mapa = _mapa_trabajador
+    resultados = []
+    componentes = mapa['componentes']
+    for inicio, fin in pares:
+        if componentes is not None and not componentes.conectados(inicio, fin):
+            resultados.append((False, [], None, {
+                'nodos_explorados': 0,
+                'costo_g_objetivo': None,
+                'inalcanzable': True
+            }))
+            continue
+        algoritmo = AlgoritmoAStar(
+            inicio, fin, mapa['filas'], mapa['columnas'], mapa['obstaculos'],
+            config_costos, permitir_diagonal, tipo_heuristica,
+            motor=motor, mascara=mapa['mascara']
+        )
+        exito, camino, _, _ = algoritmo.ejecutar_completo()
+        estadisticas = algoritmo.obtener_estadisticas()
+        costo = estadisticas['costo_g_objetivo'] if exito else None
+        resultados.append((exito, list(camino), costo, estadisticas))
+    return resultados
+
+
+def iterar_lote(filas, columnas, obstaculos, pares, config_costos,
+                permitir_diagonal=False, tipo_heuristica='manhattan',
+                motor='diccionarios', procesos=None, tamano_bloque=None,
+                usar_componentes=True):
+    """
+    Como resolver_lote, pero entrega cada resultado en cuanto está listo
+
+    Los resultados salen en el orden de pares. La memoria compartida y los
+    procesos se liberan al agotar (o cerrar) el generador.
+
+    Yields:
+        tuple: (exito, camino, costo, estadisticas) por par
+    """
+    pares = [(tuple(inicio), tuple(fin)) for inicio, fin in pares]
+    if not pares:
+        return
+
+    mapa = MapaBits(filas, columnas, bytes_bloqueados(filas, columnas, obstaculos))
+    componentes = None
+    if usar_componentes:
+        componentes = ComponentesConexas(filas, columnas, mapa, permitir_diagonal)
+    if procesos is None:
+        procesos = os.cpu_count() or 1
+    procesos = max(1, min(procesos, len(pares)))
+
+    if procesos == 1:
+        _preparar_mapa(filas, columnas, mapa, componentes)
+        for par in pares:
+            yield from _resolver_bloque([par], config_costos, permitir_diagonal,
+                                        tipo_heuristica, motor)
+        return
+
+    if tamano_bloque is None:
+        tamano_bloque = math.ceil(len(pares) / (procesos * 4))
+    bloques = [pares[i:i + tamano_bloque] for i in range(0, len(pares), tamano_bloque)]
+
+    memorias = []
+    try:
+        memoria_mapa = shared_memory.SharedMemory(create=True, size=max(1, filas * columnas))
+        memorias.append(memoria_mapa)
+        memoria_mapa.buf[:filas * columnas] = mapa.bloqueado
+        del mapa
+
+        nombre_etiquetas = tipo_etiqueta = total_componentes = None
+        if componentes is not None:
+            etiquetas = componentes.etiquetas_compactas()
+            total_componentes = componentes.total
+            del componentes
+            datos = memoryview(etiquetas).cast('B')
+            memoria_etiquetas = shared_memory.SharedMemory(create=True,
+                                                           size=max(1, len(datos)))
+            memorias.append(memoria_etiquetas)
+            memoria_etiquetas.buf[:len(datos)] = datos
+            datos.release()
+            nombre_etiquetas, tipo_etiqueta = memoria_etiquetas.name, etiquetas.typecode
+            del etiquetas
+
+        with ProcessPoolExecutor(max_workers=procesos,
+                                 initializer=_iniciar_trabajador,
+                                 initargs=(memoria_mapa.name, nombre_etiquetas,
+                                           tipo_etiqueta, total_componentes,
+                                           filas, columnas)) as pool:
+            # map conserva el orden de los bloques
+            resultados_bloques = pool.map(
+                _resolver_bloque, bloques,
+                [config_costos] * len(bloques),
+                [permitir_diagonal] * len(bloques),
+                [tipo_heuristica] * len(bloques),
+                [motor] * len(bloques)
+            )
+            for bloque in resultados_bloques:
+                yield from bloque
+    finally:
+        for memoria in memorias:
+            memoria.close()
+            memoria.unlink()
+
+
+def resolver_lote(filas, columnas, obstaculos, pares, config_costos,
+                  permitir_diagonal=False, tipo_heuristica='manhattan',
+                  motor='diccionarios', procesos=None, tamano_bloque=None,
+                  usar_componentes=True):
+    """
+    Resuelve muchas consultas sobre el mismo mapa en varios procesos
+
+    Args:
+        filas: Número de filas de la cuadrícula
+        columnas: Número de columnas de la cuadrícula
+        obstaculos: Set de tuplas con posiciones bloqueadas
+        pares: Lista de tuplas (inicio, fin)
+        config_costos: Dict con costos {'horizontal', 'vertical', 'diagonal'}
+        permitir_diagonal: Si True, permite movimientos en 8 direcciones
+        tipo_heuristica: Tipo de heurística a usar
+        motor: Motor de AlgoritmoAStar. Por defecto 'diccionarios', cuyo
+               estado crece con los nodos visitados; 'arreglos' reserva
+               unos 17 bytes por celda del mapa en CADA consulta
+        procesos: Número de procesos (por defecto, los núcleos disponibles).
+                  Con 1 se resuelve en este mismo proceso, sin pool
+        tamano_bloque: Pares por tarea enviada a un trabajador (por defecto,
+                       unas 4 tareas por proceso)
+        usar_componentes: Si True, los pares en componentes conexas distintas
+                          se descartan sin buscar
+
+    Returns:
+        list: Una tupla (exito, camino, costo, estadisticas) por par, en el
+              mismo orden que pares. camino no incluye inicio ni fin y
+              estadisticas es el dict de obtener_estadisticas (para los
+              pares descartados, solo nodos_explorados, costo_g_objetivo e
+              inalcanzable)
+    """
+    return list(iterar_lote(filas, columnas, obstaculos, pares, config_costos,
+                            permitir_diagonal, tipo_heuristica, motor, procesos,
+                            tamano_bloque, usar_componentes))
@@ -0,0 +1,274 @@
+"""
+Caminos en cualquier ángulo: Theta* y Lazy Theta*
+
+A* en la cuadrícula solo produce caminos con giros de 45°/90°. Theta* busca
+sobre las mismas celdas pero permite que el padre de un nodo sea cualquier
+nodo con LÍNEA DE VISTA hacia él, así que el camino resultante es una lista
+de puntos de giro unidos por segmentos rectos:
+
+- Theta*: al generar un vecino prueba la línea de vista desde el padre del
+  nodo actual; si la hay, el vecino cuelga directamente de ese padre.
+- Lazy Theta*: asume la línea de vista al generar y solo la comprueba al
+  expandir el nodo (una comprobación por expansión en vez de una por
+  vecino). Si falla, toma como padre al mejor vecino ya cerrado.
+
+COSTOS:
+Un segmento de (df, dc) celdas cuesta su longitud euclidiana con cada eje
+escalado por su costo recto:
+    sqrt((df * vertical)**2 + (dc * horizontal)**2)
+Es la razón de ser del ángulo libre: (0,0)->(5,2) cuesta 5.39 en lugar de
+los 5.8 del camino de la cuadrícula con 1.0/1.0/1.4. La heurística es esa
+misma distancia hasta el fin (tipo_heuristica se ignora).
+
+Para comparar con los demás motores, obtener_estadisticas() incluye
+'costo_cuadricula': cada segmento del camino pagado como el camino más
+barato de la cuadrícula vacía entre sus extremos (con 'diagonal').
+
+Theta* requiere permitir_diagonal=True: los segmentos cortan en cualquier
+ángulo y no existe una versión en 4 direcciones.
+
+LÍNEA DE VISTA:
+Se recorren todas las celdas que toca el segmento entre los centros. Si
+pasa justo por una esquina, las dos celdas que la comparten deben estar
+libres: la misma regla que puede_moverse_diagonal para los pasos
+diagonales. Los resultados se memorizan por par de celdas durante la
+consulta.
+"""
+import math
+
+from algoritmo_astar import AlgoritmoAStar
+from replanificador_incremental import crear_distancia_libre
+
+INFINITO = float('inf')
+
+
+class AlgoritmoThetaStar(AlgoritmoAStar):
+    """
+    Theta*: A* con padres en cualquier ángulo.
+
+    Se obtiene con AlgoritmoAStar(..., motor='theta'). El camino de
+    ejecutar_completo son los puntos de giro (sin inicio ni fin): dos puntos
+    consecutivos no tienen por qué ser vecinos en la cuadrícula.
+    """
+
+    def __init__(self, inicio, fin, filas, columnas, obstaculos,
+                 config_costos, permitir_diagonal=True, tipo_heuristica='euclidiana',
+                 motor='theta', cola='heapq', mascara=None, campos=None,
+                 tabla_alt=None, componentes=None):
+        if not permitir_diagonal:
+            raise ValueError("Theta* requiere permitir_diagonal=True")
+        self._costo_horizontal = config_costos['horizontal']
+        self._costo_vertical = config_costos['vertical']
+
+        # Línea de vista memorizada: (indice_a, indice_b) con a < b -> bool
+        self._visibilidad = {}
+        self.consultas_visibilidad = 0
+        self.trazados_visibilidad = 0
+
+        super().__init__(inicio, fin, filas, columnas, obstaculos,
+                         config_costos, permitir_diagonal, tipo_heuristica,
+                         motor=motor, cola=cola, mascara=mascara, campos=campos,
+                         tabla_alt=tabla_alt, componentes=componentes)
+
+    def _heuristica_hacia(self, objetivo, indices=False):
+        """Distancia en línea recta (con los costos escalados) hasta el objetivo"""
+        distancia = self.distancia
+        if indices:
+            columnas = self.columnas
+            return lambda indice: distancia(divmod(indice, columnas), objetivo)
+        return lambda nodo: distancia(nodo, objetivo)
+
+    # ===== GEOMETRÍA =====
+
+    def distancia(self, desde, hacia):
+        """Costo del segmento recto entre los centros de dos celdas"""
+        return math.hypot((hacia[0] - desde[0]) * self._costo_vertical,
+                          (hacia[1] - desde[1]) * self._costo_horizontal)
+
+    def costo_cuadricula(self, desde, hacia):
+        """Costo del camino más barato de la cuadrícula vacía entre dos celdas"""
+        return crear_distancia_libre(hacia, self.config_costos, True)(desde)
+
+    def linea_de_vista(self, desde, hacia):
+        """
+        True si el segmento entre los centros de las celdas no toca obstáculos
+
+        Args:
+            desde: Tupla (fila, col)
+            hacia: Tupla (fila, col)
+
+        Returns:
+            bool: Resultado (memorizado por par de celdas)
+        """
+        self.consultas_visibilidad += 1
+        columnas = self.columnas
+        a = desde[0] * columnas + desde[1]
+        b = hacia[0] * columnas + hacia[1]
+        clave = (a, b) if a < b else (b, a)
+        resultado = self._visibilidad.get(clave)
+        if resultado is None:
+            resultado = self._trazar(desde, hacia)
+            self._visibilidad[clave] = resultado
+        return resultado
+
+    def _trazar(self, desde, hacia):
+        """Recorre las celdas del segmento (aritmética entera, sin flotantes)"""
+        self.trazados_visibilidad += 1
+        bloqueado = self.mascara.bloqueado
+        columnas = self.columnas
+
+        fila, col = desde
+        paso_fila = 1 if hacia[0] > fila else -1
+        paso_col = 1 if hacia[1] > col else -1
+        total_filas = abs(hacia[0] - fila)
+        total_cols = abs(hacia[1] - col)
+        filas_cruzadas = cols_cruzadas = 0
+
+        if bloqueado[fila * columnas + col]:
+            return False
+        while filas_cruzadas < total_filas or cols_cruzadas < total_cols:
+            # El segmento cruza primero el borde de columna si
+            # (0.5 + cols) / total_cols < (0.5 + filas) / total_filas
+            decision = ((1 + 2 * cols_cruzadas) * total_filas
+                        - (1 + 2 * filas_cruzadas) * total_cols)
+            if decision == 0:
+                # Pasa justo por una esquina: las dos celdas que la
+                # comparten deben estar libres (regla diagonal)
+                if (bloqueado[(fila + paso_fila) * columnas + col]
+                        or bloqueado[fila * columnas + col + paso_col]):
+                    return False
+                fila += paso_fila
+                col += paso_col
+                filas_cruzadas += 1
+                cols_cruzadas += 1
+            elif decision < 0:
+                col += paso_col
+                cols_cruzadas += 1
+            else:
+                fila += paso_fila
+                filas_cruzadas += 1
+            if bloqueado[fila * columnas + col]:
+                return False
+        return True
+
+    # ===== BÚSQUEDA =====
+
+    def _preparar_vertice(self, nodo):
+        """Gancho de Lazy Theta*: corrige el padre al expandir (aquí no hace nada)"""
+
+    def _mejor_padre(self, actual, vecino):
+        """
+        Padre y G que recibe un vecino generado desde actual
+
+        Returns:
+            tuple: (padre, costo_g)
+        """
+        padre = self.vino_de.get(actual)
+        if padre is not None and self.linea_de_vista(padre, vecino):
+            return padre, self.costo_g[padre] + self.distancia(padre, vecino)
+        return actual, self.costo_g[actual] + self.distancia(actual, vecino)
+
+    def ejecutar_paso(self):
+        """
+        Ejecuta UN PASO de Theta* (mismo contrato que AlgoritmoAStar)
+
+        Returns:
+            tuple: (nodo_actual, lista_vecinos_explorados, encontrado)
+        """
+        while self.frontera:
+            _, _, actual = self.frontera.extraer()
+            if actual not in self.cerrado:
+                break
+            self.extracciones_obsoletas += 1
+        else:
+            return None, [], False
+
+        self.cerrado.add(actual)
+        self.nodos_explorados += 1
+        self._preparar_vertice(actual)
+
+        if actual == self.fin:
+            return actual, [], True
+
+        vecinos_explorados = []
+        for vecino in self.mascara.vecinos(actual, self.permitir_diagonal):
+            if vecino in self.cerrado:
+                continue
+            padre, nuevo_costo_g = self._mejor_padre(actual, vecino)
+            if nuevo_costo_g < self.costo_g.get(vecino, INFINITO):
+                self.costo_g[vecino] = nuevo_costo_g
+                if vecino not in self.costo_h:
+                    self.costo_h[vecino] = self.heuristica(vecino)
+                self.costo_f[vecino] = nuevo_costo_g + self.costo_h[vecino]
+                self.vino_de[vecino] = padre
+                self.frontera.insertar(vecino, self.costo_f[vecino], self.contador)
+                self.contador += 1
+                vecinos_explorados.append(vecino)
+                self.vecinos_totales_evaluados += 1
+
+        return actual, vecinos_explorados, False
+
+    def obtener_estadisticas(self):
+        """
+        Obtiene estadísticas del estado actual del algoritmo
+
+        Returns:
+            dict: Diccionario con estadísticas (las de AlgoritmoAStar, las
+                  de línea de vista y costo_cuadricula, None sin camino)
+        """
+        estadisticas = super().obtener_estadisticas()
+        costo_cuadricula = None
+        if estadisticas['costo_g_objetivo'] is not None:
+            costo_cuadricula = 0.0
+            nodo = self.fin
+            while nodo in self.vino_de:
+                padre = self.vino_de[nodo]
+                costo_cuadricula += self.costo_cuadricula(padre, nodo)
+                nodo = padre
+        estadisticas.update({
+            'costo_cuadricula': costo_cuadricula,
+            'consultas_visibilidad': self.consultas_visibilidad,
+            'trazados_visibilidad': self.trazados_visibilidad,
+            'pares_memorizados': len(self._visibilidad)
+        })
+        return estadisticas
+
+
+class AlgoritmoLazyThetaStar(AlgoritmoThetaStar):
+    """
+    Lazy Theta*: la línea de vista se comprueba al expandir, no al generar.
+
+    Se obtiene con AlgoritmoAStar(..., motor='lazy-theta').
+    """
+
+    def __init__(self, inicio, fin, filas, columnas, obstaculos,
+                 config_costos, permitir_diagonal=True, tipo_heuristica='euclidiana',
+                 motor='lazy-theta', cola='heapq', mascara=None, campos=None,
+                 tabla_alt=None, componentes=None):
+        super().__init__(inicio, fin, filas, columnas, obstaculos,
+                         config_costos, permitir_diagonal, tipo_heuristica,
+                         motor=motor, cola=cola, mascara=mascara, campos=campos,
+                         tabla_alt=tabla_alt, componentes=componentes)
+
+    def _mejor_padre(self, actual, vecino):
+        """Cuelga el vecino del padre de actual sin comprobar la línea de vista"""
+        padre = self.vino_de.get(actual)
+        if padre is not None:
+            return padre, self.costo_g[padre] + self.distancia(padre, vecino)
+        return actual, self.costo_g[actual] + self.distancia(actual, vecino)
+
+    def _preparar_vertice(self, nodo):
+        """Si el padre supuesto no ve al nodo, toma el mejor vecino cerrado"""
+        padre = self.vino_de.get(nodo)
+        if padre is None or self.linea_de_vista(padre, nodo):
+            return
+
+        mejor, mejor_g = None, INFINITO
+        for vecino in self.mascara.vecinos(nodo, self.permitir_diagonal):
+            if vecino in self.cerrado and vecino != nodo:
+                costo = self.costo_g[vecino] + self.distancia(vecino, nodo)
+                if costo < mejor_g:
+                    mejor, mejor_g = vecino, costo
+        self.vino_de[nodo] = mejor
+        self.costo_g[nodo] = mejor_g
+        self.costo_f[nodo] = mejor_g + self.costo_h[nodo]
@@ -0,0 +1,231 @@
+"""
+Caché de resultados de búsqueda con invalidación selectiva
+
+Guarda el resultado de AlgoritmoAStar.ejecutar_completo por consulta
+(inicio, fin, costos, permitir_diagonal, heurística, motor) junto con la
+REGIÓN EXPLORADA: los nodos cerrados y sus 8 vecinas.
+
+¿POR QUÉ BASTA ESA REGIÓN?
+El resultado de A* solo depende de las aristas que salen de los nodos
+cerrados, y esas aristas (incluida la regla diagonal) solo miran las 8
+celdas alrededor de cada nodo cerrado. Si una celda fuera de la región
+cambia, la búsqueda repetida daría exactamente el mismo resultado.
+
+Al cambiar obstáculos se descartan SOLO las entradas cuya región contiene
+alguna celda modificada; las demás siguen siendo válidas en la nueva
+versión del mapa.
+
+Uso:
+    cache = CacheCaminos(filas, columnas, obstaculos)
+    exito, camino, costo = cache.buscar(inicio, fin, config_costos, True, 'octile')
+    cache.actualizar_obstaculos(agregados={(3, 4)})
+"""
+from collections import OrderedDict
+
+from algoritmo_astar import AlgoritmoAStar
+from mascara_vecinos import MascaraVecinos
+
+# Motores cuyo conjunto cerrado contiene TODAS las celdas expandidas.
+# JPS examina celdas intermedias de los saltos sin cerrarlas, así que sus
+# entradas se descartan ante cualquier cambio de obstáculos.
+MOTORES_CON_REGION = ('diccionarios', 'arreglos', 'bidireccional')
+
+# Opciones de AlgoritmoAStar precalculadas sobre un mapa de obstáculos.
+# La caché cambia su propio mapa, así que quedarían desactualizadas; además
+# componentes= termina la búsqueda sin expandir nada (región vacía) y el
+# resultado no se invalidaría nunca.
+OPCIONES_CON_MAPA = ('componentes', 'campos', 'tabla_alt')
+
+
+class CacheCaminos:
+    """Caché LRU de caminos sobre un mapa de obstáculos propio y versionado"""
+
+    def __init__(self, filas, columnas, obstaculos, capacidad=256):
+        """
+        Args:
+            filas: Número de filas de la cuadrícula
+            columnas: Número de columnas de la cuadrícula
+            obstaculos: Set de tuplas con posiciones bloqueadas (se copia)
+            capacidad: Máximo de resultados guardados (se descarta el menos usado)
+        """
+        if capacidad < 1:
+            raise ValueError("La capacidad de la caché debe ser al menos 1")
+        self.filas = filas
+        self.columnas = columnas
+        self.obstaculos = set(obstaculos)
+        self.mascara = MascaraVecinos(filas, columnas, self.obstaculos)
+        self.capacidad = capacidad
+        self.version = 0
+
+        self._entradas = OrderedDict()   # clave -> (exito, camino, costo, region)
+        self._por_celda = {}             # índice de celda -> claves cuya región la contiene
+        self._sin_region = set()         # claves que se invalidan ante cualquier cambio
+
+        # Estadísticas
+        self.aciertos = 0
+        self.fallos = 0
+        self.invalidaciones = 0
+        self.expulsiones = 0
+
+    @staticmethod
+    def clave(inicio, fin, config_costos, permitir_diagonal, tipo_heuristica, motor):
+        return (tuple(inicio), tuple(fin),
+                config_costos['horizontal'], config_costos['vertical'],
+                config_costos['diagonal'], bool(permitir_diagonal),
+                tipo_heuristica, motor)
+
+    # ===== CONSULTAS =====
+
+    def buscar(self, inicio, fin, config_costos, permitir_diagonal=False,
+               tipo_heuristica='manhattan', motor='diccionarios', **opciones):
+        """
+        Resultado de la búsqueda, desde la caché o ejecutando el motor
+
+        Args:
+            inicio: Tupla (fila, col) del nodo inicial
+            fin: Tupla (fila, col) del nodo objetivo
+            config_costos: Dict con costos {'horizontal', 'vertical', 'diagonal'}
+            permitir_diagonal: Si True, permite movimientos en 8 direcciones
+            tipo_heuristica: Tipo de heurística a usar
+            motor: Motor de AlgoritmoAStar
+            **opciones: Otros argumentos de AlgoritmoAStar (cola, ...).
+                        No forman parte de la clave: solo pueden cambiar
+                        cuál de los caminos óptimos se devuelve. No se
+                        admiten las de OPCIONES_CON_MAPA
+
+        Returns:
+            tuple: (exito, camino, costo)
+                   camino sin inicio ni fin, igual que reconstruir_camino
+        """
+        con_mapa = [nombre for nombre in OPCIONES_CON_MAPA if nombre in opciones]
+        if con_mapa:
+            raise ValueError(
+                f"CacheCaminos no admite {', '.join(con_mapa)}: se calculan sobre "
+                "un mapa de obstáculos y la caché modifica el suyo"
+            )
+        clave = self.clave(inicio, fin, config_costos, permitir_diagonal,
+                           tipo_heuristica, motor)
+        entrada = self._entradas.get(clave)
+        if entrada is not None:
+            self._entradas.move_to_end(clave)
+            self.aciertos += 1
+            exito, camino, costo, _ = entrada
+            return exito, list(camino), costo
+
+        self.fallos += 1
+        algoritmo = AlgoritmoAStar(
+            inicio, fin, self.filas, self.columnas, self.obstaculos, config_costos,
+            permitir_diagonal, tipo_heuristica, motor=motor, mascara=self.mascara,
+            **opciones
+        )
+        exito, camino, _, _ = algoritmo.ejecutar_completo()
+        costo = algoritmo.obtener_estadisticas()['costo_g_objetivo'] if exito else None
+
+        region = self._region(algoritmo) if motor in MOTORES_CON_REGION else None
+        self._guardar(clave, (exito, tuple(camino), costo, region))
+        return exito, list(camino), costo
+
+    def _region(self, algoritmo):
+        """Índices de los nodos cerrados y sus 8 vecinas"""
+        cerrados = list(algoritmo.cerrado)
+        cerrados.extend(getattr(algoritmo, 'cerrado_inverso', ()))
+
+        filas, columnas = self.filas, self.columnas
+        region = set()
+        for fila, col in cerrados:
+            for f in range(max(fila - 1, 0), min(fila + 2, filas)):
+                base = f * columnas
+                region.update(range(base + max(col - 1, 0), base + min(col + 2, columnas)))
+        return frozenset(region)
+
+    # ===== ALMACENAMIENTO =====
+
+    def _guardar(self, clave, entrada):
+        self._entradas[clave] = entrada
+        region = entrada[3]
+        if region is None:
+            self._sin_region.add(clave)
+        else:
+            for indice in region:
+                self._por_celda.setdefault(indice, set()).add(clave)
+
+        while len(self._entradas) > self.capacidad:
+            clave_vieja = next(iter(self._entradas))
+            self._descartar(clave_vieja)
+            self.expulsiones += 1
+
+    def _descartar(self, clave):
+        _, _, _, region = self._entradas.pop(clave)
+        if region is None:
+            self._sin_region.discard(clave)
+            return
+        for indice in region:
+            claves = self._por_celda.get(indice)
+            if claves is not None:
+                claves.discard(clave)
+                if not claves:
+                    del self._por_celda[indice]
+
+    # ===== CAMBIOS DE OBSTÁCULOS =====
+
+    def actualizar_obstaculos(self, agregados=(), eliminados=()):
+        """
+        Aplica cambios de obstáculos e invalida solo los resultados afectados
+
+        Args:
+            agregados: Celdas que pasan a ser obstáculo
+            eliminados: Celdas que dejan de ser obstáculo
+
+        Returns:
+            int: Número de resultados descartados
+        """
+        cambiadas = []
+        for celda in agregados:
+            if celda not in self.obstaculos:
+                self.obstaculos.add(celda)
+                self.mascara.cambiar_celda(celda, True)
+                cambiadas.append(celda)
+        for celda in eliminados:
+            if celda in self.obstaculos:
+                self.obstaculos.discard(celda)
+                self.mascara.cambiar_celda(celda, False)
+                cambiadas.append(celda)
+        if not cambiadas:
+            return 0
+
+        self.version += 1
+        afectadas = set(self._sin_region)
+        for fila, col in cambiadas:
+            afectadas.update(self._por_celda.get(fila * self.columnas + col, ()))
+        for clave in afectadas:
+            self._descartar(clave)
+        self.invalidaciones += len(afectadas)
+        return len(afectadas)
+
+    def limpiar(self):
+        """Descarta todos los resultados guardados"""
+        self._entradas.clear()
+        self._por_celda.clear()
+        self._sin_region.clear()
+
+    def __len__(self):
+        return len(self._entradas)
+
+    def obtener_estadisticas(self):
+        """
+        Obtiene estadísticas de uso de la caché
+
+        Returns:
+            dict: Diccionario con estadísticas
+        """
+        consultas = self.aciertos + self.fallos
+        return {
+            'entradas': len(self._entradas),
+            'capacidad': self.capacidad,
+            'version_obstaculos': self.version,
+            'aciertos': self.aciertos,
+            'fallos': self.fallos,
+            'tasa_aciertos': self.aciertos / consultas if consultas else 0.0,
+            'invalidaciones': self.invalidaciones,
+            'expulsiones': self.expulsiones
+        }
@@ -0,0 +1,187 @@
+"""
+Dijkstra completo sobre la cuadrícula
+
+Calcula la distancia exacta desde un origen a TODAS las celdas alcanzables,
+con las mismas reglas de movimiento que AlgoritmoAStar (máscara de vecinos
+con la restricción diagonal) y los mismos pesos que calcular_peso_movimiento.
+
+Como los movimientos son simétricos, la distancia desde el origen a una
+celda es también la distancia desde esa celda al origen.
+
+Para muchas consultas hacia el mismo fin, CampoDistancias guarda la
+distancia y el siguiente paso de todas las celdas:
+    campo = CampoDistancias(fin, filas, columnas, obstaculos, config_costos)
+    exito, camino = campo.camino(inicio)
+"""
+import heapq
+from array import array
+
+from mascara_vecinos import MOVIMIENTOS, MascaraVecinos
+
+INFINITO = float('inf')
+
+
+def dijkstra_indices(mascara, movimientos, origen):
+    """
+    Dijkstra desde una celda sobre índices planos
+
+    Args:
+        mascara: MascaraVecinos de la cuadrícula
+        movimientos: Tabla de MascaraVecinos.tabla_movimientos
+        origen: Índice plano de la celda de origen
+
+    Returns:
+        tuple: (distancias, padres, orden)
+               - distancias: array('d'), INFINITO en celdas inalcanzables
+               - padres: array('q') con el predecesor en el árbol de caminos
+                 mínimos (-1 en el origen y en celdas inalcanzables)
+               - orden: array('q') de celdas en orden de distancia creciente
+    """
+    total = mascara.filas * mascara.columnas
+    distancias = array('d', [INFINITO]) * total
+    padres = array('q', [-1]) * total
+    cerrado = bytearray(total)
+    orden = array('q')
+
+    distancias[origen] = 0.0
+    heap = [(0.0, origen)]
+    while heap:
+        distancia, actual = heapq.heappop(heap)
+        if cerrado[actual]:
+            continue
+        cerrado[actual] = 1
+        orden.append(actual)
+        for delta, peso in movimientos[mascara.mascara(actual)]:
+            vecino = actual + delta
+            nueva = distancia + peso
+            if nueva < distancias[vecino]:
+                distancias[vecino] = nueva
+                padres[vecino] = actual
+                heapq.heappush(heap, (nueva, vecino))
+
+    return distancias, padres, orden
+
+
+def dijkstra_completo(origen, filas, columnas, obstaculos, config_costos,
+                      permitir_diagonal=False, mascara=None):
+    """
+    Distancias exactas desde una celda a todas las demás
+
+    Args:
+        origen: Tupla (fila, col) de la celda de origen
+        filas: Número de filas de la cuadrícula
+        columnas: Número de columnas de la cuadrícula
+        obstaculos: Set de tuplas con posiciones bloqueadas
+        config_costos: Diccionario con 'horizontal', 'vertical', 'diagonal'
+        permitir_diagonal: Si True, permite movimientos en 8 direcciones
+        mascara: MascaraVecinos ya construida (opcional)
+
+    Returns:
+        tuple: (distancias, padres, orden) como en dijkstra_indices
+    """
+    if mascara is None:
+        mascara = MascaraVecinos(filas, columnas, obstaculos)
+    movimientos = mascara.tabla_movimientos(config_costos, permitir_diagonal)
+    return dijkstra_indices(mascara, movimientos, origen[0] * columnas + origen[1])
+
+
+# Código de "sin siguiente paso" en CampoDistancias.direcciones
+SIN_DIRECCION = 0xFF
+
+
+class CampoDistancias:
+    """
+    Distancia al objetivo y siguiente paso para TODAS las celdas
+
+    Se obtiene con un único Dijkstra inverso desde el objetivo. Después,
+    cualquier inicio obtiene su camino siguiendo el siguiente paso celda a
+    celda, en O(longitud del camino) y sin otra búsqueda.
+
+    El siguiente paso se guarda en un byte por celda: el número de
+    movimiento de mascara_vecinos.MOVIMIENTOS (SIN_DIRECCION si la celda no
+    alcanza el objetivo o es el objetivo).
+    """
+
+    def __init__(self, objetivo, filas, columnas, obstaculos, config_costos,
+                 permitir_diagonal=False, mascara=None):
+        """
+        Args:
+            objetivo: Tupla (fila, col) a la que llegan todos los caminos
+            filas: Número de filas de la cuadrícula
+            columnas: Número de columnas de la cuadrícula
+            obstaculos: Set de tuplas con posiciones bloqueadas
+            config_costos: Diccionario con 'horizontal', 'vertical', 'diagonal'
+            permitir_diagonal: Si True, permite movimientos en 8 direcciones
+            mascara: MascaraVecinos ya construida (opcional)
+        """
+        self.objetivo = objetivo
+        self.filas = filas
+        self.columnas = columnas
+        self.config_costos = config_costos
+        self.permitir_diagonal = permitir_diagonal
+
+        if mascara is None:
+            mascara = MascaraVecinos(filas, columnas, obstaculos)
+
+        # Los movimientos son simétricos: el padre de una celda en el árbol
+        # de Dijkstra desde el objetivo es su siguiente paso hacia él
+        if mascara.esta_bloqueada(objetivo):
+            # Como en AlgoritmoAStar, a un objetivo bloqueado no se llega
+            total = filas * columnas
+            self.distancias = array('d', [INFINITO]) * total
+            padres, orden = array('q', [-1]) * total, array('q')
+        else:
+            self.distancias, padres, orden = dijkstra_completo(
+                objetivo, filas, columnas, obstaculos, config_costos,
+                permitir_diagonal, mascara
+            )
+        self.celdas_alcanzables = len(orden)
+
+        codigo = {(df, dc): numero for numero, (df, dc, _) in enumerate(MOVIMIENTOS)}
+        self.direcciones = bytearray([SIN_DIRECCION]) * (filas * columnas)
+        for indice in orden:
+            padre = padres[indice]
+            if padre >= 0:
+                fila, col = divmod(indice, columnas)
+                fila_padre, col_padre = divmod(padre, columnas)
+                self.direcciones[indice] = codigo[fila_padre - fila, col_padre - col]
+
+    def _indice(self, nodo):
+        fila, col = nodo
+        if not (0 <= fila < self.filas and 0 <= col < self.columnas):
+            raise ValueError(f"Celda fuera de la cuadrícula: {nodo}")
+        return fila * self.columnas + col
+
+    def alcanzable(self, nodo):
+        """True si desde el nodo se puede llegar al objetivo"""
+        return self.distancias[self._indice(nodo)] != INFINITO
+
+    def distancia(self, nodo):
+        """Costo del camino mínimo desde el nodo al objetivo (INFINITO si no hay)"""
+        return self.distancias[self._indice(nodo)]
+
+    def siguiente_paso(self, nodo):
+        """Celda a la que moverse desde el nodo, o None (objetivo o inalcanzable)"""
+        direccion = self.direcciones[self._indice(nodo)]
+        if direccion == SIN_DIRECCION:
+            return None
+        df, dc, _ = MOVIMIENTOS[direccion]
+        return (nodo[0] + df, nodo[1] + dc)
+
+    def camino(self, inicio):
+        """
+        Camino desde el inicio hasta el objetivo siguiendo los siguientes pasos
+
+        Returns:
+            tuple: (exito, camino) con el camino sin inicio ni fin, igual que
+                   AlgoritmoAStar.ejecutar_completo
+        """
+        if not self.alcanzable(inicio):
+            return False, []
+
+        camino = []
+        actual = self.siguiente_paso(inicio)
+        while actual is not None and actual != self.objetivo:
+            camino.append(actual)
+            actual = self.siguiente_paso(actual)
+        return True, camino
@@ -0,0 +1,147 @@
+"""
+Campos heurísticos precalculados por objetivo
+
+Cuando muchas consultas comparten el mismo fin (muchos agentes hacia unas
+pocas metas), calcular H nodo a nodo repite el mismo trabajo en cada
+búsqueda. Un campo heurístico guarda H para TODAS las celdas de la
+cuadrícula, calculado en una sola pasada vectorizada con NumPy (o con un
+bucle de Python si NumPy no está instalado). El motor solo consulta el
+valor por índice.
+
+Los campos se guardan en una caché LRU por (objetivo, heurística, costos)
+y se calculan bajo demanda la primera vez que se piden.
+
+Uso:
+    campos = CacheCamposHeuristicos(filas, columnas)
+    for inicio, fin in consultas:
+        AlgoritmoAStar(inicio, fin, ..., campos=campos).ejecutar_completo()
+"""
+from array import array
+from collections import OrderedDict
+
+from funciones_astar import np, crear_heuristica, crear_heuristica_lote
+
+
+class CampoHeuristico:
+    """H de todas las celdas hacia un objetivo, indexado por índice plano"""
+
+    def __init__(self, filas, columnas, objetivo, tipo_heuristica, config_costos):
+        """
+        Args:
+            filas: Número de filas de la cuadrícula
+            columnas: Número de columnas de la cuadrícula
+            objetivo: Tupla (fila, col) del nodo objetivo
+            tipo_heuristica: 'manhattan', 'euclidiana', 'octile', 'chebyshev'
+            config_costos: Diccionario con 'horizontal', 'vertical', 'diagonal'
+        """
+        self.filas = filas
+        self.columnas = columnas
+        self.objetivo = objetivo
+        self.tipo_heuristica = tipo_heuristica
+        total = filas * columnas
+
+        if np is not None:
+            heuristica = crear_heuristica_lote(tipo_heuristica, objetivo,
+                                               config_costos, columnas)
+            self.arreglo = heuristica(np.arange(total)).astype(np.float64)
+            # array('d') para consultas escalares: indexarlo devuelve un float
+            # de Python, mucho más rápido que indexar el ndarray
+            self.valores = array('d', self.arreglo.tobytes())
+        else:
+            heuristica = crear_heuristica(tipo_heuristica, objetivo,
+                                          config_costos, columnas)
+            self.arreglo = None
+            self.valores = array('d', map(heuristica, range(total)))
+
+    def heuristica_indice(self):
+        """Función h(indice) -> float que solo consulta el campo"""
+        return self.valores.__getitem__
+
+    def heuristica_nodo(self):
+        """Función h((fila, col)) -> float que solo consulta el campo"""
+        valores = self.valores
+        columnas = self.columnas
+
+        def heuristica(nodo):
+            return valores[nodo[0] * columnas + nodo[1]]
+
+        return heuristica
+
+
+class CacheCamposHeuristicos:
+    """
+    Caché LRU de campos heurísticos para una cuadrícula de tamaño fijo.
+
+    Los campos no dependen de los obstáculos, así que la caché sigue siendo
+    válida cuando cambia el mapa mientras no cambien sus dimensiones.
+    """
+
+    def __init__(self, filas, columnas, capacidad=64):
+        """
+        Args:
+            filas: Número de filas de la cuadrícula
+            columnas: Número de columnas de la cuadrícula
+            capacidad: Máximo de campos guardados (se descarta el menos usado)
+        """
+        if capacidad < 1:
+            raise ValueError("La capacidad de la caché debe ser al menos 1")
+        self.filas = filas
+        self.columnas = columnas
+        self.capacidad = capacidad
+        self._campos = OrderedDict()
+        self.aciertos = 0
+        self.fallos = 0
+
+    def comprobar_dimensiones(self, filas, columnas):
+        """Lanza ValueError si la caché es de una cuadrícula de otro tamaño"""
+        if (filas, columnas) != (self.filas, self.columnas):
+            raise ValueError(
+                f"La caché de campos es de {self.filas}x{self.columnas}, "
+                f"no de {filas}x{columnas}"
+            )
+
+    @staticmethod
+    def clave(objetivo, tipo_heuristica, config_costos):
+        return (tuple(objetivo), tipo_heuristica,
+                config_costos['horizontal'], config_costos['vertical'],
+                config_costos['diagonal'])
+
+    def obtener(self, objetivo, tipo_heuristica, config_costos):
+        """
+        Campo heurístico hacia el objetivo; lo calcula si no está en la caché
+
+        Returns:
+            CampoHeuristico
+        """
+        clave = self.clave(objetivo, tipo_heuristica, config_costos)
+        campo = self._campos.get(clave)
+        if campo is not None:
+            self._campos.move_to_end(clave)
+            self.aciertos += 1
+            return campo
+
+        self.fallos += 1
+        campo = CampoHeuristico(self.filas, self.columnas, objetivo,
+                                tipo_heuristica, config_costos)
+        self._campos[clave] = campo
+        if len(self._campos) > self.capacidad:
+            self._campos.popitem(last=False)
+        return campo
+
+    def limpiar(self):
+        """Descarta todos los campos guardados"""
+        self._campos.clear()
+
+    def __len__(self):
+        return len(self._campos)
+
+    def __contains__(self, clave):
+        return clave in self._campos
+
+    def obtener_estadisticas(self):
+        return {
+            'campos': len(self._campos),
+            'capacidad': self.capacidad,
+            'aciertos': self.aciertos,
+            'fallos': self.fallos
+        }
@@ -0,0 +1,486 @@
+"""
+Colas de prioridad para la frontera (lista abierta) de A*
+
+Todas las colas guardan entradas (prioridad, desempate, nodo) y comparten
+la misma interfaz:
+
+- insertar(nodo, prioridad, desempate): agrega el nodo o mejora su prioridad
+- extraer(): quita y retorna la entrada con menor (prioridad, desempate)
+- tope(): consulta esa entrada sin quitarla
+- len(cola), bool(cola) e iteración sobre las entradas (sin orden)
+
+COLAS DISPONIBLES:
+- 'heapq':      heap de la librería estándar. Mejorar un nodo inserta una
+                entrada duplicada; la vieja queda "obsoleta" y el motor la
+                descarta al extraerla.
+- 'indexada':   heap binario con índice nodo -> posición. Mejorar un nodo
+                es un decrease-key en su lugar: nunca hay entradas obsoletas.
+- 'indexada4':  igual pero 4-ario (árbol más bajo, menos intercambios)
+- 'buckets':    cola de cubetas con costos escalados a enteros. Cada F se
+                multiplica por una escala (10 para los costos 1.0 / 1.4) y
+                cae en la cubeta de ese entero. Si la escala vuelve enteros
+                los costos, las cubetas son un arreglo circular indexado por
+                la clave (ColaBucketsCircular, O(1) por operación). Si no
+                (costos irracionales como sqrt(2) usan 10**6) el arreglo
+                tendría millones de cubetas vacías y se usan cubetas
+                dispersas con un heap de claves (ColaBuckets).
+"""
+import heapq
+import math
+from collections import deque
+
+
+class ColaHeapq:
+    """Frontera con heapq y entradas duplicadas (comportamiento original)"""
+
+    def __init__(self):
+        self._heap = []
+        self.inserciones = 0
+        self.tamano_maximo = 0
+
+    def insertar(self, nodo, prioridad, desempate):
+        heapq.heappush(self._heap, (prioridad, desempate, nodo))
+        self.inserciones += 1
+        if len(self._heap) > self.tamano_maximo:
+            self.tamano_maximo = len(self._heap)
+
+    def extraer(self):
+        return heapq.heappop(self._heap)
+
+    def tope(self):
+        return self._heap[0]
+
+    def __len__(self):
+        return len(self._heap)
+
+    def __iter__(self):
+        return iter(self._heap)
+
+
+class HeapIndexado:
+    """
+    Heap d-ario indexado con decrease-key.
+
+    Mantiene un diccionario nodo -> posición en el heap para poder mejorar
+    la prioridad de un nodo sin duplicarlo.
+    """
+
+    def __init__(self, aridad=2):
+        if aridad < 2:
+            raise ValueError("La aridad del heap debe ser al menos 2")
+        self.aridad = aridad
+        self._heap = []          # Entradas (prioridad, desempate, nodo)
+        self._posicion = {}      # nodo -> índice en _heap
+        self.inserciones = 0
+        self.actualizaciones = 0
+        self.tamano_maximo = 0
+
+    def insertar(self, nodo, prioridad, desempate):
+        """Inserta el nodo o actualiza su prioridad si ya está en la cola"""
+        entrada = (prioridad, desempate, nodo)
+        self.inserciones += 1
+
+        if nodo in self._posicion:
+            i = self._posicion[nodo]
+            anterior = self._heap[i]
+            self._heap[i] = entrada
+            self.actualizaciones += 1
+            if entrada < anterior:
+                self._subir(i)
+            else:
+                self._bajar(i)
+            return
+
+        self._heap.append(entrada)
+        self._posicion[nodo] = len(self._heap) - 1
+        self._subir(len(self._heap) - 1)
+        if len(self._heap) > self.tamano_maximo:
+            self.tamano_maximo = len(self._heap)
+
+    def extraer(self):
+        """Quita y retorna la entrada con menor prioridad"""
+        heap = self._heap
+        if not heap:
+            raise IndexError("extraer de una cola vacía")
+        primera = heap[0]
+        ultima = heap.pop()
+        del self._posicion[primera[2]]
+        if heap:
+            heap[0] = ultima
+            self._posicion[ultima[2]] = 0
+            self._bajar(0)
+        return primera
+
+    def tope(self):
+        return self._heap[0]
+
+    def eliminar(self, nodo):
+        """Quita un nodo de la cola (sin efecto si no está)"""
+        i = self._posicion.pop(nodo, None)
+        if i is None:
+            return
+        heap = self._heap
+        ultima = heap.pop()
+        if i < len(heap):
+            anterior = heap[i]
+            heap[i] = ultima
+            self._posicion[ultima[2]] = i
+            if ultima < anterior:
+                self._subir(i)
+            else:
+                self._bajar(i)
+
+    def __contains__(self, nodo):
+        return nodo in self._posicion
+
+    def __len__(self):
+        return len(self._heap)
+
+    def __iter__(self):
+        return iter(self._heap)
+
+    def _subir(self, i):
+        heap = self._heap
+        posicion = self._posicion
+        aridad = self.aridad
+        entrada = heap[i]
+        while i > 0:
+            padre = (i - 1) // aridad
+            if entrada < heap[padre]:
+                heap[i] = heap[padre]
+                posicion[heap[i][2]] = i
+                i = padre
+            else:
+                break
+        heap[i] = entrada
+        posicion[entrada[2]] = i
+
+    def _bajar(self, i):
+        heap = self._heap
+        posicion = self._posicion
+        aridad = self.aridad
+        total = len(heap)
+        entrada = heap[i]
+        while True:
+            primero = aridad * i + 1
+            if primero >= total:
+                break
+            # Hijo con menor prioridad
+            menor = primero
+            for hijo in range(primero + 1, min(primero + aridad, total)):
+                if heap[hijo] < heap[menor]:
+                    menor = hijo
+            if heap[menor] < entrada:
+                heap[i] = heap[menor]
+                posicion[heap[i][2]] = i
+                i = menor
+            else:
+                break
+        heap[i] = entrada
+        posicion[entrada[2]] = i
+
+
+def _valores_costo(config_costos):
+    """Costos de movimiento y el promedio que usan Manhattan y Euclidiana"""
+    return [config_costos['horizontal'], config_costos['vertical'],
+            config_costos['diagonal'],
+            (config_costos['horizontal'] + config_costos['vertical']) / 2]
+
+
+def _es_entero(valor, escala):
+    return abs(valor * escala - round(valor * escala)) < 1e-9
+
+
+def escala_entera(config_costos, max_decimales=6):
+    """
+    Menor potencia de 10 que vuelve enteros todos los costos
+
+    Incluye el promedio horizontal/vertical que usan las heurísticas
+    Manhattan y Euclidiana.
+
+    Args:
+        config_costos: Diccionario con 'horizontal', 'vertical', 'diagonal'
+        max_decimales: Límite de decimales a considerar
+
+    Returns:
+        int: Escala (1, 10, 100, ...). Si ninguna escala vuelve enteros
+             todos los costos (p. ej. diagonal = sqrt(2)) retorna
+             10 ** max_decimales
+    """
+    valores = _valores_costo(config_costos)
+    escala = 1
+    for _ in range(max_decimales):
+        if all(_es_entero(v, escala) for v in valores):
+            break
+        escala *= 10
+    return escala
+
+
+class ColaBuckets:
+    """
+    Cola de cubetas (bucket queue) con prioridades escaladas a enteros.
+
+    La cubeta de una entrada es floor(F * escala). Dentro de una cubeta las
+    entradas salen en orden de llegada, que coincide con el desempate por
+    contador de heapq: si todos los F son múltiplos de 1/escala el orden de
+    extracción es el de 'heapq' (salvo empates que heapq rompe por ruido de
+    punto flotante). Si no lo son (p. ej. heurística euclidiana o costos
+    irracionales como sqrt(2)), el error de orden queda acotado por 1/escala.
+
+    Las cubetas son DISPERSAS: un dict clave -> deque con solo las cubetas
+    no vacías y un heap con sus claves, así que cada operación que crea o
+    vacía una cubeta es O(log K) con K claves distintas. La memoria depende
+    de K, no de F * escala (con escala 10**6 una lista densa tendría
+    millones de cubetas vacías). crear_cola solo la usa cuando la escala
+    no vuelve enteros los costos; en otro caso usa ColaBucketsCircular.
+
+    Igual que 'heapq', mejorar un nodo agrega una entrada nueva y la vieja
+    queda obsoleta.
+    """
+
+    def __init__(self, escala=10):
+        self.escala = escala
+        self._buckets = {}       # Clave -> deque de (prioridad, desempate, nodo)
+        self._claves = []        # Heap de las claves con cubeta no vacía
+        self._total = 0
+        self.inserciones = 0
+        self.tamano_maximo = 0
+
+    def _clave(self, prioridad):
+        # El margen absorbe el ruido de punto flotante (1.4 * 3 = 4.199999...)
+        return max(0, math.floor(prioridad * self.escala + 1e-6))
+
+    def insertar(self, nodo, prioridad, desempate):
+        clave = self._clave(prioridad)
+        bucket = self._buckets.get(clave)
+        if bucket is None:
+            bucket = self._buckets[clave] = deque()
+            heapq.heappush(self._claves, clave)
+        bucket.append((prioridad, desempate, nodo))
+        self._total += 1
+        self.inserciones += 1
+        if self._total > self.tamano_maximo:
+            self.tamano_maximo = self._total
+
+    def extraer(self):
+        if not self._total:
+            raise IndexError("extraer de una cola vacía")
+        clave = self._claves[0]
+        bucket = self._buckets[clave]
+        entrada = bucket.popleft()
+        if not bucket:
+            del self._buckets[clave]
+            heapq.heappop(self._claves)
+        self._total -= 1
+        return entrada
+
+    def tope(self):
+        if not self._total:
+            raise IndexError("tope de una cola vacía")
+        return self._buckets[self._claves[0]][0]
+
+    def __len__(self):
+        return self._total
+
+    def __iter__(self):
+        for bucket in self._buckets.values():
+            yield from bucket
+
+
+class ColaBucketsCircular:
+    """
+    Cola de cubetas en un arreglo circular (cola de Dial) para costos enteros.
+
+    La clave de una entrada es floor(F * escala), como en ColaBuckets, y su
+    cubeta es la posición clave % tamano de un arreglo de deques. Con una
+    heurística consistente F nunca baja y las claves en la frontera caben en
+    una ventana [base, base + tamano) de ancho ~2 * costo máximo * escala:
+    insertar es O(1) y extraer avanza base sobre las cubetas vacías, con un
+    recorrido total acotado por la clave final.
+
+    Si una clave cae fuera de la ventana (heurísticas inconsistentes,
+    ARA* con épsilon, F anteriores a base) el arreglo se agranda al doble
+    del rango necesario y se redistribuyen las entradas: nunca se pierde
+    orden, solo se paga una reconstrucción amortizada.
+
+    Igual que 'heapq', mejorar un nodo agrega una entrada nueva y la vieja
+    queda obsoleta.
+    """
+
+    def __init__(self, escala=10, tamano=64):
+        self.escala = escala
+        self._tamano = 1 << max(0, tamano - 1).bit_length()   # Potencia de 2
+        self._cubetas = [deque() for _ in range(self._tamano)]
+        self._base = 0           # Menor clave que puede tener entradas
+        self._maxima = 0         # Cota superior de las claves en la cola
+        self._total = 0
+        self.inserciones = 0
+        self.tamano_maximo = 0
+        self.reconstrucciones = 0
+
+    def _clave(self, prioridad):
+        # Mismo margen que ColaBuckets para el ruido de punto flotante
+        return max(0, math.floor(prioridad * self.escala + 1e-6))
+
+    def _reconstruir(self, clave):
+        """Agranda el arreglo para cubrir las claves actuales y la nueva"""
+        # Cada cubeta tiene una sola clave: recorrerlas en orden y agregar al
+        # final conserva el orden de llegada dentro de cada clave
+        entradas = [(self._clave(entrada[0]), entrada)
+                    for cubeta in self._cubetas for entrada in cubeta]
+        minima = min([clave] + [c for c, _ in entradas])
+        maxima = max([clave] + [c for c, _ in entradas])
+        tamano = self._tamano
+        while tamano <= 2 * (maxima - minima):
+            tamano <<= 1
+        self._tamano = tamano
+        self._cubetas = [deque() for _ in range(tamano)]
+        mascara = tamano - 1
+        for c, entrada in entradas:
+            self._cubetas[c & mascara].append(entrada)
+        self._base, self._maxima = minima, maxima
+        self.reconstrucciones += 1
+
+    def insertar(self, nodo, prioridad, desempate):
+        clave = math.floor(prioridad * self.escala + 1e-6)
+        if clave < 0:
+            clave = 0
+        if not self._total:
+            self._base = self._maxima = clave
+        elif clave > self._maxima:
+            if clave - self._base >= self._tamano:
+                self._reconstruir(clave)
+            self._maxima = clave
+        elif clave < self._base:
+            if self._maxima - clave >= self._tamano:
+                self._reconstruir(clave)
+            self._base = clave
+        self._cubetas[clave & (self._tamano - 1)].append((prioridad, desempate, nodo))
+        self._total += 1
+        self.inserciones += 1
+        if self._total > self.tamano_maximo:
+            self.tamano_maximo = self._total
+
+    def _primera(self):
+        """Cubeta no vacía de menor clave (avanza base hasta ella)"""
+        cubetas = self._cubetas
+        mascara = self._tamano - 1
+        base = self._base
+        while not cubetas[base & mascara]:
+            base += 1
+        self._base = base
+        return cubetas[base & mascara]
+
+    def extraer(self):
+        if not self._total:
+            raise IndexError("extraer de una cola vacía")
+        cubetas = self._cubetas
+        mascara = self._tamano - 1
+        base = self._base
+        while not cubetas[base & mascara]:
+            base += 1
+        self._base = base
+        self._total -= 1
+        return cubetas[base & mascara].popleft()
+
+    def tope(self):
+        if not self._total:
+            raise IndexError("tope de una cola vacía")
+        return self._primera()[0]
+
+    def __len__(self):
+        return self._total
+
+    def __iter__(self):
+        for cubeta in self._cubetas:
+            yield from cubeta
+
+
+# Ventana inicial máxima del arreglo circular; con costos que piden más
+# cubetas (escalas grandes) se usan las dispersas
+_CUBETAS_CIRCULARES = 1 << 12
+
+
+def _crear_buckets(config_costos):
+    """Arreglo circular si la escala vuelve enteros los costos, si no dispersa"""
+    if not config_costos:
+        return ColaBucketsCircular(10)
+    escala = escala_entera(config_costos)
+    valores = _valores_costo(config_costos)
+    ventana = 4 * math.ceil(max(valores) * escala)       # Holgura sobre 2 * costo
+    if all(_es_entero(v, escala) for v in valores) and ventana <= _CUBETAS_CIRCULARES:
+        return ColaBucketsCircular(escala, ventana)
+    return ColaBuckets(escala)
+
+
+# Tipo de cola -> fábrica (recibe config_costos)
+COLAS = {
+    'heapq': lambda config_costos: ColaHeapq(),
+    'indexada': lambda config_costos: HeapIndexado(aridad=2),
+    'indexada4': lambda config_costos: HeapIndexado(aridad=4),
+    'buckets': _crear_buckets,
+}
+
+
+def crear_cola(tipo='heapq', config_costos=None):
+    """
+    Crea una cola de prioridad vacía para la frontera
+
+    Args:
+        tipo: Clave de COLAS ('heapq', 'indexada', 'indexada4', 'buckets')
+        config_costos: Costos de movimiento (la cola 'buckets' los usa para
+                       elegir la escala entera)
+
+    Returns:
+        Cola con la interfaz insertar / extraer / tope
+    """
+    if tipo not in COLAS:
+        raise ValueError(
+            f"Cola desconocida: {tipo!r}. Opciones: {', '.join(COLAS)}"
+        )
+    return COLAS[tipo](config_costos)
+
+
+# ============== FUNCIÓN DE PRUEBA ==============
+def test_colas():
+    """
+    Compara todas las colas con 'heapq' en una cuadrícula vacía: con costos
+    1.0 / 1.4 'buckets' usa el arreglo circular y con diagonal sqrt(2)
+    (escala 10**6) las cubetas dispersas
+    """
+    import time
+    from algoritmo_astar import AlgoritmoAStar
+
+    configuraciones = {
+        '1.0 / 1.4': {'horizontal': 1.0, 'vertical': 1.0, 'diagonal': 1.4},
+        '1.0 / sqrt(2)': {'horizontal': 1.0, 'vertical': 1.0, 'diagonal': math.sqrt(2)},
+    }
+    filas = columnas = 200
+    inicio, fin = (0, 0), (filas - 1, columnas // 2)
+
+    print("=" * 70)
+    print("PRUEBA DE LAS COLAS DE PRIORIDAD")
+    print("=" * 70)
+    for nombre, config_costos in configuraciones.items():
+        print(f"\nCostos {nombre} (escala de 'buckets': {escala_entera(config_costos)}, "
+              f"{type(crear_cola('buckets', config_costos)).__name__})")
+        referencia = None
+        for tipo in COLAS:
+            algoritmo = AlgoritmoAStar(inicio, fin, filas, columnas, set(),
+                                       config_costos, permitir_diagonal=True,
+                                       tipo_heuristica='octile', cola=tipo)
+            comienzo = time.perf_counter()
+            exito, _, nodos, _ = algoritmo.ejecutar_completo()
+            tiempo = time.perf_counter() - comienzo
+            costo = algoritmo.costo_g[fin]
+            if referencia is None:
+                referencia = costo
+            estado = "✅" if exito and abs(costo - referencia) < 1e-9 else "❌"
+            print(f"  {estado} {tipo:<10} costo={costo:.4f} nodos={nodos:<6} "
+                  f"{tiempo * 1000:8.1f} ms")
+
+    print("\n" + "=" * 70)
+
+
+if __name__ == "__main__":
+    test_colas()
@@ -0,0 +1,409 @@
+"""
+Componentes conexas de las celdas libres
+
+Si el inicio y el fin están en componentes distintas no hay camino, pero
+A* solo lo descubre después de vaciar toda la frontera (en un mapa grande,
+la consulta más lenta de todas). Con una etiqueta de componente por celda
+la respuesta es O(1):
+
+    componentes = ComponentesConexas(filas, columnas, obstaculos)
+    componentes.conectados(inicio, fin)          # False -> no hay camino
+    AlgoritmoAStar(..., componentes=componentes)  # termina en el primer paso
+
+Las etiquetas se calculan con un recorrido por componente sobre la máscara
+de vecinos, así que siguen exactamente las reglas de movimiento de los
+motores. La regla diagonal (ambas celdas adyacentes libres) implica que
+toda diagonal permitida también se puede hacer con dos pasos rectos: con o
+sin permitir_diagonal las componentes son las mismas.
+
+EtiquetasComponentes responde las mismas consultas sobre etiquetas ya
+calculadas (por ejemplo, en memoria compartida entre procesos) sin
+copiarlas; etiquetas_compactas() las pasa al tipo entero más pequeño.
+
+ACTUALIZACIÓN INCREMENTAL:
+- Liberar una celda solo puede UNIR las componentes de sus vecinas: se
+  reetiquetan las más pequeñas con la etiqueta de la mayor.
+- Bloquear una celda solo puede cambiar la conexión entre sus 8 vecinas.
+  Si siguen conectadas entre ellas sin salir del anillo 3x3, nada cambia
+  (el caso habitual); si no, se recorre a la vez desde cada grupo de
+  vecinas hasta que solo uno sigue creciendo, y se reetiquetan las partes
+  que quedaron aisladas (las pequeñas).
+"""
+from array import array
+
+from mapa_bits import MapaBits
+from mascara_vecinos import MascaraVecinos
+
+# Sin componente (celda bloqueada o fuera de la cuadrícula)
+SIN_COMPONENTE = -1
+
+# Las etiquetas solo necesitan los desplazamientos, no los pesos
+_COSTOS_UNITARIOS = {'horizontal': 1, 'vertical': 1, 'diagonal': 1}
+
+# Tipos de array con signo, de menor a mayor (SIN_COMPONENTE es -1)
+_TIPOS_ETIQUETA = ('b', 'h', 'i', 'q')
+
+
+class EtiquetasComponentes:
+    """Consultas O(1) sobre una etiqueta de componente por celda ya calculada"""
+
+    def __init__(self, filas, columnas, etiquetas, total):
+        """
+        Args:
+            filas: Número de filas de la cuadrícula
+            columnas: Número de columnas de la cuadrícula
+            etiquetas: Secuencia de enteros de filas * columnas (array o
+                       memoryview; se usa sin copiar) con SIN_COMPONENTE en
+                       las celdas bloqueadas
+            total: Número de componentes
+        """
+        if len(etiquetas) != filas * columnas:
+            raise ValueError(
+                f"Se esperaban {filas * columnas} etiquetas y hay {len(etiquetas)}"
+            )
+        self.filas = filas
+        self.columnas = columnas
+        self.etiquetas = etiquetas
+        self.total = total
+
+    def _indice(self, nodo):
+        fila, col = nodo
+        if 0 <= fila < self.filas and 0 <= col < self.columnas:
+            return fila * self.columnas + col
+        return None
+
+    def componente(self, nodo):
+        """Etiqueta de la componente del nodo (SIN_COMPONENTE si está bloqueado)"""
+        indice = self._indice(nodo)
+        return SIN_COMPONENTE if indice is None else self.etiquetas[indice]
+
+    def conectados(self, inicio, fin):
+        """
+        True si puede haber un camino de inicio a fin (O(1))
+
+        Igual que los motores, un nodo siempre está conectado consigo mismo.
+        """
+        if inicio == fin:
+            return True
+        etiqueta = self.componente(inicio)
+        return etiqueta != SIN_COMPONENTE and etiqueta == self.componente(fin)
+
+    def comprobar_dimensiones(self, filas, columnas):
+        """Lanza ValueError si las etiquetas son de otra cuadrícula"""
+        if (filas, columnas) != (self.filas, self.columnas):
+            raise ValueError(
+                f"Componentes de {self.filas}x{self.columnas} usadas en una "
+                f"cuadrícula de {filas}x{columnas}"
+            )
+
+    def __len__(self):
+        return self.total
+
+
+class ComponentesConexas(EtiquetasComponentes):
+    """Etiqueta de componente conexa por celda, con actualización incremental"""
+
+    def __init__(self, filas, columnas, obstaculos, permitir_diagonal=False,
+                 mascara=None):
+        """
+        Args:
+            filas: Número de filas de la cuadrícula
+            columnas: Número de columnas de la cuadrícula
+            obstaculos: Set de tuplas con posiciones bloqueadas o MapaBits
+                        (se copia)
+            permitir_diagonal: Si True, también une por movimientos diagonales
+            mascara: MascaraVecinos de estos obstáculos; se modifica en
+                     actualizar_obstaculos
+        """
+        self.filas = filas
+        self.columnas = columnas
+        if isinstance(obstaculos, MapaBits):
+            self.obstaculos = obstaculos.copy()
+        else:
+            self.obstaculos = set(obstaculos)
+        self.permitir_diagonal = permitir_diagonal
+
+        if mascara is None:
+            mascara = MascaraVecinos(filas, columnas, self.obstaculos)
+        self.mascara = mascara
+        self._desplazamientos = [
+            tuple(delta for delta, _ in movimientos)
+            for movimientos in mascara.tabla_movimientos(_COSTOS_UNITARIOS,
+                                                         permitir_diagonal)
+        ]
+
+        self.etiquetas = array('q', [SIN_COMPONENTE]) * (filas * columnas)
+        self.tamanos = {}               # etiqueta -> número de celdas
+        self._siguiente_etiqueta = 0
+
+        # Estadísticas
+        self.uniones = 0
+        self.divisiones = 0
+        self.celdas_reetiquetadas = 0
+
+        self._etiquetar_todo()
+
+    # ===== ETIQUETADO =====
+
+    def _nueva_etiqueta(self):
+        etiqueta = self._siguiente_etiqueta
+        self._siguiente_etiqueta += 1
+        return etiqueta
+
+    def _inundar(self, origen, etiqueta, solo=None):
+        """
+        Pone la etiqueta a todas las celdas alcanzables desde origen
+
+        Args:
+            origen: Índice plano de una celda libre
+            etiqueta: Etiqueta a asignar
+            solo: Si se indica, solo atraviesa celdas con esa etiqueta
+
+        Returns:
+            int: Celdas etiquetadas
+        """
+        etiquetas = self.etiquetas
+        desplazamientos = self._desplazamientos
+        mascara = self.mascara.mascara
+
+        etiquetas[origen] = etiqueta
+        pila = [origen]
+        total = 1
+        while pila:
+            actual = pila.pop()
+            for delta in desplazamientos[mascara(actual)]:
+                vecino = actual + delta
+                valor = etiquetas[vecino]
+                if valor == etiqueta:
+                    continue
+                if solo is None and valor != SIN_COMPONENTE:
+                    continue
+                if solo is not None and valor != solo:
+                    continue
+                etiquetas[vecino] = etiqueta
+                pila.append(vecino)
+                total += 1
+        return total
+
+    def _etiquetar_todo(self):
+        bloqueado = self.mascara.bloqueado
+        etiquetas = self.etiquetas
+        for indice in range(len(etiquetas)):
+            if not bloqueado[indice] and etiquetas[indice] == SIN_COMPONENTE:
+                etiqueta = self._nueva_etiqueta()
+                self.tamanos[etiqueta] = self._inundar(indice, etiqueta)
+
+    # ===== CONSULTAS =====
+
+    @property
+    def total(self):
+        return len(self.tamanos)
+
+    def etiquetas_compactas(self):
+        """
+        Copia de las etiquetas en el tipo entero con signo más pequeño
+
+        Las etiquetas se renumeran de 0 a total - 1 (las actualizaciones
+        dejan huecos), así que un mapa con hasta 32768 componentes ocupa
+        2 bytes por celda en lugar de 8.
+
+        Returns:
+            array: Etiquetas (SIN_COMPONENTE en las celdas bloqueadas)
+        """
+        renumeradas = {etiqueta: nueva for nueva, etiqueta in enumerate(sorted(self.tamanos))}
+        renumeradas[SIN_COMPONENTE] = SIN_COMPONENTE
+        for tipo in _TIPOS_ETIQUETA:
+            if len(self.tamanos) <= 1 << (8 * array(tipo).itemsize - 1):
+                break
+        if all(etiqueta == nueva for etiqueta, nueva in renumeradas.items()):
+            return array(tipo, self.etiquetas)
+        return array(tipo, map(renumeradas.__getitem__, self.etiquetas))
+
+    # ===== CAMBIOS DE OBSTÁCULOS =====
+
+    def _liberar(self, indice):
+        """La celda pasa a estar libre: une las componentes de sus vecinas"""
+        etiquetas = self.etiquetas
+        semillas = {}                   # etiqueta vecina -> una celda suya
+        for delta in self._desplazamientos[self.mascara.mascara(indice)]:
+            semillas.setdefault(etiquetas[indice + delta], indice + delta)
+
+        if not semillas:
+            etiqueta = self._nueva_etiqueta()
+            etiquetas[indice] = etiqueta
+            self.tamanos[etiqueta] = 1
+            return
+
+        # Se conserva la etiqueta de la componente más grande
+        mayor = max(semillas, key=self.tamanos.__getitem__)
+        etiquetas[indice] = mayor
+        self.tamanos[mayor] += 1
+        for etiqueta, semilla in semillas.items():
+            if etiqueta != mayor:
+                reetiquetadas = self._inundar(semilla, mayor, solo=etiqueta)
+                self.tamanos[mayor] += reetiquetadas
+                del self.tamanos[etiqueta]
+                self.celdas_reetiquetadas += reetiquetadas
+                self.uniones += 1
+
+    def _bloquear(self, indice, vecinas):
+        """
+        La celda pasa a estar bloqueada: comprueba si su componente se parte
+
+        Args:
+            indice: Índice plano de la celda
+            vecinas: Índices de las celdas libres que eran vecinas suyas
+        """
+        etiquetas = self.etiquetas
+        etiqueta = etiquetas[indice]
+        etiquetas[indice] = SIN_COMPONENTE
+        self.tamanos[etiqueta] -= 1
+        if not vecinas:
+            del self.tamanos[etiqueta]
+            return
+
+        # Grupos de vecinas conectadas sin salir del anillo 3x3
+        anillo = set()
+        fila, col = divmod(indice, self.columnas)
+        for f in range(max(fila - 1, 0), min(fila + 2, self.filas)):
+            for c in range(max(col - 1, 0), min(col + 2, self.columnas)):
+                anillo.add(f * self.columnas + c)
+        anillo.discard(indice)
+
+        desplazamientos = self._desplazamientos
+        mascara = self.mascara.mascara
+        semillas = []
+        alcanzadas = set()
+        for vecina in vecinas:
+            if vecina in alcanzadas:
+                continue
+            semillas.append(vecina)
+            alcanzadas.add(vecina)
+            pila = [vecina]
+            while pila:
+                actual = pila.pop()
+                for delta in desplazamientos[mascara(actual)]:
+                    vecino = actual + delta
+                    if vecino in anillo and vecino not in alcanzadas:
+                        alcanzadas.add(vecino)
+                        pila.append(vecino)
+        if len(semillas) == 1:
+            return
+
+        partes = self._separar(semillas)
+        if partes:
+            self.divisiones += 1
+        for celdas in partes:
+            nueva = self._nueva_etiqueta()
+            for celda in celdas:
+                etiquetas[celda] = nueva
+            self.tamanos[nueva] = len(celdas)
+            self.tamanos[etiqueta] -= len(celdas)
+            self.celdas_reetiquetadas += len(celdas)
+
+    def _separar(self, semillas):
+        """
+        Busca las partes en que quedó dividida una componente
+
+        Hace crecer a la vez un recorrido desde cada semilla, un nodo por
+        turno. Los recorridos que se encuentran se fusionan; uno que se
+        agota antes de encontrarse con otro es una componente nueva. Se
+        para cuando queda un solo recorrido activo, así que el costo es
+        proporcional a las partes PEQUEÑAS, no a la componente entera.
+
+        Returns:
+            list: Conjuntos de índices de las partes separadas; la parte
+                  restante conserva la etiqueta original
+        """
+        desplazamientos = self._desplazamientos
+        mascara = self.mascara.mascara
+        grupo = list(range(len(semillas)))      # Unión de recorridos fusionados
+
+        def raiz(i):
+            while grupo[i] != i:
+                i = grupo[i]
+            return i
+
+        dueno = {semilla: i for i, semilla in enumerate(semillas)}
+        pilas = [[semilla] for semilla in semillas]
+        activos = list(range(len(semillas)))
+        agotados = []
+        while len(activos) > 1:
+            for i in list(activos):
+                if i not in activos:
+                    continue
+                if not pilas[i]:
+                    activos.remove(i)
+                    agotados.append(i)
+                    continue
+                actual = pilas[i].pop()
+                for delta in desplazamientos[mascara(actual)]:
+                    vecino = actual + delta
+                    otro = dueno.get(vecino)
+                    if otro is None:
+                        dueno[vecino] = i
+                        pilas[i].append(vecino)
+                    else:
+                        otro = raiz(otro)
+                        if otro != i:
+                            # Se encontraron: el recorrido otro pasa a ser i
+                            grupo[otro] = i
+                            pilas[i].extend(pilas[otro])
+                            pilas[otro] = []
+                            activos.remove(otro)
+        partes = {i: set() for i in agotados}
+        for celda, i in dueno.items():
+            i = raiz(i)
+            if i in partes:
+                partes[i].add(celda)
+        partes = list(partes.values())
+        if not activos:
+            # Se agotaron todos en la misma vuelta: la mayor conserva la etiqueta
+            partes.remove(max(partes, key=len))
+        return partes
+
+    def actualizar_obstaculos(self, agregados=(), eliminados=()):
+        """
+        Aplica cambios de obstáculos y actualiza las etiquetas
+
+        Args:
+            agregados: Celdas que pasan a ser obstáculo
+            eliminados: Celdas que dejan de ser obstáculo
+
+        Returns:
+            set: Celdas que realmente cambiaron
+        """
+        cambiadas = set()
+        columnas = self.columnas
+        for celda in agregados:
+            if celda not in self.obstaculos and self._indice(celda) is not None:
+                indice = celda[0] * columnas + celda[1]
+                vecinas = [indice + delta for delta in
+                           self._desplazamientos[self.mascara.mascara(indice)]]
+                self.obstaculos.add(celda)
+                self.mascara.cambiar_celda(celda, True)
+                self._bloquear(indice, vecinas)
+                cambiadas.add(celda)
+        for celda in eliminados:
+            if celda in self.obstaculos:
+                self.obstaculos.discard(celda)
+                self.mascara.cambiar_celda(celda, False)
+                self._liberar(celda[0] * columnas + celda[1])
+                cambiadas.add(celda)
+        return cambiadas
+
+    def obtener_estadisticas(self):
+        """
+        Obtiene estadísticas de las componentes
+
+        Returns:
+            dict: Diccionario con estadísticas
+        """
+        return {
+            'componentes': len(self.tamanos),
+            'celdas_libres': sum(self.tamanos.values()),
+            'componente_mayor': max(self.tamanos.values(), default=0),
+            'uniones': self.uniones,
+            'divisiones': self.divisiones,
+            'celdas_reetiquetadas': self.celdas_reetiquetadas
+        }
@@ -0,0 +1,7 @@
+"""
+Configuración de pytest
+
+test_imports.py es un script de diagnóstico (lee de la entrada estándar al
+importarse), no un módulo de pruebas.
+"""
+collect_ignore = ['test_imports.py']
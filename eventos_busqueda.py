@@ -0,0 +1,254 @@
+"""
+Flujo de eventos de la búsqueda
+
+ejecutar_paso devuelve (actual, vecinos, encontrado) y quien lo consume
+(la interfaz, un grabador, un perfilador) vuelve a leer costo_g, costo_h
+y costo_f para cada vecino. iterar_eventos() es la alternativa en forma de
+generador: cada evento ya lleva G, H y F:
+
+    for evento in algoritmo.iterar_eventos():
+        if evento.tipo == GENERAR:
+            dibujar(evento.nodo, evento.g, evento.h, evento.f)
+
+TIPOS DE EVENTO (evento.tipo):
+- EXPANDIR:    un nodo sale de la frontera y se cierra
+- GENERAR:     un vecino se alcanza por primera vez
+- ACTUALIZAR:  un vecino ya alcanzado mejora su G
+- ENCONTRADO:  el nodo expandido es el fin (último evento)
+- AGOTADO:     la frontera se vació sin llegar al fin (último evento)
+
+Cada Evento es una TUPLA (tipo, nodo, g, h, f, padre) con __slots__ vacío:
+no tiene __dict__ y se crea con tuple.__new__, así que millones de eventos
+cuestan lo mismo que millones de tuplas. En AGOTADO los demás campos son
+None.
+
+Los eventos de un paso llegan juntos al terminar el paso: EXPANDIR y a
+continuación sus GENERAR/ACTUALIZAR. Al recibir EXPANDIR el algoritmo ya
+está en el mismo estado que tras ejecutar_paso (frontera y cerrado
+incluyen el paso completo), así que se pueden leer las listas en ese
+momento; pedir el siguiente EXPANDIR ejecuta el paso siguiente.
+
+Los motores de diccionarios y de arreglos generan los eventos dentro de su
+propio bucle; el resto los obtiene de ejecutar_paso con
+eventos_desde_pasos (mismo flujo, con las lecturas de costo_* de antes).
+
+GrabadorEventos guarda un flujo (mientras se consume) y lo reproduce o lo
+escribe en un archivo binario compacto.
+"""
+import struct
+import sys
+from array import array
+from operator import itemgetter
+
+# Tipos de evento
+EXPANDIR, GENERAR, ACTUALIZAR, ENCONTRADO, AGOTADO = range(5)
+NOMBRES_EVENTOS = ('expandir', 'generar', 'actualizar', 'encontrado', 'agotado')
+
+# Constructor sin pasar por __new__ de Python (bucles calientes)
+_nuevo = tuple.__new__
+
+
+class Evento(tuple):
+    """Evento de la búsqueda: tupla (tipo, nodo, g, h, f, padre)"""
+
+    __slots__ = ()
+
+    def __new__(cls, tipo, nodo=None, g=None, h=None, f=None, padre=None):
+        return _nuevo(cls, (tipo, nodo, g, h, f, padre))
+
+    tipo = property(itemgetter(0))
+    nodo = property(itemgetter(1))
+    g = property(itemgetter(2))
+    h = property(itemgetter(3))
+    f = property(itemgetter(4))
+    padre = property(itemgetter(5))
+
+    @property
+    def nombre(self):
+        return NOMBRES_EVENTOS[self[0]]
+
+    def __repr__(self):
+        tipo, nodo, g, h, f, padre = self
+        if tipo == AGOTADO:
+            return "Evento(agotado)"
+        return f"Evento({NOMBRES_EVENTOS[tipo]}, {nodo}, g={g}, h={h}, f={f}, padre={padre})"
+
+
+def evento(tipo, nodo, g, h, f, padre):
+    """Crea un Evento sin validar (la forma rápida para los motores)"""
+    return _nuevo(Evento, (tipo, nodo, g, h, f, padre))
+
+
+_AGOTADO = evento(AGOTADO, None, None, None, None, None)
+
+
+def evento_agotado():
+    """Evento final de una búsqueda sin camino"""
+    return _AGOTADO
+
+
+def eventos_desde_pasos(algoritmo):
+    """
+    Eventos de cualquier motor a partir de ejecutar_paso
+
+    Un vecino que ya apareció en el flujo se informa como ACTUALIZAR.
+
+    Yields:
+        Evento
+    """
+    costo_g, costo_h, costo_f = algoritmo.costo_g, algoritmo.costo_h, algoritmo.costo_f
+    vistos = {algoritmo.inicio}
+    while True:
+        actual, vecinos, encontrado = algoritmo.ejecutar_paso()
+        if actual is None:
+            yield _AGOTADO
+            return
+        # Algunos motores reemplazan sus dicts de costos al terminar
+        costo_g, costo_h, costo_f = algoritmo.costo_g, algoritmo.costo_h, algoritmo.costo_f
+        padre = algoritmo.vino_de.get(actual)
+        datos = (actual, costo_g.get(actual), costo_h.get(actual), costo_f.get(actual), padre)
+        yield evento(EXPANDIR, *datos)
+        if encontrado:
+            yield evento(ENCONTRADO, *datos)
+            return
+        for vecino in vecinos:
+            if vecino in vistos:
+                tipo = ACTUALIZAR
+            else:
+                tipo = GENERAR
+                vistos.add(vecino)
+            yield evento(tipo, vecino, costo_g[vecino], costo_h[vecino],
+                         costo_f[vecino], actual)
+
+
+# ===== GRABACIÓN =====
+
+_FIRMA = b'EVT1'
+_CABECERA = struct.Struct('<4sQ')
+
+# Sin nodo / sin padre en los arreglos de coordenadas
+_SIN_NODO = -1
+
+
+class GrabadorEventos:
+    """
+    Graba un flujo de eventos en arreglos planos y lo reproduce
+
+    Cada evento ocupa 1 + 4 * 4 + 3 * 8 = 41 bytes (tipo, fila, col,
+    fila_padre, col_padre, g, h, f), sin objetos por evento.
+
+    Uso:
+        grabador = GrabadorEventos()
+        for evento in grabador.grabar(algoritmo.iterar_eventos()):
+            ...                              # el flujo sigue llegando
+        grabador.guardar('busqueda.evt')
+        for evento in GrabadorEventos.cargar('busqueda.evt').reproducir():
+            ...
+    """
+
+    def __init__(self):
+        self.tipos = bytearray()
+        self.filas = array('i')
+        self.columnas = array('i')
+        self.filas_padre = array('i')
+        self.columnas_padre = array('i')
+        self.g = array('d')
+        self.h = array('d')
+        self.f = array('d')
+
+    def __len__(self):
+        return len(self.tipos)
+
+    def agregar(self, actual):
+        """Graba un evento"""
+        tipo, nodo, g, h, f, padre = actual
+        self.tipos.append(tipo)
+        if nodo is None:
+            self.filas.append(_SIN_NODO)
+            self.columnas.append(_SIN_NODO)
+        else:
+            self.filas.append(nodo[0])
+            self.columnas.append(nodo[1])
+        if padre is None:
+            self.filas_padre.append(_SIN_NODO)
+            self.columnas_padre.append(_SIN_NODO)
+        else:
+            self.filas_padre.append(padre[0])
+            self.columnas_padre.append(padre[1])
+        nan = float('nan')
+        self.g.append(nan if g is None else g)
+        self.h.append(nan if h is None else h)
+        self.f.append(nan if f is None else f)
+
+    def grabar(self, eventos):
+        """
+        Graba los eventos a medida que pasan
+
+        Yields:
+            Evento: Los mismos eventos, sin cambios
+        """
+        agregar = self.agregar
+        for actual in eventos:
+            agregar(actual)
+            yield actual
+
+    def reproducir(self):
+        """
+        Reproduce los eventos grabados
+
+        Yields:
+            Evento
+        """
+        for i in range(len(self.tipos)):
+            tipo = self.tipos[i]
+            if tipo == AGOTADO:
+                yield _AGOTADO
+                continue
+            padre = None
+            if self.filas_padre[i] != _SIN_NODO:
+                padre = (self.filas_padre[i], self.columnas_padre[i])
+            yield evento(tipo, (self.filas[i], self.columnas[i]),
+                         self.g[i], self.h[i], self.f[i], padre)
+
+    def _arreglos(self):
+        return (self.filas, self.columnas, self.filas_padre, self.columnas_padre,
+                self.g, self.h, self.f)
+
+    def guardar(self, ruta):
+        """Guarda la grabación: cabecera fija y los arreglos en little-endian"""
+        with open(ruta, 'wb') as archivo:
+            archivo.write(_CABECERA.pack(_FIRMA, len(self.tipos)))
+            archivo.write(self.tipos)
+            for bloque in self._arreglos():
+                if sys.byteorder == 'big':
+                    bloque = array(bloque.typecode, bloque)
+                    bloque.byteswap()
+                bloque.tofile(archivo)
+
+    @classmethod
+    def cargar(cls, ruta):
+        """
+        Carga una grabación guardada con guardar()
+
+        Returns:
+            GrabadorEventos
+        """
+        grabador = cls()
+        with open(ruta, 'rb') as archivo:
+            datos = archivo.read(_CABECERA.size)
+            if len(datos) != _CABECERA.size:
+                raise ValueError(f"{ruta}: grabación truncada")
+            firma, total = _CABECERA.unpack(datos)
+            if firma != _FIRMA:
+                raise ValueError(f"{ruta}: no es una grabación de eventos")
+            grabador.tipos = bytearray(archivo.read(total))
+            if len(grabador.tipos) != total:
+                raise ValueError(f"{ruta}: grabación truncada")
+            for bloque in grabador._arreglos():
+                try:
+                    bloque.fromfile(archivo, total)
+                except EOFError:
+                    raise ValueError(f"{ruta}: grabación truncada") from None
+                if sys.byteorder == 'big':
+                    bloque.byteswap()
+        return grabador
@@ -3,6 +3,14 @@ Funciones principales del algoritmo A*
 """
 import math
 
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional: solo lo usan las variantes por lotes
+    np = None
+
+# Heurísticas soportadas (cualquier otro nombre se trata como Manhattan)
+HEURISTICAS = ('manhattan', 'euclidiana', 'octile', 'chebyshev')
+
 
 def calcular_peso_movimiento(desde, hacia, config_costos):
     """
@@ -85,6 +93,121 @@ def calcular_heuristica(nodo_actual, nodo_objetivo, config_costos, tipo_heuristi
         return (dx + dy) * costo_promedio
 
 
+def _constantes_heuristica(config_costos):
+    """Costos que usan las heurísticas: (promedio recto, mínimo recto, diagonal)"""
+    costo_promedio = (config_costos['horizontal'] + config_costos['vertical']) / 2
+    costo_recto = min(config_costos['horizontal'], config_costos['vertical'])
+    return costo_promedio, costo_recto, config_costos['diagonal']
+
+
+def crear_heuristica(tipo_heuristica, nodo_objetivo, config_costos, columnas=None):
+    """
+    Crea una heurística especializada con el objetivo y los costos ya fijados.
+    
+    Equivale a calcular_heuristica(nodo, nodo_objetivo, config_costos,
+    tipo_heuristica) con los mismos resultados, pero el tipo se resuelve una
+    sola vez y los costos quedan precalculados en la clausura.
+    
+    Args:
+        tipo_heuristica: 'manhattan', 'euclidiana', 'octile', 'chebyshev'
+        nodo_objetivo: Tupla (fila, col) del nodo objetivo
+        config_costos: Diccionario con 'horizontal', 'vertical', 'diagonal'
+        columnas: Si se indica, la función recibe índices planos
+                  (fila * columnas + col) en lugar de tuplas
+    
+    Returns:
+        callable: h(nodo) -> float
+    """
+    fila_obj, col_obj = nodo_objetivo
+    costo_promedio, costo_recto, costo_diagonal = _constantes_heuristica(config_costos)
+    
+    if columnas is None:
+        def diferencias(nodo):
+            return abs(nodo[0] - fila_obj), abs(nodo[1] - col_obj)
+    else:
+        def diferencias(indice):
+            fila, col = divmod(indice, columnas)
+            return abs(fila - fila_obj), abs(col - col_obj)
+    
+    if tipo_heuristica == 'euclidiana':
+        def heuristica(nodo):
+            dx, dy = diferencias(nodo)
+            return math.sqrt(dx**2 + dy**2) * costo_promedio
+    
+    elif tipo_heuristica == 'octile':
+        def heuristica(nodo):
+            dx, dy = diferencias(nodo)
+            if dx > dy:
+                return costo_diagonal * dy + costo_recto * (dx - dy)
+            return costo_diagonal * dx + costo_recto * (dy - dx)
+    
+    elif tipo_heuristica == 'chebyshev':
+        def heuristica(nodo):
+            dx, dy = diferencias(nodo)
+            return max(dx, dy) * costo_diagonal
+    
+    elif columnas is None:
+        # Manhattan (y valor por defecto), sin llamada auxiliar
+        def heuristica(nodo):
+            return (abs(nodo[0] - fila_obj) + abs(nodo[1] - col_obj)) * costo_promedio
+    
+    else:
+        def heuristica(indice):
+            fila, col = divmod(indice, columnas)
+            return (abs(fila - fila_obj) + abs(col - col_obj)) * costo_promedio
+    
+    return heuristica
+
+
+def crear_heuristica_lote(tipo_heuristica, nodo_objetivo, config_costos, columnas):
+    """
+    Variante vectorizada de crear_heuristica para motores con índices planos.
+    
+    Requiere NumPy.
+    
+    Args:
+        tipo_heuristica: 'manhattan', 'euclidiana', 'octile', 'chebyshev'
+        nodo_objetivo: Tupla (fila, col) del nodo objetivo
+        config_costos: Diccionario con 'horizontal', 'vertical', 'diagonal'
+        columnas: Número de columnas de la cuadrícula
+    
+    Returns:
+        callable: h(indices) -> numpy.ndarray de float64 con la misma forma
+    """
+    if np is None:
+        raise ImportError("crear_heuristica_lote requiere NumPy")
+    
+    fila_obj, col_obj = nodo_objetivo
+    costo_promedio, costo_recto, costo_diagonal = _constantes_heuristica(config_costos)
+    
+    def diferencias(indices):
+        filas, cols = np.divmod(np.asarray(indices, dtype=np.int64), columnas)
+        return np.abs(filas - fila_obj), np.abs(cols - col_obj)
+    
+    if tipo_heuristica == 'euclidiana':
+        def heuristica(indices):
+            dx, dy = diferencias(indices)
+            return np.sqrt(dx**2 + dy**2) * costo_promedio
+    
+    elif tipo_heuristica == 'octile':
+        def heuristica(indices):
+            dx, dy = diferencias(indices)
+            menor = np.minimum(dx, dy)
+            return costo_diagonal * menor + costo_recto * (np.maximum(dx, dy) - menor)
+    
+    elif tipo_heuristica == 'chebyshev':
+        def heuristica(indices):
+            dx, dy = diferencias(indices)
+            return np.maximum(dx, dy) * costo_diagonal
+    
+    else:
+        def heuristica(indices):
+            dx, dy = diferencias(indices)
+            return (dx + dy) * costo_promedio
+    
+    return heuristica
+
+
 def calcular_funcion_costo(costo_g, costo_h):
     """
     Calcula la función de costo total F.
@@ -233,4 +356,41 @@ def reconstruir_camino(vino_de, inicio, fin):
             camino.append(actual)
     
     camino.reverse()
-    return camino
\ No newline at end of file
+    return camino
+
+
+def reconstruir_camino_bidireccional(vino_de, vino_de_inverso, inicio, fin, encuentro):
+    """
+    Reconstruye el camino de una búsqueda bidireccional.
+    
+    La mitad directa se recorre con vino_de (desde el encuentro hasta el
+    inicio) y la mitad inversa con vino_de_inverso (desde el encuentro
+    hasta el fin).
+    
+    Args:
+        vino_de: Diccionario de padres de la búsqueda desde el inicio
+        vino_de_inverso: Diccionario de padres de la búsqueda desde el fin
+        inicio: Tupla (fila, col) del inicio
+        fin: Tupla (fila, col) del fin
+        encuentro: Nodo donde se unen ambas búsquedas
+    
+    Returns:
+        list: Lista de nodos que forman el camino (sin inicio ni fin),
+              igual que reconstruir_camino
+    """
+    # Mitad directa: inicio -> encuentro (sin inicio)
+    camino = reconstruir_camino(vino_de, inicio, encuentro)
+    if encuentro != inicio:
+        camino.append(encuentro)
+    
+    # Mitad inversa: encuentro -> fin (sin fin)
+    actual = encuentro
+    while actual in vino_de_inverso:
+        actual = vino_de_inverso[actual]
+        if actual != fin:
+            camino.append(actual)
+    
+    # El fin nunca forma parte del camino
+    if camino and camino[-1] == fin:
+        camino.pop()
+    return camino
@@ -0,0 +1,324 @@
+"""
+Generadores de mapas grandes con semilla
+
+Mapas deterministas (misma semilla -> mismo mapa, en cualquier máquina)
+para medir cómo crecen el tiempo y la memoria con el tamaño, desde 100x100
+hasta 10000x10000. Todos devuelven un MapaBits (un byte por celda), que
+los motores aceptan directamente como 'obstaculos':
+
+    mapa = generar('cueva', 2000, 2000, semilla=7)
+    pares = pares_aleatorios(mapa, 100, semilla=7)
+    AlgoritmoAStar(inicio, fin, mapa.filas, mapa.columnas, mapa, config_costos)
+
+TIPOS:
+- aleatorio:     cada celda es obstáculo con probabilidad 'densidad'
+                 (resolución de 1/256)
+- laberinto:     laberinto perfecto (DFS aleatorio) con pasillos de
+                 'ancho_pasillo' celdas y paredes de una celda
+- cueva:         autómata celular: relleno aleatorio y 'iteraciones'
+                 pasadas de la regla "pared si hay 5 o más paredes en el
+                 3x3" (fuera del mapa cuenta como pared). Usa NumPy si
+                 está disponible; sin NumPy el resultado es el mismo pero
+                 mucho más lento
+- habitaciones:  división recursiva en habitaciones de al menos
+                 'tamano_minimo' celdas, con 'puertas' huecos por pared.
+                 Las paredes van en coordenadas pares y las puertas en
+                 impares, así que ninguna pared tapa una puerta y todas
+                 las habitaciones quedan conectadas
+
+El laberinto es un bucle de Python por celda de laberinto: a 10000x10000
+tarda del orden de un minuto, así que conviene generarlo una vez y
+reutilizarlo con MapaBits.guardar / MapaBits.cargar.
+"""
+import random
+
+from funciones_astar import np
+from mapa_bits import MapaBits
+
+# Tamaños (lado) para las curvas de escala
+TAMANOS_ESCALA = (100, 200, 500, 1000, 2000, 5000, 10000)
+
+# Celdas que se generan por bloque en el relleno aleatorio (limita la memoria)
+_BLOQUE_RELLENO = 1 << 20
+
+
+def _relleno_aleatorio(generador, total, densidad):
+    """bytearray de total celdas con 1 en una fracción 'densidad' de ellas"""
+    umbral = round(densidad * 256)
+    tabla = bytes(1 if valor < umbral else 0 for valor in range(256))
+    bloqueado = bytearray(total)
+    for inicio in range(0, total, _BLOQUE_RELLENO):
+        cantidad = min(_BLOQUE_RELLENO, total - inicio)
+        bloqueado[inicio:inicio + cantidad] = generador.randbytes(cantidad).translate(tabla)
+    return bloqueado
+
+
+def generar_aleatorio(filas, columnas, semilla=0, densidad=0.25):
+    """
+    Obstáculos aleatorios independientes
+
+    Args:
+        filas: Número de filas
+        columnas: Número de columnas
+        semilla: Semilla del generador
+        densidad: Probabilidad de que una celda sea obstáculo (0 a 1)
+
+    Returns:
+        MapaBits
+    """
+    if not 0 <= densidad <= 1:
+        raise ValueError("densidad debe estar entre 0 y 1")
+    generador = random.Random(semilla)
+    return MapaBits(filas, columnas,
+                    _relleno_aleatorio(generador, filas * columnas, densidad))
+
+
+def generar_laberinto(filas, columnas, semilla=0, ancho_pasillo=1):
+    """
+    Laberinto perfecto: un único camino entre cada par de celdas libres
+
+    Args:
+        filas: Número de filas
+        columnas: Número de columnas
+        semilla: Semilla del generador
+        ancho_pasillo: Ancho de los pasillos en celdas (paredes de 1 celda)
+
+    Returns:
+        MapaBits
+    """
+    if ancho_pasillo < 1:
+        raise ValueError("ancho_pasillo debe ser al menos 1")
+    paso = ancho_pasillo + 1
+    # Celdas del laberinto: bloques de ancho_pasillo x ancho_pasillo con
+    # origen en (1 + i * paso, 1 + j * paso)
+    celdas_f = (filas - 1) // paso
+    celdas_c = (columnas - 1) // paso
+    if not celdas_f or not celdas_c:
+        raise ValueError(f"El mapa debe medir al menos {paso + 1}x{paso + 1}")
+    generador = random.Random(semilla)
+
+    bloqueado = bytearray(b'\x01') * (filas * columnas)
+    bloque = [f * columnas + c for f in range(ancho_pasillo) for c in range(ancho_pasillo)]
+    # Pared entre dos celdas: columna de ancho_pasillo filas o fila de ancho_pasillo columnas
+    pared_vertical = [f * columnas for f in range(ancho_pasillo)]
+    pared_horizontal = range(ancho_pasillo)
+
+    def origen(celda):
+        fila, col = divmod(celda, celdas_c)
+        return (1 + fila * paso) * columnas + 1 + col * paso
+
+    for desplazamiento in bloque:
+        bloqueado[origen(0) + desplazamiento] = 0
+    visitada = bytearray(celdas_f * celdas_c)
+    visitada[0] = 1
+    pila = [0]
+    while pila:
+        celda = pila[-1]
+        fila, col = divmod(celda, celdas_c)
+        opciones = []
+        if fila > 0 and not visitada[celda - celdas_c]:
+            opciones.append(celda - celdas_c)
+        if fila < celdas_f - 1 and not visitada[celda + celdas_c]:
+            opciones.append(celda + celdas_c)
+        if col > 0 and not visitada[celda - 1]:
+            opciones.append(celda - 1)
+        if col < celdas_c - 1 and not visitada[celda + 1]:
+            opciones.append(celda + 1)
+        if not opciones:
+            pila.pop()
+            continue
+
+        siguiente = opciones[generador.randrange(len(opciones))]
+        visitada[siguiente] = 1
+        destino = origen(siguiente)
+        for desplazamiento in bloque:
+            bloqueado[destino + desplazamiento] = 0
+        # Abre la pared entre ambas celdas
+        primera = origen(min(celda, siguiente))
+        if abs(siguiente - celda) == 1:
+            pared, desplazamientos = primera + ancho_pasillo, pared_vertical
+        else:
+            pared, desplazamientos = primera + ancho_pasillo * columnas, pared_horizontal
+        for desplazamiento in desplazamientos:
+            bloqueado[pared + desplazamiento] = 0
+        pila.append(siguiente)
+    return MapaBits(filas, columnas, bloqueado)
+
+
+def _suavizar_numpy(bloqueado, filas, columnas, iteraciones):
+    celdas = np.frombuffer(bytes(bloqueado), dtype=np.uint8).reshape(filas, columnas)
+    for _ in range(iteraciones):
+        borde = np.pad(celdas, 1, constant_values=1)
+        vecinas = sum(borde[df:df + filas, dc:dc + columnas]
+                      for df in range(3) for dc in range(3))
+        celdas = (vecinas >= 5).astype(np.uint8)
+    return bytearray(celdas.tobytes())
+
+
+def _suavizar_python(bloqueado, filas, columnas, iteraciones):
+    muro = [1] * (columnas + 2)
+    for _ in range(iteraciones):
+        anterior = bytearray(bloqueado)
+        filas_con_borde = [muro] + [
+            [1] + list(anterior[f * columnas:(f + 1) * columnas]) + [1]
+            for f in range(filas)
+        ] + [muro]
+        for fila in range(filas):
+            arriba, centro, abajo = filas_con_borde[fila:fila + 3]
+            columna = [a + b + c for a, b, c in zip(arriba, centro, abajo)]
+            base = fila * columnas
+            for col in range(columnas):
+                bloqueado[base + col] = columna[col] + columna[col + 1] + columna[col + 2] >= 5
+    return bloqueado
+
+
+def generar_cueva(filas, columnas, semilla=0, densidad_inicial=0.45, iteraciones=4):
+    """
+    Cueva orgánica con un autómata celular
+
+    Args:
+        filas: Número de filas
+        columnas: Número de columnas
+        semilla: Semilla del generador
+        densidad_inicial: Fracción de paredes del relleno aleatorio
+        iteraciones: Pasadas de suavizado
+
+    Returns:
+        MapaBits
+    """
+    generador = random.Random(semilla)
+    bloqueado = _relleno_aleatorio(generador, filas * columnas, densidad_inicial)
+    if np is not None:
+        bloqueado = _suavizar_numpy(bloqueado, filas, columnas, iteraciones)
+    else:
+        bloqueado = _suavizar_python(bloqueado, filas, columnas, iteraciones)
+    return MapaBits(filas, columnas, bloqueado)
+
+
+def generar_habitaciones(filas, columnas, semilla=0, tamano_minimo=8, puertas=1):
+    """
+    Habitaciones conectadas por puertas (división recursiva)
+
+    Args:
+        filas: Número de filas
+        columnas: Número de columnas
+        semilla: Semilla del generador
+        tamano_minimo: Lado mínimo de una habitación (se dejan de dividir
+                       las que no caben dos veces)
+        puertas: Huecos por pared (al menos 1)
+
+    Returns:
+        MapaBits
+    """
+    if tamano_minimo < 2 or puertas < 1:
+        raise ValueError("tamano_minimo debe ser al menos 2 y puertas al menos 1")
+    generador = random.Random(semilla)
+    bloqueado = bytearray(filas * columnas)
+
+    def posiciones_pared(desde, hasta):
+        # Pares con al menos tamano_minimo celdas a cada lado
+        primera = desde + tamano_minimo
+        primera += primera % 2
+        return range(primera, hasta - tamano_minimo + 1, 2)
+
+    def elegir_puertas(desde, hasta):
+        impares = range(desde + 1 - desde % 2, hasta + 1, 2)
+        return generador.sample(impares, min(puertas, len(impares)))
+
+    # Rectángulos (f0, c0, f1, c1) inclusivos sin paredes dentro
+    pendientes = [(0, 0, filas - 1, columnas - 1)]
+    while pendientes:
+        f0, c0, f1, c1 = pendientes.pop()
+        horizontales = posiciones_pared(f0, f1)
+        verticales = posiciones_pared(c0, c1)
+        if not horizontales and not verticales:
+            continue
+        alto, ancho = f1 - f0, c1 - c0
+        if horizontales and (not verticales or alto > ancho
+                             or (alto == ancho and generador.random() < 0.5)):
+            fila = horizontales[generador.randrange(len(horizontales))]
+            base = fila * columnas
+            bloqueado[base + c0:base + c1 + 1] = b'\x01' * (c1 - c0 + 1)
+            for col in elegir_puertas(c0, c1):
+                bloqueado[base + col] = 0
+            pendientes.append((f0, c0, fila - 1, c1))
+            pendientes.append((fila + 1, c0, f1, c1))
+        else:
+            col = verticales[generador.randrange(len(verticales))]
+            bloqueado[f0 * columnas + col:f1 * columnas + col + 1:columnas] = (
+                b'\x01' * (f1 - f0 + 1))
+            for fila in elegir_puertas(f0, f1):
+                bloqueado[fila * columnas + col] = 0
+            pendientes.append((f0, c0, f1, col - 1))
+            pendientes.append((f0, col + 1, f1, c1))
+    return MapaBits(filas, columnas, bloqueado)
+
+
+# Tipo -> generador (filas, columnas, semilla, **opciones)
+GENERADORES = {
+    'aleatorio': generar_aleatorio,
+    'laberinto': generar_laberinto,
+    'cueva': generar_cueva,
+    'habitaciones': generar_habitaciones,
+}
+
+
+def generar(tipo, filas, columnas, semilla=0, **opciones):
+    """
+    Genera un mapa del tipo indicado
+
+    Args:
+        tipo: Clave de GENERADORES
+        filas: Número de filas
+        columnas: Número de columnas
+        semilla: Semilla del generador
+        **opciones: Parámetros propios del generador (densidad, ...)
+
+    Returns:
+        MapaBits
+    """
+    if tipo not in GENERADORES:
+        raise ValueError(
+            f"Tipo de mapa desconocido: {tipo!r}. Opciones: {', '.join(GENERADORES)}"
+        )
+    return GENERADORES[tipo](filas, columnas, semilla, **opciones)
+
+
+def pares_aleatorios(mapa, cantidad, semilla=0, componentes=None, intentos=1000):
+    """
+    Pares (inicio, fin) de celdas libres distintas, deterministas
+
+    Args:
+        mapa: MapaBits
+        cantidad: Número de pares
+        semilla: Semilla del generador
+        componentes: ComponentesConexas del mapa; si se indica, solo se
+                     devuelven pares conectados
+        intentos: Sorteos por par antes de rendirse (mapas casi llenos)
+
+    Returns:
+        list: Tuplas ((fila, col), (fila, col))
+    """
+    generador = random.Random(semilla)
+    bloqueado = mapa.bloqueado
+    columnas = mapa.columnas
+    total = mapa.filas * columnas
+
+    def celda_libre():
+        for _ in range(intentos):
+            indice = generador.randrange(total)
+            if not bloqueado[indice]:
+                return divmod(indice, columnas)
+        raise ValueError("No se encontraron celdas libres suficientes")
+
+    pares = []
+    for _ in range(cantidad):
+        for _ in range(intentos):
+            inicio, fin = celda_libre(), celda_libre()
+            if inicio != fin and (componentes is None
+                                  or componentes.conectados(inicio, fin)):
+                pares.append((inicio, fin))
+                break
+        else:
+            raise ValueError("No se encontraron pares conectados")
+    return pares
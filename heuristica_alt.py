@@ -0,0 +1,332 @@
+"""
+Heurística ALT (A*, Landmarks y desigualdad Triangular)
+
+PREPROCESO:
+Se eligen K celdas de referencia (landmarks) y se guarda la distancia
+exacta de cada una a todas las celdas (Dijkstra completo con los pesos de
+calcular_peso_movimiento).
+
+HEURÍSTICA:
+Por la desigualdad triangular, para cualquier referencia L:
+    dist(n, fin) >= |dist(L, fin) - dist(L, n)|
+El máximo sobre todas las referencias es admisible y consistente. En mapas
+tipo laberinto es mucho más ajustado que Manhattan u Octile, que ignoran
+las paredes.
+
+ESTRATEGIAS DE SELECCIÓN:
+- 'lejano':  cada referencia es la celda más alejada de las ya elegidas
+- 'evitar':  (avoid) cada referencia se coloca en la rama del árbol de
+             caminos mínimos de una raíz aleatoria donde la heurística
+             actual es peor
+
+La tabla depende de los obstáculos, los costos y permitir_diagonal; si el
+mapa cambia hay que recalcularla (comprobar_compatible lo detecta).
+
+Uso:
+    tabla = precalcular_alt(filas, columnas, obstaculos, config_costos, True)
+    AlgoritmoAStar(inicio, fin, ..., tipo_heuristica='alt', tabla_alt=tabla)
+"""
+import random
+import struct
+import sys
+import zlib
+from array import array
+
+from campo_distancias import INFINITO, dijkstra_indices
+from mapa_bits import bytes_bloqueados
+from mascara_vecinos import MascaraVecinos
+
+# Cabecera del archivo: firma, filas, columnas, K, diagonal,
+# costos horizontal / vertical / diagonal, CRC32 de los obstáculos
+_FIRMA = b'ALT1'
+_CABECERA = struct.Struct('<4sIIIB3dI')
+
+ESTRATEGIAS = ('lejano', 'evitar')
+
+
+def _crc_obstaculos(mascara):
+    bloqueado = mascara.bloqueado
+    if not isinstance(bloqueado, (bytes, bytearray)):
+        # MascaraPerezosa sobre un set: el mismo contenido en bytes
+        bloqueado = bytes_bloqueados(mascara.filas, mascara.columnas, mascara.obstaculos)
+    return zlib.crc32(bloqueado)
+
+
+def _cota(distancias, desde, hacia):
+    """max_L |dist(L, desde) - dist(L, hacia)| sobre las tablas dadas"""
+    mejor = 0.0
+    for distancia in distancias:
+        a = distancia[desde]
+        b = distancia[hacia]
+        if a != INFINITO and b != INFINITO:
+            diferencia = abs(a - b)
+            if diferencia > mejor:
+                mejor = diferencia
+    return mejor
+
+
+class TablaALT:
+    """Distancias exactas desde K referencias a todas las celdas"""
+
+    def __init__(self, filas, columnas, config_costos, permitir_diagonal,
+                 referencias, distancias, crc_obstaculos):
+        """
+        Args:
+            filas: Número de filas de la cuadrícula
+            columnas: Número de columnas de la cuadrícula
+            config_costos: Costos con los que se calcularon las distancias
+            permitir_diagonal: Si las distancias usan movimientos diagonales
+            referencias: Lista de índices planos de las referencias
+            distancias: Lista de array('d'), una por referencia
+            crc_obstaculos: CRC32 del mapa de obstáculos usado
+        """
+        self.filas = filas
+        self.columnas = columnas
+        self.config_costos = dict(config_costos)
+        self.permitir_diagonal = bool(permitir_diagonal)
+        self.referencias = list(referencias)
+        self.distancias = list(distancias)
+        self.crc_obstaculos = crc_obstaculos
+
+    def __len__(self):
+        return len(self.referencias)
+
+    def celdas_referencia(self):
+        """Referencias como tuplas (fila, col)"""
+        return [divmod(indice, self.columnas) for indice in self.referencias]
+
+    def comprobar_compatible(self, filas, columnas, config_costos,
+                             permitir_diagonal, mascara):
+        """
+        Lanza ValueError si la tabla no corresponde a este mapa
+
+        Con otros obstáculos, costos o reglas de movimiento las distancias
+        guardadas ya no son exactas y la heurística podría dejar de ser
+        admisible.
+        """
+        costos = (config_costos['horizontal'], config_costos['vertical'],
+                  config_costos['diagonal'])
+        guardados = (self.config_costos['horizontal'], self.config_costos['vertical'],
+                     self.config_costos['diagonal'])
+        if (filas, columnas) != (self.filas, self.columnas):
+            raise ValueError(
+                f"La tabla ALT es de {self.filas}x{self.columnas}, "
+                f"no de {filas}x{columnas}"
+            )
+        if costos != guardados or bool(permitir_diagonal) != self.permitir_diagonal:
+            raise ValueError("La tabla ALT se calculó con otros costos de movimiento")
+        if _crc_obstaculos(mascara) != self.crc_obstaculos:
+            raise ValueError("La tabla ALT se calculó con otros obstáculos")
+
+    def estimar(self, desde, hacia):
+        """Cota inferior de la distancia entre dos índices planos"""
+        return _cota(self.distancias, desde, hacia)
+
+    def crear_heuristica(self, nodo_objetivo, indices=False):
+        """
+        Heurística ALT con el objetivo ya fijado
+
+        Solo se usan las referencias que alcanzan el objetivo; las celdas que
+        una referencia no alcanza no aportan cota.
+
+        Args:
+            nodo_objetivo: Tupla (fila, col) del objetivo
+            indices: Si True, la función recibe índices planos
+
+        Returns:
+            callable: h(nodo) -> float
+        """
+        columnas = self.columnas
+        objetivo = nodo_objetivo[0] * columnas + nodo_objetivo[1]
+        pares = tuple((distancia, distancia[objetivo])
+                      for distancia in self.distancias
+                      if distancia[objetivo] != INFINITO)
+
+        def heuristica_indice(indice):
+            mejor = 0.0
+            for distancia, hasta_objetivo in pares:
+                desde_nodo = distancia[indice]
+                if desde_nodo != INFINITO:
+                    diferencia = abs(hasta_objetivo - desde_nodo)
+                    if diferencia > mejor:
+                        mejor = diferencia
+            return mejor
+
+        if indices:
+            return heuristica_indice
+
+        def heuristica(nodo):
+            return heuristica_indice(nodo[0] * columnas + nodo[1])
+
+        return heuristica
+
+    # ===== PERSISTENCIA =====
+
+    def guardar(self, ruta):
+        """
+        Guarda la tabla en formato binario compacto
+
+        Cabecera fija, índices de las referencias (int64) y las K tablas de
+        distancias (float64), todo en little-endian.
+        """
+        cabecera = _CABECERA.pack(
+            _FIRMA, self.filas, self.columnas, len(self.referencias),
+            int(self.permitir_diagonal),
+            self.config_costos['horizontal'], self.config_costos['vertical'],
+            self.config_costos['diagonal'], self.crc_obstaculos
+        )
+        with open(ruta, 'wb') as archivo:
+            archivo.write(cabecera)
+            for bloque in [array('q', self.referencias)] + self.distancias:
+                if sys.byteorder == 'big':
+                    bloque = array(bloque.typecode, bloque)
+                    bloque.byteswap()
+                bloque.tofile(archivo)
+
+    @classmethod
+    def cargar(cls, ruta):
+        """
+        Carga una tabla guardada con guardar()
+
+        Returns:
+            TablaALT
+        """
+        with open(ruta, 'rb') as archivo:
+            datos = archivo.read(_CABECERA.size)
+            if len(datos) != _CABECERA.size:
+                raise ValueError(f"{ruta}: archivo ALT truncado")
+            (firma, filas, columnas, total_referencias, diagonal,
+             horizontal, vertical, costo_diagonal, crc) = _CABECERA.unpack(datos)
+            if firma != _FIRMA:
+                raise ValueError(f"{ruta}: no es un archivo de tabla ALT")
+
+            bloques = []
+            for typecode, cantidad in ([('q', total_referencias)]
+                                       + [('d', filas * columnas)] * total_referencias):
+                bloque = array(typecode)
+                try:
+                    bloque.fromfile(archivo, cantidad)
+                except EOFError:
+                    raise ValueError(f"{ruta}: archivo ALT truncado") from None
+                if sys.byteorder == 'big':
+                    bloque.byteswap()
+                bloques.append(bloque)
+
+        config_costos = {'horizontal': horizontal, 'vertical': vertical,
+                         'diagonal': costo_diagonal}
+        return cls(filas, columnas, config_costos, bool(diagonal),
+                   list(bloques[0]), bloques[1:], crc)
+
+
+# ===== SELECCIÓN DE REFERENCIAS =====
+
+def _mas_lejana(minimas):
+    """Índice con mayor distancia mínima finita a las referencias"""
+    mejor, mejor_valor = -1, -1.0
+    for indice, valor in enumerate(minimas):
+        if valor != INFINITO and valor > mejor_valor:
+            mejor, mejor_valor = indice, valor
+    return mejor
+
+
+def _elegir_lejano(mascara, movimientos, raiz, cantidad, tablas):
+    """Farthest-point: cada referencia maximiza la distancia a las anteriores"""
+    minimas, _, _ = dijkstra_indices(mascara, movimientos, raiz)
+    referencias = []
+    while len(referencias) < cantidad:
+        siguiente = _mas_lejana(minimas)
+        if siguiente < 0 or siguiente in referencias:
+            break
+        referencias.append(siguiente)
+        nuevas, _, _ = dijkstra_indices(mascara, movimientos, siguiente)
+        tablas.append(nuevas)
+        minimas = array('d', map(min, minimas, nuevas)) if len(referencias) > 1 else nuevas
+    return referencias
+
+
+def _elegir_evitar(mascara, movimientos, libres, cantidad, tablas, aleatorio):
+    """
+    Avoid: raíz aleatoria, árbol de caminos mínimos desde ella y descenso
+    por la rama con más "error" acumulado de la heurística actual, sin
+    entrar en subárboles que ya contienen una referencia.
+    """
+    total = mascara.filas * mascara.columnas
+    referencias = []
+    intentos = 0
+    while len(referencias) < cantidad and intentos < 4 * cantidad:
+        intentos += 1
+        raiz = aleatorio.choice(libres)
+        distancias, padres, orden = dijkstra_indices(mascara, movimientos, raiz)
+
+        # Peso = cuánto subestima la heurística actual la distancia real
+        tamano = array('d', [0.0]) * total
+        contiene = bytearray(total)
+        mejor_hijo = array('q', [-1]) * total
+        for indice in referencias:
+            contiene[indice] = 1
+        for indice in reversed(orden):
+            if contiene[indice]:
+                tamano[indice] = 0.0
+            else:
+                tamano[indice] += distancias[indice] - _cota(tablas, raiz, indice)
+            padre = padres[indice]
+            if padre >= 0:
+                tamano[padre] += tamano[indice]
+                if contiene[indice]:
+                    contiene[padre] = 1
+                hijo = mejor_hijo[padre]
+                if hijo < 0 or tamano[indice] > tamano[hijo]:
+                    mejor_hijo[padre] = indice
+
+        # Descender desde la raíz hasta una hoja
+        actual = raiz
+        while mejor_hijo[actual] >= 0 and tamano[mejor_hijo[actual]] > 0:
+            actual = mejor_hijo[actual]
+        if actual in referencias:
+            continue
+        referencias.append(actual)
+        tablas.append(dijkstra_indices(mascara, movimientos, actual)[0])
+    return referencias
+
+
+def precalcular_alt(filas, columnas, obstaculos, config_costos, permitir_diagonal=False,
+                    cantidad=8, estrategia='lejano', semilla=0, mascara=None):
+    """
+    Elige las referencias y calcula sus tablas de distancias
+
+    Args:
+        filas: Número de filas de la cuadrícula
+        columnas: Número de columnas de la cuadrícula
+        obstaculos: Set de tuplas con posiciones bloqueadas
+        config_costos: Diccionario con 'horizontal', 'vertical', 'diagonal'
+        permitir_diagonal: Si True, permite movimientos en 8 direcciones
+        cantidad: Número K de referencias
+        estrategia: 'lejano' o 'evitar'
+        semilla: Semilla para elegir la celda raíz
+        mascara: MascaraVecinos ya construida (opcional)
+
+    Returns:
+        TablaALT
+    """
+    if estrategia not in ESTRATEGIAS:
+        raise ValueError(
+            f"Estrategia desconocida: {estrategia!r}. Opciones: {', '.join(ESTRATEGIAS)}"
+        )
+    if mascara is None:
+        mascara = MascaraVecinos(filas, columnas, obstaculos)
+    movimientos = mascara.tabla_movimientos(config_costos, permitir_diagonal)
+
+    libres = [indice for indice, bloqueada in enumerate(mascara.bloqueado) if not bloqueada]
+    aleatorio = random.Random(semilla)
+    tablas = []
+    if not libres or cantidad <= 0:
+        referencias = []
+    elif estrategia == 'lejano':
+        referencias = _elegir_lejano(mascara, movimientos, aleatorio.choice(libres),
+                                     cantidad, tablas)
+    else:
+        referencias = _elegir_evitar(mascara, movimientos, libres, cantidad,
+                                     tablas, aleatorio)
+
+    return TablaALT(filas, columnas, config_costos, permitir_diagonal,
+                    referencias, tablas, _crc_obstaculos(mascara))
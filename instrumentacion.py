@@ -0,0 +1,284 @@
+"""
+Instrumentación opcional de los motores de búsqueda
+
+obtener_estadisticas solo cuenta nodos. instrumentar() añade a un motor ya
+construido un desglose de tiempos y contadores del camino caliente:
+
+- tiempo en la cola de prioridad (insertar / extraer / tope)
+- tiempo generando vecinos (máscara de vecinos)
+- tiempo evaluando la heurística
+- tiempo reconstruyendo el camino
+- inserciones, extracciones obsoletas, reaperturas y tamaño máximo de la
+  frontera (nodos distintos, sin contar entradas duplicadas)
+- eventos por tipo, si la búsqueda se recorre con iterar_eventos()
+
+COSTO CUANDO ESTÁ DESACTIVADA: CERO.
+Los motores no consultan ninguna bandera: instrumentar() reemplaza en la
+INSTANCIA la frontera, la heurística, la máscara y reconstruir() por
+envolturas que miden. Un motor sin instrumentar ejecuta exactamente el
+mismo código de siempre.
+
+Uso:
+    algoritmo = AlgoritmoAStar(inicio, fin, filas, columnas, obstaculos, config_costos)
+    medicion = instrumentar(algoritmo)
+    algoritmo.ejecutar_completo()
+    algoritmo.obtener_estadisticas()['instrumentacion']   # dict
+    medicion.escribir_json_lines('perfil.jsonl', consulta=7)
+"""
+import json
+import time
+
+from eventos_busqueda import NOMBRES_EVENTOS
+
+# Categorías de tiempo
+CATEGORIAS = ('cola', 'vecinos', 'heuristica', 'reconstruccion')
+
+# Atributos que contienen colas o heurísticas según el motor
+_ATRIBUTOS_COLA = ('frontera', '_frontera', 'frontera_inversa')
+_ATRIBUTOS_HEURISTICA = ('heuristica', 'heuristica_inversa', '_heuristica_indice')
+
+
+class Instrumentacion:
+    """Tiempos (en nanosegundos) y contadores de una búsqueda"""
+
+    def __init__(self):
+        self.tiempos = dict.fromkeys(CATEGORIAS, 0)
+        self.llamadas = dict.fromkeys(CATEGORIAS, 0)
+        self.tiempo_busqueda = 0      # ejecutar_paso / ejecutar_completo (externos)
+        self.inserciones = 0
+        self.extracciones = 0
+        self.extracciones_obsoletas = 0
+        self.reaperturas = 0
+        self.tamano_maximo_abiertos = 0
+        self.eventos = dict.fromkeys(NOMBRES_EVENTOS, 0)
+        self._profundidad = 0
+
+    def cronometrar(self, categoria, funcion):
+        """
+        Envuelve una función para acumular su tiempo en una categoría
+
+        Returns:
+            callable: Función con la misma firma
+        """
+        tiempos, llamadas = self.tiempos, self.llamadas
+        reloj = time.perf_counter_ns
+
+        def envoltura(*args):
+            inicio = reloj()
+            try:
+                return funcion(*args)
+            finally:
+                tiempos[categoria] += reloj() - inicio
+                llamadas[categoria] += 1
+        return envoltura
+
+    def cronometrar_busqueda(self, funcion):
+        """Como cronometrar, pero sin contar dos veces las llamadas anidadas"""
+        reloj = time.perf_counter_ns
+
+        def envoltura(*args):
+            self._profundidad += 1
+            inicio = reloj()
+            try:
+                return funcion(*args)
+            finally:
+                self._profundidad -= 1
+                if not self._profundidad:
+                    self.tiempo_busqueda += reloj() - inicio
+        return envoltura
+
+    def contar_eventos(self, eventos):
+        """
+        Cuenta los eventos de un flujo por tipo y mide el tiempo de búsqueda
+
+        Solo se mide el tiempo en producir cada evento, no el de quien los
+        consume (la interfaz dibujando, un grabador...).
+
+        Yields:
+            Evento: Los mismos eventos, sin cambios
+        """
+        conteo = [0] * len(NOMBRES_EVENTOS)
+        siguiente = iter(eventos).__next__
+        reloj = time.perf_counter_ns
+        try:
+            while True:
+                self._profundidad += 1
+                inicio = reloj()
+                try:
+                    actual = siguiente()
+                except StopIteration:
+                    return
+                finally:
+                    self._profundidad -= 1
+                    if not self._profundidad:
+                        self.tiempo_busqueda += reloj() - inicio
+                conteo[actual[0]] += 1
+                yield actual
+        finally:
+            for nombre, total in zip(NOMBRES_EVENTOS, conteo):
+                self.eventos[nombre] += total
+
+    # ===== EXPORTACIÓN =====
+
+    def como_dict(self):
+        """
+        Resultados en un dict serializable (tiempos en segundos)
+
+        Returns:
+            dict: Diccionario con tiempos, llamadas y contadores
+        """
+        medido = sum(self.tiempos.values())
+        return {
+            'tiempo_busqueda': self.tiempo_busqueda / 1e9,
+            'tiempos': {categoria: ns / 1e9 for categoria, ns in self.tiempos.items()},
+            'tiempo_otros': max(self.tiempo_busqueda - medido, 0) / 1e9,
+            'llamadas': dict(self.llamadas),
+            'inserciones': self.inserciones,
+            'extracciones': self.extracciones,
+            'extracciones_obsoletas': self.extracciones_obsoletas,
+            'reaperturas': self.reaperturas,
+            'tamano_maximo_abiertos': self.tamano_maximo_abiertos,
+            'eventos': dict(self.eventos)
+        }
+
+    def linea_json(self, **extra):
+        """Una línea JSON (sin salto final) con los resultados y campos extra"""
+        registro = dict(extra)
+        registro.update(self.como_dict())
+        return json.dumps(registro, ensure_ascii=False, sort_keys=True)
+
+    def escribir_json_lines(self, archivo, **extra):
+        """
+        Agrega una línea JSON al archivo (formato JSON Lines)
+
+        Args:
+            archivo: Ruta o archivo abierto en modo texto
+            **extra: Campos adicionales del registro (consulta, motor, ...)
+        """
+        linea = self.linea_json(**extra) + '\n'
+        if hasattr(archivo, 'write'):
+            archivo.write(linea)
+        else:
+            with open(archivo, 'a', encoding='utf-8') as salida:
+                salida.write(linea)
+
+
+class ColaInstrumentada:
+    """
+    Cola de prioridad que mide a otra y cuenta sus entradas
+
+    Cada nodo recuerda el desempate de su última inserción: una extracción
+    con otro desempate es una entrada obsoleta (duplicado de 'heapq' o
+    'buckets'), y extraer de nuevo un nodo ya extraído es una reapertura.
+    """
+
+    def __init__(self, cola, medicion):
+        self._cola = cola
+        self._medicion = medicion
+        self._vigentes = {}          # nodo -> desempate de su entrada vigente
+        self._extraidos = set()
+        # Entradas insertadas antes de instrumentar (el inicio): la vigente
+        # de cada nodo es la de mayor desempate
+        for _, desempate, nodo in cola:
+            if desempate > self._vigentes.get(nodo, desempate - 1):
+                self._vigentes[nodo] = desempate
+        self.insertar = medicion.cronometrar('cola', self._insertar)
+        self.extraer = medicion.cronometrar('cola', self._extraer)
+        self.tope = medicion.cronometrar('cola', cola.tope)
+
+    def _insertar(self, nodo, prioridad, desempate):
+        self._cola.insertar(nodo, prioridad, desempate)
+        medicion = self._medicion
+        medicion.inserciones += 1
+        self._vigentes[nodo] = desempate
+        if len(self._vigentes) > medicion.tamano_maximo_abiertos:
+            medicion.tamano_maximo_abiertos = len(self._vigentes)
+
+    def _extraer(self):
+        entrada = self._cola.extraer()
+        _, desempate, nodo = entrada
+        medicion = self._medicion
+        medicion.extracciones += 1
+        if self._vigentes.get(nodo) != desempate:
+            medicion.extracciones_obsoletas += 1
+        else:
+            del self._vigentes[nodo]
+            if nodo in self._extraidos:
+                medicion.reaperturas += 1
+            self._extraidos.add(nodo)
+        return entrada
+
+    def eliminar(self, nodo):
+        self._vigentes.pop(nodo, None)
+        return self._cola.eliminar(nodo)
+
+    def __getattr__(self, nombre):
+        # inserciones, tamano_maximo, ... de la cola original
+        return getattr(self._cola, nombre)
+
+    def __contains__(self, nodo):
+        return nodo in self._cola
+
+    def __len__(self):
+        return len(self._cola)
+
+    def __iter__(self):
+        return iter(self._cola)
+
+
+class MascaraInstrumentada:
+    """Máscara de vecinos que mide la generación de vecinos"""
+
+    def __init__(self, mascara, medicion):
+        self._mascara = mascara
+        self.vecinos = medicion.cronometrar('vecinos', mascara.vecinos)
+        self.mascara = medicion.cronometrar('vecinos', mascara.mascara)
+
+    def __getattr__(self, nombre):
+        return getattr(self._mascara, nombre)
+
+
+def instrumentar(algoritmo, medicion=None):
+    """
+    Instrumenta un motor ya construido (antes de ejecutar pasos)
+
+    Args:
+        algoritmo: Instancia de AlgoritmoAStar (cualquier motor)
+        medicion: Instrumentacion donde acumular (por defecto, una nueva).
+                  Compartirla entre consultas suma sus resultados
+
+    Returns:
+        Instrumentacion: Mediciones, también disponibles en
+                         obtener_estadisticas()['instrumentacion']
+    """
+    if medicion is None:
+        medicion = Instrumentacion()
+    atributos = vars(algoritmo)
+
+    for nombre in _ATRIBUTOS_COLA:
+        if nombre in atributos:
+            setattr(algoritmo, nombre, ColaInstrumentada(atributos[nombre], medicion))
+    crear_cola = algoritmo._crear_cola
+    algoritmo._crear_cola = lambda: ColaInstrumentada(crear_cola(), medicion)
+
+    for nombre in _ATRIBUTOS_HEURISTICA:
+        if nombre in atributos:
+            setattr(algoritmo, nombre,
+                    medicion.cronometrar('heuristica', atributos[nombre]))
+
+    algoritmo.mascara = MascaraInstrumentada(algoritmo.mascara, medicion)
+    algoritmo.reconstruir = medicion.cronometrar('reconstruccion', algoritmo.reconstruir)
+    algoritmo.ejecutar_paso = medicion.cronometrar_busqueda(algoritmo.ejecutar_paso)
+    algoritmo.ejecutar_completo = medicion.cronometrar_busqueda(algoritmo.ejecutar_completo)
+    iterar_eventos = algoritmo.iterar_eventos
+    algoritmo.iterar_eventos = lambda: medicion.contar_eventos(iterar_eventos())
+
+    obtener_estadisticas = algoritmo.obtener_estadisticas
+
+    def obtener_estadisticas_instrumentadas():
+        estadisticas = obtener_estadisticas()
+        estadisticas['instrumentacion'] = medicion.como_dict()
+        return estadisticas
+    algoritmo.obtener_estadisticas = obtener_estadisticas_instrumentadas
+    algoritmo.instrumentacion = medicion
+    return medicion
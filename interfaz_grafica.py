@@ -10,7 +10,9 @@ from constantes import (CELDA_SIZE, MAX_FILAS, MAX_COLUMNAS, FILAS_DEFAULT,
                        PERMITIR_DIAGONAL_DEFAULT)
 from celda_widget import CeldaWidget
 from algoritmo_astar import AlgoritmoAStar
+from eventos_busqueda import EXPANDIR, GENERAR, ACTUALIZAR, AGOTADO, ENCONTRADO
 from funciones_astar import reconstruir_camino
+from replanificador_incremental import ReplanificadorDStarLite
 
 
 class InterfazAStar:
@@ -45,6 +47,9 @@ class InterfazAStar:
         self.algoritmo = None
         self.paso_actual = 0
         
+        # Replanificador incremental (D* Lite) tras una búsqueda exitosa
+        self.replanificador = None
+        
         self.crear_interfaz()
     
     def crear_interfaz(self):
@@ -572,6 +577,10 @@ Chebyshev: max(|dx|, |dy|)
             self.celdas[(fila, col)].colorear('inicio')
             if (fila, col) in self.obstaculos:
                 self.obstaculos.remove((fila, col))
+            if self.replanificador:
+                self.replanificador.actualizar_obstaculos(eliminados=[(fila, col)])
+                self.replanificador.mover_inicio((fila, col))
+                self.replanificar()
         
         elif self.modo == "fin":
             if self.fin:
@@ -581,32 +590,97 @@ Chebyshev: max(|dx|, |dy|)
             self.celdas[(fila, col)].colorear('fin')
             if (fila, col) in self.obstaculos:
                 self.obstaculos.remove((fila, col))
+            # D* Lite busca desde el fin: con otro fin no hay nada que reparar
+            self.replanificador = None
         
         elif self.modo == "obstaculo":
             if (fila, col) != self.inicio and (fila, col) != self.fin:
                 if (fila, col) in self.obstaculos:
                     self.obstaculos.remove((fila, col))
                     self.celdas[(fila, col)].colorear('vacio')
+                    self.replanificar(eliminados=[(fila, col)])
                 else:
                     self.obstaculos.add((fila, col))
                     self.celdas[(fila, col)].colorear('obstaculo')
+                    self.replanificar(agregados=[(fila, col)])
         
         elif self.modo == "borrar":
             if (fila, col) == self.inicio:
                 self.inicio = None
+                self.replanificador = None
             elif (fila, col) == self.fin:
                 self.fin = None
+                self.replanificador = None
             elif (fila, col) in self.obstaculos:
                 self.obstaculos.remove((fila, col))
+                self.replanificar(eliminados=[(fila, col)])
             self.celdas[(fila, col)].colorear('vacio')
             self.celdas[(fila, col)].limpiar_valores()
     
+    def replanificar(self, agregados=(), eliminados=()):
+        """
+        Repara el último camino tras un cambio de obstáculos (D* Lite)
+        
+        Solo actúa si hay una búsqueda exitosa previa con la misma
+        configuración; en ese caso no se repite la búsqueda desde cero.
+        """
+        if not self.replanificador:
+            return
+        
+        configuracion = (self.obtener_config_costos(), self.permitir_diagonal.get(),
+                         self.tipo_heuristica.get())
+        if configuracion != (self.replanificador.config_costos,
+                             self.replanificador.permitir_diagonal,
+                             self.replanificador.tipo_heuristica):
+            # La configuración cambió: la próxima búsqueda empieza de cero
+            self.replanificador = None
+            return
+        
+        self.replanificador.actualizar_obstaculos(agregados, eliminados)
+        exito, camino, costo = self.replanificador.planificar()
+        reparados = self.replanificador.expandidos_ultima
+        
+        self.limpiar_busqueda()
+        if not exito:
+            self.label_info.config(
+                text=f"♻️ Replanificado (D* Lite)\n❌ Sin camino tras el cambio\nNodos reparados: {reparados}"
+            )
+            return
+        
+        for nodo in camino:
+            self.celdas[nodo].colorear('camino')
+        self.label_info.config(
+            text=f"♻️ Replanificado (D* Lite)\nCosto: {round(costo, 2)}\nNodos reparados: {reparados}"
+        )
+    
+    def iniciar_replanificador(self, config_costos, permitir_diag, tipo_h):
+        """Prepara D* Lite para reparar el camino en los próximos cambios"""
+        self.replanificador = ReplanificadorDStarLite(
+            self.inicio, self.fin,
+            self.filas, self.columnas,
+            self.obstaculos,
+            config_costos,
+            permitir_diag,
+            tipo_h
+        )
+        self.replanificador.planificar()
+    
+    def dibujar_vecino(self, evento):
+        """Colorea un vecino agregado o mejorado con los costos del evento"""
+        vecino = evento.nodo
+        if vecino != self.inicio and vecino != self.fin:
+            self.celdas[vecino].colorear('visitado')
+            self.celdas[vecino].actualizar_valores(
+                round(evento.g, 2), round(evento.h, 2), round(evento.f, 2)
+            )
+    
     def ejecutar_astar(self):
         """Ejecuta A* con animación y actualización de listas"""
         if not self.validar_inicio_fin():
             return
         
         self.limpiar_busqueda()
+        self.replanificador = None
         
         config_costos = self.obtener_config_costos()
         permitir_diag = self.permitir_diagonal.get()
@@ -628,58 +702,63 @@ Chebyshev: max(|dx|, |dy|)
         
         self.paso_actual = 0
         
-        while True:
-            self.paso_actual += 1
-            actual, vecinos, encontrado = self.algoritmo.ejecutar_paso()
+        # Los eventos de un paso llegan juntos (EXPANDIR y sus vecinos);
+        # el paso se muestra al llegar el evento siguiente
+        expandido = None
+        vecinos = 0
+        for evento in self.algoritmo.iterar_eventos():
+            if evento.tipo == GENERAR or evento.tipo == ACTUALIZAR:
+                self.dibujar_vecino(evento)
+                vecinos += 1
+                continue
+            
+            if expandido is not None:
+                f_actual = round(expandido.f, 2)
+                self.label_info.config(
+                    text=f"Paso {self.paso_actual}\nExplorando: {expandido.nodo}\nF={f_actual}\nVecinos: {vecinos}"
+                )
+                
+                self.root.update()
+                time.sleep(velocidad / 1000.0)
             
-            if actual is None:
+            if evento.tipo == AGOTADO:
                 self.label_info.config(text="❌ No hay camino")
                 messagebox.showerror("Error", "No se encontró un camino")
                 return
             
-            # Visualizar nodo actual
-            if actual != self.inicio and actual != self.fin:
-                self.celdas[actual].colorear('visitado')
+            if evento.tipo == EXPANDIR:
+                self.paso_actual += 1
+                expandido, vecinos = evento, 0
+                
+                # Visualizar nodo actual
+                actual = evento.nodo
+                if actual != self.inicio and actual != self.fin:
+                    self.celdas[actual].colorear('visitado')
+                
+                # ACTUALIZAR LISTAS (el algoritmo ya terminó este paso)
+                self.actualizar_listas()
+                continue
             
-            # Visualizar vecinos
-            for vecino in vecinos:
-                if vecino != self.inicio and vecino != self.fin:
-                    g = round(self.algoritmo.costo_g[vecino], 2)
-                    h = round(self.algoritmo.costo_h[vecino], 2)
-                    f = round(self.algoritmo.costo_f[vecino], 2)
-                    
-                    self.celdas[vecino].colorear('visitado')
-                    self.celdas[vecino].actualizar_valores(g, h, f)
+            # ENCONTRADO
+            camino = reconstruir_camino(self.algoritmo.vino_de, 
+                                       self.inicio, self.fin)
             
-            # ACTUALIZAR LISTAS
-            self.actualizar_listas()
+            for nodo in camino:
+                self.celdas[nodo].colorear('camino')
+            
+            longitud = round(self.algoritmo.costo_g[self.fin], 2)
             
-            # Actualizar info
-            f_actual = round(self.algoritmo.costo_f.get(actual, 0), 2)
             self.label_info.config(
-                text=f"Paso {self.paso_actual}\nExplorando: {actual}\nF={f_actual}\nVecinos: {len(vecinos)}"
+                text=f"✅ ¡Camino encontrado!\nCosto: {longitud}\nPasos: {self.paso_actual}"
             )
             
-            self.root.update()
-            time.sleep(velocidad / 1000.0)
+            # Actualizar listas finales
+            self.actualizar_listas()
             
-            if encontrado:
-                camino = reconstruir_camino(self.algoritmo.vino_de, 
-                                           self.inicio, self.fin)
-                
-                for nodo in camino:
-                    self.celdas[nodo].colorear('camino')
-                
-                longitud = round(self.algoritmo.costo_g[self.fin], 2)
-                
-                self.label_info.config(
-                    text=f"✅ ¡Camino encontrado!\nCosto: {longitud}\nPasos: {self.paso_actual}"
-                )
-                
-                # Actualizar listas finales
-                self.actualizar_listas()
-                
-                estadisticas = f"""
+            # Los próximos cambios de obstáculos reparan este camino
+            self.iniciar_replanificador(config_costos, permitir_diag, tipo_h)
+            
+            estadisticas = f"""
 ¡Camino encontrado!
 
 📊 Estadísticas:
@@ -695,9 +774,9 @@ Chebyshev: max(|dx|, |dy|)
 
 💡 Revisa las pestañas "Lista Abierta" y "Lista Cerrada"
    para ver cómo trabajó el algoritmo.
-                """
-                messagebox.showinfo("¡Éxito!", estadisticas)
-                return
+            """
+            messagebox.showinfo("¡Éxito!", estadisticas)
+            return
     
     def ejecutar_paso_a_paso(self):
         """Ejecuta A* paso a paso con actualización de listas"""
@@ -705,6 +784,7 @@ Chebyshev: max(|dx|, |dy|)
             return
         
         self.limpiar_busqueda()
+        self.replanificador = None
         
         # Limpiar botones anteriores
         for widget in self.frame_info.winfo_children():
@@ -730,33 +810,40 @@ Chebyshev: max(|dx|, |dy|)
         # Actualizar listas iniciales
         self.actualizar_listas()
         
+        eventos = self.algoritmo.iterar_eventos()
+        pendiente = None  # Evento leído de más en el paso anterior
+        
         def siguiente_paso():
-            self.paso_actual += 1
-            actual, vecinos, encontrado = self.algoritmo.ejecutar_paso()
+            nonlocal pendiente
+            evento = pendiente if pendiente is not None else next(eventos)
+            pendiente = None
             
-            if actual is None:
+            if evento.tipo == AGOTADO:
                 self.label_info.config(text="❌ No hay camino")
                 messagebox.showerror("Error", "No se encontró un camino")
                 btn_siguiente.destroy()
                 return
             
+            self.paso_actual += 1
+            actual = evento.nodo
+            
             # Visualizar
             if actual != self.inicio and actual != self.fin:
                 self.celdas[actual].colorear('visitado')
             
-            for vecino in vecinos:
-                if vecino != self.inicio and vecino != self.fin:
-                    g = round(self.algoritmo.costo_g[vecino], 2)
-                    h = round(self.algoritmo.costo_h[vecino], 2)
-                    f = round(self.algoritmo.costo_f[vecino], 2)
-                    
-                    self.celdas[vecino].colorear('visitado')
-                    self.celdas[vecino].actualizar_valores(g, h, f)
-            
-            # ACTUALIZAR LISTAS
+            # ACTUALIZAR LISTAS (el algoritmo ya terminó este paso)
             self.actualizar_listas()
             
-            if encontrado:
+            # Vecinos del paso, hasta el primer evento del siguiente
+            vecinos = 0
+            for siguiente in eventos:
+                if siguiente.tipo != GENERAR and siguiente.tipo != ACTUALIZAR:
+                    pendiente = siguiente
+                    break
+                self.dibujar_vecino(siguiente)
+                vecinos += 1
+            
+            if pendiente.tipo == ENCONTRADO:
                 camino = reconstruir_camino(self.algoritmo.vino_de,
                                            self.inicio, self.fin)
                 
@@ -774,12 +861,12 @@ Chebyshev: max(|dx|, |dy|)
                 btn_siguiente.destroy()
                 return
             
-            f_actual = round(self.algoritmo.costo_f.get(actual, 0), 2)
+            f_actual = round(evento.f, 2)
             
             info_text = f"""Paso {self.paso_actual}
 Explorando: {actual}
 F = {f_actual}
-Vecinos: {len(vecinos)}
+Vecinos: {vecinos}
 
 Ver listas →"""
             
@@ -841,6 +928,7 @@ Ver listas →"""
         self.inicio = None
         self.fin = None
         self.obstaculos = set()
+        self.replanificador = None
         
         for celda in self.celdas.values():
             celda.colorear('vacio')
@@ -0,0 +1,182 @@
+"""
+Obstáculos en un mapa de un byte por celda
+
+Los motores reciben los obstáculos como un set de tuplas (fila, col): unos
+60-70 bytes por obstáculo, y construir el set ya es un recorrido en Python.
+En un mapa de 10000x10000 con un 30 % de obstáculos serían ~2 GB solo
+para el set.
+
+MapaBits guarda lo mismo en un bytearray de filas * columnas (1 =
+bloqueada, la misma representación que MascaraVecinos.bloqueado) y se
+comporta como un set de tuplas, así que se pasa directamente como
+'obstaculos' a AlgoritmoAStar y a cualquier motor:
+
+    mapa = MapaBits(filas, columnas)
+    mapa.add((3, 4))
+    AlgoritmoAStar(inicio, fin, filas, columnas, mapa, config_costos)
+
+MascaraVecinos, TablaSaltos y ComponentesConexas copian el bytearray
+directamente en lugar de recorrer las tuplas.
+
+Con NumPy, como_numpy() da una vista bool (filas, columnas) que comparte
+la memoria, y desde_numpy() construye un MapaBits a partir de un arreglo.
+"""
+import struct
+from collections.abc import MutableSet
+
+from funciones_astar import np
+
+_FIRMA = b'MAP1'
+_CABECERA = struct.Struct('<4sII')
+
+# Bytes por trozo al recorrer un mapa sobre memoryview
+_TROZO = 1 << 20
+
+
+class MapaBits(MutableSet):
+    """Set de celdas bloqueadas {(fila, col)} sobre un byte por celda"""
+
+    def __init__(self, filas, columnas, bloqueado=None):
+        """
+        Args:
+            filas: Número de filas de la cuadrícula
+            columnas: Número de columnas de la cuadrícula
+            bloqueado: bytearray de filas * columnas con 1 en las celdas
+                       bloqueadas (se usa sin copiar); también sirve un
+                       memoryview de bytes, p. ej. de memoria compartida.
+                       Por defecto, todo libre
+        """
+        if bloqueado is None:
+            bloqueado = bytearray(filas * columnas)
+        if len(bloqueado) != filas * columnas:
+            raise ValueError(
+                f"Se esperaban {filas * columnas} celdas y hay {len(bloqueado)}"
+            )
+        self.filas = filas
+        self.columnas = columnas
+        self.bloqueado = bloqueado
+
+    @classmethod
+    def desde_obstaculos(cls, filas, columnas, obstaculos):
+        """MapaBits con los obstáculos de cualquier iterable de tuplas"""
+        return cls(filas, columnas, bytes_bloqueados(filas, columnas, obstaculos))
+
+    @classmethod
+    def desde_numpy(cls, arreglo):
+        """MapaBits a partir de un arreglo (filas, columnas) (True = bloqueada)"""
+        if np is None:
+            raise ImportError("desde_numpy requiere NumPy")
+        filas, columnas = arreglo.shape
+        datos = np.ascontiguousarray(arreglo, dtype=np.bool_)
+        return cls(filas, columnas, bytearray(datos.tobytes()))
+
+    def como_numpy(self):
+        """Vista bool (filas, columnas) que comparte memoria con el mapa"""
+        if np is None:
+            raise ImportError("como_numpy requiere NumPy")
+        return np.frombuffer(self.bloqueado, dtype=np.bool_).reshape(self.filas,
+                                                                     self.columnas)
+
+    def _indice(self, nodo):
+        fila, col = nodo
+        if 0 <= fila < self.filas and 0 <= col < self.columnas:
+            return fila * self.columnas + col
+        return None
+
+    # ===== INTERFAZ DE SET =====
+
+    def __contains__(self, nodo):
+        indice = self._indice(nodo)
+        return indice is not None and self.bloqueado[indice] == 1
+
+    def _trozos(self):
+        """
+        (desplazamiento, trozo) con find/count sobre todo el mapa
+
+        Un memoryview no tiene find ni count: se copia por trozos de
+        _TROZO bytes en lugar de entero.
+        """
+        bloqueado = self.bloqueado
+        if not isinstance(bloqueado, memoryview):
+            yield 0, bloqueado
+            return
+        for inicio in range(0, len(bloqueado), _TROZO):
+            yield inicio, bloqueado[inicio:inicio + _TROZO].tobytes()
+
+    def __iter__(self):
+        columnas = self.columnas
+        for desplazamiento, trozo in self._trozos():
+            indice = trozo.find(1)
+            while indice >= 0:
+                yield divmod(desplazamiento + indice, columnas)
+                indice = trozo.find(1, indice + 1)
+
+    def __len__(self):
+        return sum(trozo.count(1) for _, trozo in self._trozos())
+
+    def add(self, nodo):
+        indice = self._indice(nodo)
+        if indice is not None:
+            self.bloqueado[indice] = 1
+
+    def discard(self, nodo):
+        indice = self._indice(nodo)
+        if indice is not None:
+            self.bloqueado[indice] = 0
+
+    def copy(self):
+        return MapaBits(self.filas, self.columnas, bytearray(self.bloqueado))
+
+    def __repr__(self):
+        return f"MapaBits({self.filas}x{self.columnas}, {len(self)} bloqueadas)"
+
+    # ===== PERSISTENCIA =====
+
+    def guardar(self, ruta):
+        """Guarda el mapa: cabecera fija y un byte por celda"""
+        with open(ruta, 'wb') as archivo:
+            archivo.write(_CABECERA.pack(_FIRMA, self.filas, self.columnas))
+            archivo.write(self.bloqueado)
+
+    @classmethod
+    def cargar(cls, ruta):
+        """
+        Carga un mapa guardado con guardar()
+
+        Returns:
+            MapaBits
+        """
+        with open(ruta, 'rb') as archivo:
+            datos = archivo.read(_CABECERA.size)
+            if len(datos) != _CABECERA.size:
+                raise ValueError(f"{ruta}: archivo de mapa truncado")
+            firma, filas, columnas = _CABECERA.unpack(datos)
+            if firma != _FIRMA:
+                raise ValueError(f"{ruta}: no es un archivo de MapaBits")
+            bloqueado = bytearray(archivo.read())
+        if len(bloqueado) != filas * columnas:
+            raise ValueError(f"{ruta}: archivo de mapa truncado")
+        return cls(filas, columnas, bloqueado)
+
+
+def bytes_bloqueados(filas, columnas, obstaculos):
+    """
+    Un byte por celda (1 = bloqueada) a partir de los obstáculos
+
+    Args:
+        filas: Número de filas de la cuadrícula
+        columnas: Número de columnas de la cuadrícula
+        obstaculos: Set de tuplas o MapaBits; las celdas fuera de la
+                    cuadrícula se ignoran
+
+    Returns:
+        bytearray: Copia nueva (modificarla no afecta a obstaculos)
+    """
+    if (isinstance(obstaculos, MapaBits)
+            and (obstaculos.filas, obstaculos.columnas) == (filas, columnas)):
+        return bytearray(obstaculos.bloqueado)
+    bloqueado = bytearray(filas * columnas)
+    for fila, col in obstaculos:
+        if 0 <= fila < filas and 0 <= col < columnas:
+            bloqueado[fila * columnas + col] = 1
+    return bloqueado
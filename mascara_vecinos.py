@@ -0,0 +1,300 @@
+"""
+Máscara precompilada de vecinos por celda
+
+En lugar de reconstruir la lista de direcciones y consultar el set de
+obstáculos en cada expansión (como hace funciones_astar.obtener_vecinos),
+se guarda una máscara de 8 bits por celda: el bit k indica si el movimiento
+k es legal bajo los obstáculos actuales y la restricción diagonal.
+
+MEMORIA: 3 bytes por celda (una copia de los obstáculos en un bytearray y
+las máscaras en un array('H') con marca de "calculada"). Conviene para
+mapas que se consultan muchas veces (compartida con mascara=) o que se
+modifican celda a celda.
+
+Para UNA consulta sobre un mapa grande, MascaraPerezosa tiene la misma
+interfaz sin memoria por celda del mapa: calcula cada máscara la primera
+vez que se pide, leyendo los obstáculos del llamador sin copiarlos, y la
+guarda en un dict por índice (memoria proporcional a las celdas
+visitadas). Es la que crean AlgoritmoAStar, el motor de arreglos y los
+demás motores derivados cuando no reciben mascara=.
+
+Orden de los bits (el mismo orden en que obtener_vecinos genera vecinos):
+    bit 0: derecha        (0, 1)
+    bit 1: abajo          (1, 0)
+    bit 2: izquierda      (0, -1)
+    bit 3: arriba         (-1, 0)
+    bit 4: abajo-derecha  (1, 1)
+    bit 5: abajo-izquierda (1, -1)
+    bit 6: arriba-derecha (-1, 1)
+    bit 7: arriba-izquierda (-1, -1)
+
+Los bits diagonales ya aplican la regla de puede_moverse_diagonal (ambas
+celdas adyacentes libres); si el motor no permite diagonales simplemente
+ignora los bits 4-7.
+
+Las máscaras se calculan bajo demanda (o todas con precalcular) y, cuando
+cambia una sola celda, solo se invalidan esa celda y sus 8 vecinas.
+"""
+from array import array
+
+from mapa_bits import MapaBits, bytes_bloqueados
+
+# (cambio_fila, cambio_columna, clave de costo) en el orden de los bits
+MOVIMIENTOS = [
+    (0, 1, 'horizontal'),
+    (1, 0, 'vertical'),
+    (0, -1, 'horizontal'),
+    (-1, 0, 'vertical'),
+    (1, 1, 'diagonal'),
+    (1, -1, 'diagonal'),
+    (-1, 1, 'diagonal'),
+    (-1, -1, 'diagonal')
+]
+
+BITS_RECTOS = 0x0F
+BITS_DIAGONALES = 0xF0
+
+# (cambio_fila, cambio_columna) -> bit del movimiento
+BIT_MOVIMIENTO = {(df, dc): 1 << bit for bit, (df, dc, _) in enumerate(MOVIMIENTOS)}
+
+# Marca de "máscara ya calculada" en el arreglo interno
+_CALCULADA = 0x100
+
+
+class MascaraVecinos:
+    """Máscara de movimientos legales por celda, con actualización incremental"""
+
+    def __init__(self, filas, columnas, obstaculos, memorizar=True):
+        """
+        Args:
+            filas: Número de filas de la cuadrícula
+            columnas: Número de columnas de la cuadrícula
+            obstaculos: Set de tuplas con posiciones bloqueadas (o MapaBits)
+            memorizar: Si es False no se guarda ninguna máscara y cada
+                       consulta se recalcula (memoria O(1), para IDA*)
+        """
+        self.filas = filas
+        self.columnas = columnas
+        self.bloqueado = bytes_bloqueados(filas, columnas, obstaculos)
+
+        # 0 = sin calcular; si no, _CALCULADA | máscara
+        self._mascaras = array('H', [0]) * (filas * columnas)
+
+    def _calcular(self, fila, col):
+        bloqueado = self.bloqueado
+        columnas = self.columnas
+        i = fila * columnas + col
+        arriba = fila > 0 and not bloqueado[i - columnas]
+        abajo = fila < self.filas - 1 and not bloqueado[i + columnas]
+        izquierda = col > 0 and not bloqueado[i - 1]
+        derecha = col < columnas - 1 and not bloqueado[i + 1]
+
+        mascara = derecha | abajo << 1 | izquierda << 2 | arriba << 3
+        # Diagonales: destino libre y ambas celdas adyacentes libres
+        if abajo and derecha and not bloqueado[i + columnas + 1]:
+            mascara |= 0x10
+        if abajo and izquierda and not bloqueado[i + columnas - 1]:
+            mascara |= 0x20
+        if arriba and derecha and not bloqueado[i - columnas + 1]:
+            mascara |= 0x40
+        if arriba and izquierda and not bloqueado[i - columnas - 1]:
+            mascara |= 0x80
+        return mascara
+
+    def mascara(self, indice):
+        """Byte de movimientos legales de la celda con índice plano dado"""
+        valor = self._mascaras[indice]
+        if not valor:
+            valor = _CALCULADA | self._calcular(*divmod(indice, self.columnas))
+            self._mascaras[indice] = valor
+        return valor & 0xFF
+
+    def precalcular(self):
+        """Calcula las máscaras de todas las celdas de una vez"""
+        columnas = self.columnas
+        for fila in range(self.filas):
+            base = fila * columnas
+            for col in range(columnas):
+                self._mascaras[base + col] = _CALCULADA | self._calcular(fila, col)
+
+    def esta_bloqueada(self, celda):
+        return self.bloqueado[celda[0] * self.columnas + celda[1]] == 1
+
+    def cambiar_celda(self, celda, bloqueada):
+        """
+        Marca una celda como obstáculo o libre e invalida las máscaras afectadas
+
+        Un cambio en una celda solo altera los movimientos de ella misma y de
+        sus 8 vecinas (como destino o como celda adyacente de una diagonal).
+
+        Returns:
+            bool: True si la celda cambió de estado
+        """
+        fila, col = celda
+        indice = fila * self.columnas + col
+        if self.bloqueado[indice] == int(bool(bloqueada)):
+            return False
+        self.bloqueado[indice] = int(bool(bloqueada))
+        for df in (-1, 0, 1):
+            for dc in (-1, 0, 1):
+                f, c = fila + df, col + dc
+                if 0 <= f < self.filas and 0 <= c < self.columnas:
+                    self._mascaras[f * self.columnas + c] = 0
+        return True
+
+    def vecinos(self, nodo, permitir_diagonal=False):
+        """
+        Vecinos válidos de un nodo, en el mismo orden que obtener_vecinos
+
+        Args:
+            nodo: Tupla (fila, col)
+            permitir_diagonal: Si True, incluye los movimientos diagonales
+
+        Returns:
+            list: Lista de tuplas (fila, col)
+        """
+        fila, col = nodo
+        mascara = self.mascara(fila * self.columnas + col)
+        if not permitir_diagonal:
+            mascara &= BITS_RECTOS
+        return [(fila + df, col + dc) for df, dc in _DESPLAZAMIENTOS[mascara]]
+
+    def tabla_movimientos(self, config_costos, permitir_diagonal=False):
+        """
+        Tabla de 256 entradas: máscara -> tupla de (delta_indice, peso)
+
+        Permite a los motores con índices planos generar vecinos con
+        vecino = indice + delta sin comprobar límites ni obstáculos.
+
+        Args:
+            config_costos: Diccionario con 'horizontal', 'vertical', 'diagonal'
+            permitir_diagonal: Si False, las entradas ignoran los bits diagonales
+
+        Returns:
+            list: tabla[mascara] = ((delta, peso), ...)
+        """
+        movimientos = [(df * self.columnas + dc, config_costos[clave])
+                       for df, dc, clave in MOVIMIENTOS]
+        bits_validos = 0xFF if permitir_diagonal else BITS_RECTOS
+        return [
+            tuple(movimientos[bit] for bit in range(8)
+                  if mascara & bits_validos & (1 << bit))
+            for mascara in range(256)
+        ]
+
+
+class _BloqueadoDesdeObstaculos:
+    """Vista {indice plano: 1 si bloqueada} sobre un set de tuplas, sin copiarlo"""
+
+    __slots__ = ('obstaculos', 'columnas', 'total')
+
+    def __init__(self, obstaculos, columnas, total):
+        self.obstaculos = obstaculos
+        self.columnas = columnas
+        self.total = total
+
+    def __getitem__(self, indice):
+        if not 0 <= indice < self.total:
+            raise IndexError(indice)
+        return 1 if divmod(indice, self.columnas) in self.obstaculos else 0
+
+    def __len__(self):
+        return self.total
+
+    def __iter__(self):
+        for indice in range(self.total):
+            yield self[indice]
+
+
+class MascaraPerezosa(MascaraVecinos):
+    """
+    Misma interfaz que MascaraVecinos sin memoria por celda
+
+    Cada máscara se calcula la primera vez que se pide a partir de los
+    obstáculos, que NO se copian: un MapaBits de las mismas dimensiones se
+    lee directamente y un set se consulta por tuplas (como
+    obtener_vecinos). Después se lee de un dict por índice, así que cada
+    celda cuesta sus consultas de obstáculos una sola vez. Construirla es
+    O(1), así que una consulta entre celdas cercanas en un mapa enorme
+    cuesta lo que expande, y los motores con memoria acotada (IDA*) no
+    pagan un arreglo por celda.
+
+    El dict ocupa unos 100 bytes por celda visitada frente a los 3 bytes
+    por celda del mapa de MascaraVecinos: para búsquedas que recorren
+    buena parte del mapa, o muchas consultas sobre el mismo mapa, conviene
+    pasar una MascaraVecinos con mascara=. Con memorizar=False no se guarda
+    nada (IDA* la usa así para mantener su memoria acotada).
+
+    Como lee los obstáculos del llamador, no admite cambiar_celda: para
+    mapas que cambian, modifique los obstáculos o use MascaraVecinos.
+    """
+
+    def __init__(self, filas, columnas, obstaculos, memorizar=True):
+        """
+        Args:
+            filas: Número de filas de la cuadrícula
+            columnas: Número de columnas de la cuadrícula
+            obstaculos: Set de tuplas con posiciones bloqueadas (o MapaBits)
+            memorizar: Si es False no se guarda ninguna máscara y cada
+                       consulta se recalcula (memoria O(1), para IDA*)
+        """
+        self.filas = filas
+        self.columnas = columnas
+        self.obstaculos = obstaculos
+        if (isinstance(obstaculos, MapaBits)
+                and (obstaculos.filas, obstaculos.columnas) == (filas, columnas)):
+            # Mismo formato que MascaraVecinos.bloqueado: _calcular sirve tal cual
+            self.bloqueado = obstaculos.bloqueado
+        else:
+            self.bloqueado = _BloqueadoDesdeObstaculos(obstaculos, columnas,
+                                                       filas * columnas)
+            self._calcular = self._calcular_en_set
+        self._memoria = {} if memorizar else None   # índice -> máscara
+
+    def _calcular_en_set(self, fila, col):
+        obstaculos = self.obstaculos
+        arriba = fila > 0 and (fila - 1, col) not in obstaculos
+        abajo = fila < self.filas - 1 and (fila + 1, col) not in obstaculos
+        izquierda = col > 0 and (fila, col - 1) not in obstaculos
+        derecha = col < self.columnas - 1 and (fila, col + 1) not in obstaculos
+
+        mascara = derecha | abajo << 1 | izquierda << 2 | arriba << 3
+        # Diagonales: destino libre y ambas celdas adyacentes libres
+        if abajo and derecha and (fila + 1, col + 1) not in obstaculos:
+            mascara |= 0x10
+        if abajo and izquierda and (fila + 1, col - 1) not in obstaculos:
+            mascara |= 0x20
+        if arriba and derecha and (fila - 1, col + 1) not in obstaculos:
+            mascara |= 0x40
+        if arriba and izquierda and (fila - 1, col - 1) not in obstaculos:
+            mascara |= 0x80
+        return mascara
+
+    def mascara(self, indice):
+        """Byte de movimientos legales de la celda con índice plano dado"""
+        memoria = self._memoria
+        if memoria is None:
+            return self._calcular(*divmod(indice, self.columnas))
+        valor = memoria.get(indice)
+        if valor is None:
+            valor = memoria[indice] = self._calcular(*divmod(indice, self.columnas))
+        return valor
+
+    def precalcular(self):
+        """Sin efecto: las máscaras se calculan solo para las celdas visitadas"""
+
+    def esta_bloqueada(self, celda):
+        return self.bloqueado[celda[0] * self.columnas + celda[1]] == 1
+
+    def cambiar_celda(self, celda, bloqueada):
+        raise TypeError(
+            "MascaraPerezosa lee los obstáculos sin copiarlos: modifique los "
+            "obstáculos o use MascaraVecinos"
+        )
+
+
+# máscara -> ((df, dc), ...) en orden de bits
+_DESPLAZAMIENTOS = [
+    tuple((df, dc) for bit, (df, dc, _) in enumerate(MOVIMIENTOS) if mascara & (1 << bit))
+    for mascara in range(256)
+]
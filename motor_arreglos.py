@@ -0,0 +1,377 @@
+"""
+Motor de búsqueda A* basado en arreglos planos
+
+En lugar de diccionarios y sets indexados por tuplas (fila, col), este motor
+numera las celdas en orden por filas (indice = fila * columnas + col) y guarda
+el estado de la búsqueda en buffers preasignados:
+
+- costo G:      array('d') con infinito para nodos no visitados
+- vino_de:      array('q') con -1 para nodos sin padre
+- cerrado:      bytearray (1 = explorado)
+- vecinos:      máscara de movimientos legales por celda (MascaraPerezosa
+                por defecto, como AlgoritmoAStar)
+
+Mantiene el mismo contrato que AlgoritmoAStar (ejecutar_paso / ejecutar_completo)
+y expone vistas de solo lectura con claves (fila, col) para que el resto del
+proyecto (interfaz, estadísticas, verificación) siga funcionando.
+"""
+from array import array
+from collections.abc import Mapping, Set
+
+from algoritmo_astar import AlgoritmoAStar
+from eventos_busqueda import (
+    EXPANDIR, GENERAR, ACTUALIZAR, ENCONTRADO, evento, evento_agotado
+)
+from mascara_vecinos import MascaraPerezosa
+
+INFINITO = float('inf')
+
+
+class VistaCostos(Mapping):
+    """Vista de solo lectura {(fila, col): valor} sobre un buffer plano"""
+
+    def __init__(self, motor, obtener_valor):
+        self._motor = motor
+        self._obtener_valor = obtener_valor
+
+    def __getitem__(self, nodo):
+        indice = self._motor.a_indice(nodo)
+        if indice is None or self._motor._g[indice] == INFINITO:
+            raise KeyError(nodo)
+        return self._obtener_valor(indice)
+
+    def __iter__(self):
+        columnas = self._motor.columnas
+        g = self._motor._g
+        for indice in range(len(g)):
+            if g[indice] != INFINITO:
+                yield divmod(indice, columnas)
+
+    def __len__(self):
+        return self._motor._visitados
+
+
+class VistaPadres(Mapping):
+    """Vista de solo lectura {nodo: padre} sobre el buffer vino_de"""
+
+    def __init__(self, motor):
+        self._motor = motor
+
+    def __getitem__(self, nodo):
+        indice = self._motor.a_indice(nodo)
+        if indice is None or self._motor._padre[indice] < 0:
+            raise KeyError(nodo)
+        return divmod(self._motor._padre[indice], self._motor.columnas)
+
+    def __iter__(self):
+        columnas = self._motor.columnas
+        padre = self._motor._padre
+        for indice in range(len(padre)):
+            if padre[indice] >= 0:
+                yield divmod(indice, columnas)
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+
+class VistaCerrado(Set):
+    """Vista de solo lectura del conjunto de nodos cerrados"""
+
+    def __init__(self, motor):
+        self._motor = motor
+
+    def __contains__(self, nodo):
+        indice = self._motor.a_indice(nodo)
+        return indice is not None and self._motor._cerrado[indice] == 1
+
+    def __iter__(self):
+        columnas = self._motor.columnas
+        # Orden de exploración (igual que la lista cerrada del motor con dicts)
+        for indice in self._motor._orden_cerrado:
+            yield divmod(indice, columnas)
+
+    def __len__(self):
+        return len(self._motor._orden_cerrado)
+
+    def intersection(self, otros):
+        return {nodo for nodo in otros if nodo in self}
+
+
+class AlgoritmoAStarArreglos(AlgoritmoAStar):
+    """
+    Variante de AlgoritmoAStar con estado en buffers planos.
+
+    Se obtiene con AlgoritmoAStar(..., motor='arreglos').
+    """
+
+    def __init__(self, inicio, fin, filas, columnas, obstaculos,
+                 config_costos, permitir_diagonal=False, tipo_heuristica='manhattan',
+                 motor='arreglos', cola='heapq', mascara=None, campos=None,
+                 tabla_alt=None, componentes=None):
+        self.inicio = inicio
+        self.fin = fin
+        self.filas = filas
+        self.columnas = columnas
+        self.obstaculos = obstaculos
+        self.config_costos = config_costos
+        self.permitir_diagonal = permitir_diagonal
+        self.tipo_heuristica = tipo_heuristica
+        self.motor = motor
+        self.cola = cola
+
+        total = filas * columnas
+
+        # Buffers preasignados (una posición por celda)
+        self._g = array('d', [INFINITO]) * total
+        self._padre = array('q', [-1]) * total
+        self._cerrado = bytearray(total)
+
+        # Vecinos: máscara por celda + tabla máscara -> ((delta, peso), ...)
+        if mascara is None:
+            mascara = MascaraPerezosa(filas, columnas, obstaculos)
+        self.mascara = mascara
+        self._movimientos = mascara.tabla_movimientos(config_costos, permitir_diagonal)
+
+        # Frontera con índices enteros: (F, contador, indice)
+        self._frontera = self._crear_cola()
+        self._orden_cerrado = array('q')
+        self._visitados = 0
+        self._indice_fin = fin[0] * columnas + fin[1]
+        self._preparar_heuristica(campos, tabla_alt)
+        self._heuristica_indice = self._heuristica_hacia(fin, indices=True)
+
+        # Vistas compatibles con el motor de diccionarios
+        self.costo_g = VistaCostos(self, lambda i: self._g[i])
+        self.costo_h = VistaCostos(self, self._heuristica_indice)
+        self.costo_f = VistaCostos(self, lambda i: self._g[i] + self._heuristica_indice(i))
+        self.vino_de = VistaPadres(self)
+        self.cerrado = VistaCerrado(self)
+
+        self.contador = 0
+        self.nodos_explorados = 0
+        self.vecinos_totales_evaluados = 0
+        self.extracciones_obsoletas = 0
+
+        self.inicializar()
+        self._comprobar_componentes(componentes)
+
+    def a_indice(self, nodo):
+        """Convierte (fila, col) a índice plano, o None si está fuera del grid"""
+        fila, col = nodo
+        if 0 <= fila < self.filas and 0 <= col < self.columnas:
+            return fila * self.columnas + col
+        return None
+
+    @property
+    def frontera(self):
+        """Frontera con nodos (fila, col), en el formato del motor con dicts"""
+        columnas = self.columnas
+        return [(f, c, divmod(i, columnas)) for f, c, i in self._frontera]
+
+    def inicializar(self):
+        """Inicializa el nodo de inicio en los buffers"""
+        indice = self.a_indice(self.inicio)
+        self._g[indice] = 0.0
+        self._visitados = 1
+        self._frontera.insertar(indice, self._heuristica_indice(indice), self.contador)
+        self.contador += 1
+
+    def _vaciar_frontera(self):
+        self._frontera = self._crear_cola()
+
+    def _vecinos(self, indice):
+        """Lista de (indice_vecino, peso) con las mismas reglas que obtener_vecinos"""
+        return [(indice + delta, peso)
+                for delta, peso in self._movimientos[self.mascara.mascara(indice)]]
+
+    def _paso_indices(self):
+        """
+        Ejecuta un paso trabajando solo con índices.
+
+        Returns:
+            tuple: (indice_actual, indices_vecinos_explorados, encontrado)
+                   indice_actual es -1 si la frontera está vacía
+        """
+        frontera = self._frontera
+        cerrado = self._cerrado
+        g = self._g
+        padre = self._padre
+
+        # Descartar entradas obsoletas sin recursión
+        while frontera:
+            _, _, actual = frontera.extraer()
+            if not cerrado[actual]:
+                break
+            self.extracciones_obsoletas += 1
+        else:
+            return -1, [], False
+
+        cerrado[actual] = 1
+        self._orden_cerrado.append(actual)
+        self.nodos_explorados += 1
+
+        if actual == self._indice_fin:
+            return actual, [], True
+
+        g_actual = g[actual]
+        explorados = []
+        for delta, peso in self._movimientos[self.mascara.mascara(actual)]:
+            vecino = actual + delta
+            if cerrado[vecino]:
+                continue
+            nuevo_costo_g = g_actual + peso
+            anterior = g[vecino]
+            if nuevo_costo_g < anterior:
+                if anterior == INFINITO:
+                    self._visitados += 1
+                g[vecino] = nuevo_costo_g
+                padre[vecino] = actual
+                frontera.insertar(
+                    vecino, nuevo_costo_g + self._heuristica_indice(vecino),
+                    self.contador
+                )
+                self.contador += 1
+                explorados.append(vecino)
+                self.vecinos_totales_evaluados += 1
+
+        return actual, explorados, False
+
+    def ejecutar_paso(self):
+        """
+        Ejecuta UN PASO del algoritmo A* (mismo contrato que AlgoritmoAStar)
+
+        Returns:
+            tuple: (nodo_actual, lista_vecinos_explorados, encontrado)
+        """
+        actual, explorados, encontrado = self._paso_indices()
+        if actual < 0:
+            return None, [], False
+        columnas = self.columnas
+        return (divmod(actual, columnas),
+                [divmod(v, columnas) for v in explorados],
+                encontrado)
+
+    def iterar_eventos(self):
+        """
+        Flujo de eventos (ver AlgoritmoAStar.iterar_eventos)
+
+        Mismo bucle que _paso_indices; los nodos se convierten a (fila, col)
+        solo al emitir cada evento.
+
+        Yields:
+            Evento
+        """
+        frontera = self._frontera
+        cerrado = self._cerrado
+        g = self._g
+        padre = self._padre
+        heuristica = self._heuristica_indice
+        movimientos = self._movimientos
+        mascara = self.mascara.mascara
+        columnas = self.columnas
+        indice_fin = self._indice_fin
+
+        while True:
+            while frontera:
+                _, _, actual = frontera.extraer()
+                if not cerrado[actual]:
+                    break
+                self.extracciones_obsoletas += 1
+            else:
+                yield evento_agotado()
+                return
+
+            cerrado[actual] = 1
+            self._orden_cerrado.append(actual)
+            self.nodos_explorados += 1
+
+            g_actual = g[actual]
+            h = heuristica(actual)
+            nodo = divmod(actual, columnas)
+            anterior = padre[actual]
+            datos = (nodo, g_actual, h, g_actual + h,
+                     divmod(anterior, columnas) if anterior >= 0 else None)
+
+            if actual == indice_fin:
+                yield evento(EXPANDIR, *datos)
+                yield evento(ENCONTRADO, *datos)
+                return
+
+            generados = []
+            for delta, peso in movimientos[mascara(actual)]:
+                vecino = actual + delta
+                if cerrado[vecino]:
+                    continue
+                nuevo_costo_g = g_actual + peso
+                anterior = g[vecino]
+                if nuevo_costo_g < anterior:
+                    if anterior == INFINITO:
+                        self._visitados += 1
+                    g[vecino] = nuevo_costo_g
+                    padre[vecino] = actual
+                    h = heuristica(vecino)
+                    f = nuevo_costo_g + h
+                    frontera.insertar(vecino, f, self.contador)
+                    self.contador += 1
+                    self.vecinos_totales_evaluados += 1
+                    generados.append(evento(GENERAR if anterior == INFINITO else ACTUALIZAR,
+                                            divmod(vecino, columnas), nuevo_costo_g, h, f, nodo))
+
+            yield evento(EXPANDIR, *datos)
+            yield from generados
+
+    def reconstruir_indices(self):
+        """Camino en índices planos, sin inicio ni fin (como reconstruir_camino)"""
+        camino = []
+        indice_inicio = self.a_indice(self.inicio)
+        actual = self._padre[self._indice_fin]
+        while actual >= 0 and actual != indice_inicio:
+            camino.append(actual)
+            actual = self._padre[actual]
+        camino.reverse()
+        return camino
+
+    def reconstruir(self):
+        """Camino con nodos (fila, col), sin inicio ni fin"""
+        columnas = self.columnas
+        return [divmod(i, columnas) for i in self.reconstruir_indices()]
+
+    def ejecutar_completo(self):
+        """
+        Ejecuta el algoritmo completo hasta encontrar el camino
+
+        Returns:
+            tuple: (exito, camino, nodos_explorados, costos)
+        """
+        while True:
+            actual, _, encontrado = self._paso_indices()
+            if actual < 0:
+                return False, [], self.nodos_explorados, {}
+            if encontrado:
+                camino = self.reconstruir()
+                costos = {
+                    'g': self.costo_g,
+                    'h': self.costo_h,
+                    'f': self.costo_f
+                }
+                return True, camino, self.nodos_explorados, costos
+
+    def obtener_estadisticas(self):
+        """
+        Obtiene estadísticas del estado actual del algoritmo
+
+        Returns:
+            dict: Diccionario con estadísticas
+        """
+        g_fin = self._g[self._indice_fin]
+        return {
+            'nodos_explorados': self.nodos_explorados,
+            'nodos_en_frontera': len(self._frontera),
+            'nodos_cerrados': len(self._orden_cerrado),
+            'vecinos_evaluados': self.vecinos_totales_evaluados,
+            'costo_g_objetivo': None if g_fin == INFINITO else g_fin,
+            'extracciones_obsoletas': self.extracciones_obsoletas,
+            'inserciones_frontera': self._frontera.inserciones,
+            'tamano_maximo_frontera': self._frontera.tamano_maximo,
+            'inalcanzable': self.inalcanzable
+        }
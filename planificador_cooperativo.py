@@ -0,0 +1,472 @@
+"""
+Planificación cooperativa multiagente (Cooperative A* / WHCA*)
+
+Los agentes se planifican uno tras otro, en orden de prioridad. Cada uno
+busca en ESPACIO-TIEMPO (nodos (fila, col, t)) con una acción extra de
+ESPERA, evitando las casillas-tiempo que ya reservaron los anteriores.
+
+CONFLICTOS QUE SE EVITAN:
+- De vértice: dos agentes en la misma celda en el mismo instante
+- De arista: dos agentes intercambiando sus celdas entre t y t + 1
+- Con agentes ya llegados: el destino queda ocupado desde la llegada
+- Con agentes sin plan: se quedan quietos y la ronda (toda la consulta, o
+  la ventana) se repite con su celda reservada antes que nadie
+
+HEURÍSTICA:
+La distancia real al fin ignorando a los demás agentes (un CampoDistancias
+por objetivo, calculado una vez con Dijkstra inverso).
+
+MODOS:
+- ventana=None: Cooperative A*. Cada agente planifica hasta su destino y
+  queda reservado allí para siempre.
+- ventana=w: Windowed Hierarchical Cooperative A*. Se planifican solo w
+  pasos, todos los agentes avanzan w // 2 y se vuelve a planificar desde
+  las nuevas posiciones con la tabla de reservas vacía.
+
+Los caminos son listas de posiciones por instante (t = 0, 1, 2, ...),
+incluido el inicio; una celda repetida es una espera. Después del último
+instante el agente permanece en su última celda.
+
+LÍMITE DE TIEMPO:
+Una búsqueda sin salida (por ejemplo, un destino que nunca queda libre)
+exploraría todas las casillas-tiempo hasta el límite. Si el destino ya es
+el destino permanente de otro agente la búsqueda falla sin expandir nada.
+Por defecto el límite es el último instante reservado más el doble de los
+pasos del camino sin agentes (campo.distancia): después de la última
+reserva el mapa ya no cambia, y el doble deja margen para rodear a los
+agentes detenidos. Depende de la consulta, no del área del mapa.
+"""
+import math
+
+from algoritmo_astar import AlgoritmoAStar
+from campo_distancias import INFINITO, CampoDistancias
+from funciones_astar import calcular_peso_movimiento
+from mascara_vecinos import MascaraVecinos
+
+
+class TablaReservas:
+    """
+    Casillas-tiempo y movimientos reservados por los agentes ya planificados
+
+    Todo se guarda en diccionarios con claves enteras:
+    - celda en el instante t:        t * total + indice
+    - movimiento desde -> hacia en t: (t * total + desde) * total + hacia
+    """
+
+    def __init__(self, filas, columnas):
+        self.filas = filas
+        self.columnas = columnas
+        self.total = filas * columnas
+        self._celdas = {}       # clave de casilla-tiempo -> agente
+        self._aristas = {}      # clave de movimiento -> agente
+        self._ultima = {}       # indice -> último instante reservado
+        self._destinos = {}     # indice -> instante desde el que queda ocupado
+        self.ultimo_instante = -1
+
+    def reservar(self, agente, camino, tiempo_inicial=0, permanente=False):
+        """
+        Reserva un camino temporal
+
+        Args:
+            agente: Identificador del agente
+            camino: Lista de posiciones (fila, col), una por instante
+            tiempo_inicial: Instante de la primera posición
+            permanente: Si True, la última celda queda ocupada para siempre
+        """
+        total, columnas = self.total, self.columnas
+        anterior = None
+        for paso, (fila, col) in enumerate(camino):
+            t = tiempo_inicial + paso
+            indice = fila * columnas + col
+            self._celdas[t * total + indice] = agente
+            if self._ultima.get(indice, -1) < t:
+                self._ultima[indice] = t
+                if t > self.ultimo_instante:
+                    self.ultimo_instante = t
+            if anterior is not None and anterior != indice:
+                self._aristas[((t - 1) * total + anterior) * total + indice] = agente
+            anterior = indice
+        if permanente and anterior is not None:
+            self._destinos[anterior] = tiempo_inicial + len(camino) - 1
+
+    def ocupada(self, indice, t):
+        """True si otro agente está en la celda en el instante t"""
+        if t * self.total + indice in self._celdas:
+            return True
+        desde = self._destinos.get(indice)
+        return desde is not None and t >= desde
+
+    def intercambio(self, desde, hacia, t):
+        """True si otro agente va de hacia a desde entre t y t + 1"""
+        return (t * self.total + hacia) * self.total + desde in self._aristas
+
+    def libre_desde(self, indice, t):
+        """True si nadie reserva la celda en t ni en ningún instante posterior"""
+        return self._ultima.get(indice, -1) < t and indice not in self._destinos
+
+    def destino_ocupado(self, indice):
+        """True si la celda es el destino permanente de algún agente"""
+        return indice in self._destinos
+
+    def limpiar(self):
+        self._celdas.clear()
+        self._aristas.clear()
+        self._ultima.clear()
+        self._destinos.clear()
+        self.ultimo_instante = -1
+
+    def __len__(self):
+        return len(self._celdas)
+
+
+class AlgoritmoAStarEspacioTiempo(AlgoritmoAStar):
+    """
+    A* sobre nodos (fila, col, t) que respeta una tabla de reservas.
+
+    Reutiliza la frontera, los diccionarios de costos y el bucle de
+    AlgoritmoAStar; cambian los sucesores (vecinos + esperar, un instante
+    más tarde) y la condición de llegada.
+    """
+
+    def __init__(self, inicio, fin, filas, columnas, obstaculos,
+                 config_costos, permitir_diagonal=False, reservas=None,
+                 campo=None, tiempo_inicial=0, limite_tiempo=None, ventana=None,
+                 costo_espera=None, cola='heapq', mascara=None):
+        """
+        Args:
+            inicio: Tupla (fila, col) del agente en tiempo_inicial
+            fin: Tupla (fila, col) del destino
+            filas, columnas, obstaculos, config_costos, permitir_diagonal:
+                Igual que AlgoritmoAStar
+            reservas: TablaReservas de los agentes anteriores
+            campo: CampoDistancias hacia fin (heurística); se calcula si es None
+            tiempo_inicial: Instante en que empieza la búsqueda
+            limite_tiempo: Último instante que se explora (por defecto, el
+                           último instante reservado más el doble de los
+                           pasos del camino sin agentes)
+            ventana: Si se indica, la búsqueda termina al llegar a
+                     tiempo_inicial + ventana aunque no esté en el destino
+            costo_espera: Costo de esperar un instante (por defecto, el
+                          menor costo recto)
+            cola, mascara: Igual que AlgoritmoAStar
+        """
+        if reservas is None:
+            reservas = TablaReservas(filas, columnas)
+        if campo is None:
+            campo = CampoDistancias(fin, filas, columnas, obstaculos,
+                                    config_costos, permitir_diagonal, mascara)
+        if costo_espera is None:
+            costo_espera = min(config_costos['horizontal'], config_costos['vertical'])
+        if limite_tiempo is None:
+            limite_tiempo = self._limite_por_defecto(
+                inicio, reservas, campo, tiempo_inicial, config_costos, permitir_diagonal
+            )
+
+        self.reservas = reservas
+        self.campo = campo
+        self.tiempo_inicial = tiempo_inicial
+        self.limite_tiempo = limite_tiempo
+        self.ventana = ventana
+        self.costo_espera = costo_espera
+        self.nodo_final = None
+
+        super().__init__((inicio[0], inicio[1], tiempo_inicial), fin, filas, columnas,
+                         obstaculos, config_costos, permitir_diagonal,
+                         cola=cola, mascara=mascara)
+
+        # Sin ventana hay que poder QUEDARSE en el destino: si otro agente
+        # ya se detiene allí para siempre, no hay nada que buscar
+        if ventana is None and reservas.destino_ocupado(fin[0] * columnas + fin[1]):
+            self.inalcanzable = True
+            self._vaciar_frontera()
+
+    @staticmethod
+    def _limite_por_defecto(inicio, reservas, campo, tiempo_inicial,
+                            config_costos, permitir_diagonal):
+        """Último instante reservado + 2 * pasos del camino sin agentes"""
+        distancia = campo.distancia(inicio)
+        if distancia == INFINITO:
+            return tiempo_inicial
+        costos = [config_costos['horizontal'], config_costos['vertical']]
+        if permitir_diagonal:
+            costos.append(config_costos['diagonal'])
+        pasos = math.ceil(distancia / min(costos) - 1e-9)
+        return max(tiempo_inicial, reservas.ultimo_instante) + 2 * pasos + 1
+
+    def _heuristica_hacia(self, objetivo, indices=False):
+        # Distancia real al destino (sin otros agentes), leída del campo
+        distancias = self.campo.distancias
+        columnas = self.columnas
+
+        def heuristica(nodo):
+            return distancias[nodo[0] * columnas + nodo[1]]
+
+        return heuristica
+
+    def ejecutar_paso(self):
+        """
+        Ejecuta UN PASO de la búsqueda en espacio-tiempo
+
+        Returns:
+            tuple: (nodo_actual, lista_vecinos_explorados, encontrado)
+                   con nodos (fila, col, t)
+        """
+        while self.frontera:
+            _, _, actual = self.frontera.extraer()
+            if actual not in self.cerrado:
+                break
+            self.extracciones_obsoletas += 1
+        else:
+            return None, [], False
+
+        self.cerrado.add(actual)
+        self.nodos_explorados += 1
+
+        fila, col, t = actual
+        columnas = self.columnas
+        indice = fila * columnas + col
+        reservas = self.reservas
+
+        # ¿Llegó y puede quedarse? ¿O se acabó la ventana?
+        if (fila, col) == self.fin and reservas.libre_desde(indice, t + 1):
+            self.nodo_final = actual
+            return actual, [], True
+        if self.ventana is not None and t >= self.tiempo_inicial + self.ventana:
+            self.nodo_final = actual
+            return actual, [], True
+        if t >= self.limite_tiempo:
+            return actual, [], False
+
+        vecinos_explorados = []
+        siguientes = self.mascara.vecinos((fila, col), self.permitir_diagonal)
+        siguientes.append((fila, col))      # Esperar
+        for vecino_fila, vecino_col in siguientes:
+            vecino_indice = vecino_fila * columnas + vecino_col
+            if reservas.ocupada(vecino_indice, t + 1):
+                continue
+            if vecino_indice != indice and reservas.intercambio(indice, vecino_indice, t):
+                continue
+
+            vecino = (vecino_fila, vecino_col, t + 1)
+            if vecino in self.cerrado:
+                continue
+            if vecino_indice == indice:
+                peso = self.costo_espera
+            else:
+                peso = calcular_peso_movimiento((fila, col), (vecino_fila, vecino_col),
+                                                self.config_costos)
+            nuevo_costo_g = self.costo_g[actual] + peso
+            if vecino in self.costo_g and nuevo_costo_g >= self.costo_g[vecino]:
+                continue
+
+            self.costo_g[vecino] = nuevo_costo_g
+            self.costo_h[vecino] = self.heuristica(vecino)
+            self.costo_f[vecino] = nuevo_costo_g + self.costo_h[vecino]
+            self.frontera.insertar(vecino, self.costo_f[vecino], self.contador)
+            self.contador += 1
+            self.vino_de[vecino] = actual
+            vecinos_explorados.append(vecino)
+            self.vecinos_totales_evaluados += 1
+
+        return actual, vecinos_explorados, False
+
+    def ejecutar_completo(self):
+        """
+        Ejecuta la búsqueda hasta llegar (o agotar la ventana)
+
+        Returns:
+            tuple: (exito, camino, nodos_explorados, costos)
+                   camino es la lista de posiciones (fila, col) por instante,
+                   desde tiempo_inicial e INCLUYENDO el inicio
+        """
+        if self.campo.distancia(self.inicio[:2]) == INFINITO:
+            return False, [], self.nodos_explorados, {}
+
+        while self.frontera:
+            actual, _, encontrado = self.ejecutar_paso()
+            if actual is None:
+                break
+            if encontrado:
+                camino = [actual]
+                while camino[-1] in self.vino_de:
+                    camino.append(self.vino_de[camino[-1]])
+                camino.reverse()
+                costos = {'g': self.costo_g, 'h': self.costo_h, 'f': self.costo_f}
+                return True, [(f, c) for f, c, _ in camino], self.nodos_explorados, costos
+
+        return False, [], self.nodos_explorados, {}
+
+    def obtener_estadisticas(self):
+        estadisticas = super().obtener_estadisticas()
+        estadisticas['costo_g_objetivo'] = (self.costo_g[self.nodo_final]
+                                            if self.nodo_final is not None else None)
+        return estadisticas
+
+
+class PlanificadorCooperativo:
+    """Planifica varios agentes sin colisiones (Cooperative A* / WHCA*)"""
+
+    def __init__(self, filas, columnas, obstaculos, config_costos,
+                 permitir_diagonal=False, ventana=None, costo_espera=None,
+                 limite_tiempo=None):
+        """
+        Args:
+            filas: Número de filas de la cuadrícula
+            columnas: Número de columnas de la cuadrícula
+            obstaculos: Set de tuplas con posiciones bloqueadas
+            config_costos: Dict con costos {'horizontal', 'vertical', 'diagonal'}
+            permitir_diagonal: Si True, permite movimientos en 8 direcciones
+            ventana: Pasos por planificación (WHCA*); None para Cooperative A*
+            costo_espera: Costo de esperar un instante
+            limite_tiempo: Último instante planificado. Por defecto cada
+                           búsqueda calcula el suyo (ver el módulo) y con
+                           ventana se avanza hasta filas * columnas
+        """
+        if ventana is not None and ventana < 1:
+            raise ValueError("La ventana debe ser de al menos 1 paso")
+        self.filas = filas
+        self.columnas = columnas
+        self.obstaculos = obstaculos
+        self.config_costos = config_costos
+        self.permitir_diagonal = permitir_diagonal
+        self.ventana = ventana
+        self.costo_espera = costo_espera
+        self.limite_tiempo = limite_tiempo
+
+        # Construidos una vez y compartidos por todas las búsquedas
+        self.mascara = MascaraVecinos(filas, columnas, obstaculos)
+        self.campos = {}
+        self.reservas = TablaReservas(filas, columnas)
+        self.nodos_explorados = 0
+
+    def _campo(self, fin):
+        if fin not in self.campos:
+            self.campos[fin] = CampoDistancias(
+                fin, self.filas, self.columnas, self.obstaculos,
+                self.config_costos, self.permitir_diagonal, self.mascara
+            )
+        return self.campos[fin]
+
+    def _buscar(self, posicion, fin, agente, tiempo, ventana):
+        algoritmo = AlgoritmoAStarEspacioTiempo(
+            posicion, fin, self.filas, self.columnas, self.obstaculos,
+            self.config_costos, self.permitir_diagonal,
+            reservas=self.reservas, campo=self._campo(fin), tiempo_inicial=tiempo,
+            limite_tiempo=self.limite_tiempo, ventana=ventana,
+            costo_espera=self.costo_espera, mascara=self.mascara
+        )
+        exito, camino, nodos, _ = algoritmo.ejecutar_completo()
+        self.nodos_explorados += nodos
+        return exito, camino
+
+    def planificar(self, agentes):
+        """
+        Planifica todos los agentes en orden de prioridad
+
+        Args:
+            agentes: Lista de tuplas (inicio, fin); el primero tiene prioridad
+
+        Returns:
+            list: Una tupla (exito, camino) por agente. camino es la lista de
+                  posiciones por instante desde t = 0, incluido el inicio.
+                  Los caminos nunca chocan entre sí: un agente sin plan
+                  (en alguna ventana, con ventana) tiene exito False y se
+                  queda quieto, y los demás lo esquivan
+        """
+        self.reservas.limpiar()
+        if self.ventana is None:
+            return self._planificar_completo(agentes)
+        return self._planificar_ventanas(agentes)
+
+    def _planificar_ronda(self, agentes, posiciones, tiempo, ventana, fijos):
+        """
+        Planifica una ronda en orden de prioridad, con los agentes fijos ya reservados
+
+        Returns:
+            tuple: (planes, fallo). fallo es el primer agente sin plan (None
+                   si todos lo tienen); en ese caso planes está incompleto
+        """
+        self.reservas.limpiar()
+        # Los fijos se reservan antes que nadie: los demás los esquivan
+        quieto = 1 if ventana is None else ventana + 1
+        for agente in sorted(fijos):
+            self.reservas.reservar(agente, [posiciones[agente]] * quieto, tiempo,
+                                   permanente=ventana is None)
+
+        planes = [None] * len(agentes)
+        for agente, (_, fin) in enumerate(agentes):
+            if agente in fijos:
+                planes[agente] = [posiciones[agente]] * quieto
+                continue
+            exito, plan = self._buscar(posiciones[agente], fin, agente, tiempo, ventana)
+            if not exito:
+                return planes, agente
+            if ventana is not None:
+                # Completar la ventana esperando en la última celda
+                plan = plan + [plan[-1]] * (ventana + 1 - len(plan))
+            self.reservas.reservar(agente, plan, tiempo, permanente=ventana is None)
+            planes[agente] = plan
+        return planes, None
+
+    def _planificar_fijando(self, agentes, posiciones, tiempo, ventana):
+        """
+        Ronda sin colisiones: un agente sin plan se queda QUIETO
+
+        Quedarse quieto solo es seguro si los agentes de mayor prioridad lo
+        saben, así que el agente pasa a ser fijo (reservado en su celda
+        antes que todos) y la ronda se repite. Cada repetición fija un
+        agente más, así que hay a lo sumo len(agentes) repeticiones.
+
+        Returns:
+            tuple: (planes, fijos)
+        """
+        fijos = set()
+        while True:
+            planes, fallo = self._planificar_ronda(agentes, posiciones, tiempo,
+                                                   ventana, fijos)
+            if fallo is None:
+                return planes, fijos
+            fijos.add(fallo)
+
+    def _planificar_completo(self, agentes):
+        posiciones = [inicio for inicio, _ in agentes]
+        planes, fijos = self._planificar_fijando(agentes, posiciones, 0, None)
+        return [(agente not in fijos, plan) for agente, plan in enumerate(planes)]
+
+    def _planificar_ventanas(self, agentes):
+        ventana = self.ventana
+        avance = max(1, ventana // 2)
+        posiciones = [inicio for inicio, _ in agentes]
+        caminos = [[inicio] for inicio, _ in agentes]
+        fallidos = set()
+        tiempo = 0
+
+        limite_tiempo = self.limite_tiempo
+        if limite_tiempo is None:
+            limite_tiempo = self.filas * self.columnas
+
+        while tiempo < limite_tiempo:
+            if all(posicion == fin for posicion, (_, fin) in zip(posiciones, agentes)):
+                break
+            planes, fijos = self._planificar_fijando(agentes, posiciones, tiempo, ventana)
+            fallidos |= fijos
+
+            for agente, plan in enumerate(planes):
+                caminos[agente].extend(plan[1:avance + 1])
+                posiciones[agente] = plan[avance]
+            tiempo += avance
+
+        resultados = []
+        for agente, ((_, fin), camino) in enumerate(zip(agentes, caminos)):
+            # Las esperas finales en el destino no aportan nada
+            while len(camino) > 1 and camino[-1] == fin and camino[-2] == fin:
+                camino.pop()
+            resultados.append((camino[-1] == fin and agente not in fallidos, camino))
+        return resultados
+
+    def obtener_estadisticas(self):
+        return {
+            'nodos_explorados': self.nodos_explorados,
+            'reservas': len(self.reservas),
+            'campos_distancia': len(self.campos)
+        }
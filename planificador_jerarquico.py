@@ -0,0 +1,407 @@
+"""
+Planificador jerárquico HPA* (Hierarchical Pathfinding A*)
+
+Para mapas grandes, buscar con A* a resolución completa en cada consulta es
+caro. HPA* divide la cuadrícula en clusters (bloques de tamano_cluster x
+tamano_cluster) y trabaja en dos niveles:
+
+1. PREPROCESO (una vez por mapa)
+   - En cada borde entre dos clusters vecinos se buscan tramos de celdas
+     libres enfrentadas. Cada tramo es una "entrada": tramos cortos tienen
+     una entrada en el centro, tramos largos (>= 6) una en cada extremo.
+   - Cada entrada aporta dos nodos abstractos (uno a cada lado del borde)
+     unidos por una arista de un paso.
+   - Dentro de cada cluster se calculan las distancias entre todos sus nodos
+     abstractos (Dijkstra local, con las mismas reglas de obtener_vecinos,
+     leídas de una MascaraVecinos que se actualiza celda a celda).
+
+2. CONSULTA
+   - Se conectan inicio y fin a los nodos de su cluster.
+   - Se busca con A* sobre el grafo abstracto (pocos nodos).
+   - Cada tramo del camino abstracto se refina bajo demanda con
+     AlgoritmoAStar restringido al cluster.
+
+Cuando cambian los obstáculos solo se reconstruyen los clusters afectados
+(y las entradas de sus bordes), con actualizar_obstaculos.
+
+El camino resultante es válido pero puede ser algo más largo que el óptimo:
+es el compromiso habitual de HPA* a cambio de consultas mucho más rápidas.
+"""
+import heapq
+
+from algoritmo_astar import AlgoritmoAStar
+from funciones_astar import (
+    calcular_peso_movimiento,
+    crear_heuristica
+)
+from mascara_vecinos import MascaraVecinos
+
+# Tramos de entrada con esta longitud o más tienen dos entradas
+LONGITUD_ENTRADA_DOBLE = 6
+
+
+class PlanificadorJerarquico:
+    """
+    Grafo abstracto de HPA* sobre una cuadrícula.
+
+    Uso:
+        planificador = PlanificadorJerarquico(filas, columnas, obstaculos,
+                                              config_costos, permitir_diagonal)
+        exito, camino, costo = planificador.buscar(inicio, fin)
+    """
+
+    def __init__(self, filas, columnas, obstaculos, config_costos,
+                 permitir_diagonal=False, tipo_heuristica='manhattan',
+                 tamano_cluster=10, motor='diccionarios'):
+        """
+        Construye el grafo abstracto del mapa
+
+        Args:
+            filas: Número de filas de la cuadrícula
+            columnas: Número de columnas de la cuadrícula
+            obstaculos: Set de tuplas con posiciones bloqueadas
+            config_costos: Dict con costos {'horizontal', 'vertical', 'diagonal'}
+            permitir_diagonal: Si True, permite movimientos en 8 direcciones
+            tipo_heuristica: Heurística para la búsqueda abstracta y el refinamiento
+            tamano_cluster: Lado de cada cluster en celdas
+            motor: Motor de AlgoritmoAStar usado para refinar los tramos
+        """
+        if tamano_cluster < 2:
+            raise ValueError("tamano_cluster debe ser al menos 2")
+
+        self.filas = filas
+        self.columnas = columnas
+        self.obstaculos = set(obstaculos)
+        self.mascara = MascaraVecinos(filas, columnas, self.obstaculos)
+        self.config_costos = config_costos
+        self.permitir_diagonal = permitir_diagonal
+        self.tipo_heuristica = tipo_heuristica
+        self.tamano_cluster = tamano_cluster
+        self.motor = motor
+
+        self.filas_clusters = -(-filas // tamano_cluster)
+        self.columnas_clusters = -(-columnas // tamano_cluster)
+
+        # Borde (cluster_a, cluster_b) -> lista de entradas (celda_a, celda_b)
+        self.entradas = {}
+        # Nodo abstracto -> {nodo vecino en otro cluster: costo}
+        self.aristas_inter = {}
+        # Cluster -> {nodo: {nodo: costo}} (distancias dentro del cluster)
+        self.aristas_intra = {}
+
+        # Estadísticas
+        self.nodos_explorados = 0
+        self.clusters_reconstruidos = 0
+
+        todos = [(cf, cc) for cf in range(self.filas_clusters)
+                 for cc in range(self.columnas_clusters)]
+        self._reconstruir(todos)
+
+    # ===== GEOMETRÍA DE LOS CLUSTERS =====
+
+    def cluster_de(self, celda):
+        """Cluster (fila_cluster, col_cluster) que contiene una celda"""
+        return (celda[0] // self.tamano_cluster, celda[1] // self.tamano_cluster)
+
+    def limites_cluster(self, cluster):
+        """Retorna (fila_min, col_min, fila_max, col_max) con máximos exclusivos"""
+        t = self.tamano_cluster
+        fila_min = cluster[0] * t
+        col_min = cluster[1] * t
+        return (fila_min, col_min,
+                min(fila_min + t, self.filas), min(col_min + t, self.columnas))
+
+    def _clusters_vecinos(self, cluster):
+        cf, cc = cluster
+        for vecino in ((cf - 1, cc), (cf + 1, cc), (cf, cc - 1), (cf, cc + 1)):
+            if (0 <= vecino[0] < self.filas_clusters and
+                    0 <= vecino[1] < self.columnas_clusters):
+                yield vecino
+
+    def _en_cluster(self, celda, cluster):
+        fila_min, col_min, fila_max, col_max = self.limites_cluster(cluster)
+        return fila_min <= celda[0] < fila_max and col_min <= celda[1] < col_max
+
+    def nodos_cluster(self, cluster):
+        """Nodos abstractos (celdas de entrada) que pertenecen a un cluster"""
+        nodos = set()
+        for vecino in self._clusters_vecinos(cluster):
+            borde = (min(cluster, vecino), max(cluster, vecino))
+            for celda_a, celda_b in self.entradas.get(borde, []):
+                nodos.add(celda_a if self._en_cluster(celda_a, cluster) else celda_b)
+        return nodos
+
+    # ===== CONSTRUCCIÓN DEL GRAFO ABSTRACTO =====
+
+    def _calcular_entradas(self, cluster_a, cluster_b):
+        """
+        Entradas del borde entre dos clusters vecinos (cluster_a antes que cluster_b)
+
+        Returns:
+            list: Pares (celda_en_a, celda_en_b) libres y enfrentados
+        """
+        fila_min, col_min, fila_max, col_max = self.limites_cluster(cluster_a)
+        if cluster_a[0] == cluster_b[0]:
+            # Borde vertical: última columna de a, primera de b
+            pares = [((fila, col_max - 1), (fila, col_max))
+                     for fila in range(fila_min, fila_max)]
+        else:
+            # Borde horizontal: última fila de a, primera de b
+            pares = [((fila_max - 1, col), (fila_max, col))
+                     for col in range(col_min, col_max)]
+
+        entradas = []
+        tramo = []
+        for par in pares + [None]:
+            libre = (par is not None and par[0] not in self.obstaculos
+                     and par[1] not in self.obstaculos)
+            if libre:
+                tramo.append(par)
+                continue
+            if tramo:
+                if len(tramo) >= LONGITUD_ENTRADA_DOBLE:
+                    entradas.extend([tramo[0], tramo[-1]])
+                else:
+                    entradas.append(tramo[len(tramo) // 2])
+                tramo = []
+        return entradas
+
+    def _peso_cruce(self, celda_a, celda_b):
+        return calcular_peso_movimiento(celda_a, celda_b, self.config_costos)
+
+    def _dijkstra_local(self, origen, cluster):
+        """
+        Distancias desde origen a todas las celdas de su cluster
+
+        Returns:
+            dict: celda -> costo mínimo sin salir del cluster
+        """
+        fila_min, col_min, fila_max, col_max = self.limites_cluster(cluster)
+        distancias = {origen: 0}
+        frontera = [(0, 0, origen)]
+        contador = 1
+        cerrado = set()
+        while frontera:
+            costo, _, actual = heapq.heappop(frontera)
+            if actual in cerrado:
+                continue
+            cerrado.add(actual)
+            self.nodos_explorados += 1
+            for vecino in self.mascara.vecinos(actual, self.permitir_diagonal):
+                if not (fila_min <= vecino[0] < fila_max and col_min <= vecino[1] < col_max):
+                    continue
+                nuevo = costo + calcular_peso_movimiento(actual, vecino, self.config_costos)
+                if nuevo < distancias.get(vecino, float('inf')):
+                    distancias[vecino] = nuevo
+                    heapq.heappush(frontera, (nuevo, contador, vecino))
+                    contador += 1
+        return distancias
+
+    def _calcular_intra(self, cluster):
+        """Distancias entre los nodos abstractos de un cluster"""
+        nodos = self.nodos_cluster(cluster)
+        aristas = {nodo: {} for nodo in nodos}
+        for nodo in nodos:
+            distancias = self._dijkstra_local(nodo, cluster)
+            for otro in nodos:
+                if otro != nodo and otro in distancias:
+                    aristas[nodo][otro] = distancias[otro]
+        self.aristas_intra[cluster] = aristas
+
+    def _reconstruir(self, clusters):
+        """
+        Recalcula entradas y distancias de los clusters indicados
+
+        Las entradas de un borde afectan a los dos clusters que separa, así
+        que las distancias internas se recalculan también en los vecinos.
+        """
+        bordes = set()
+        for cluster in clusters:
+            for vecino in self._clusters_vecinos(cluster):
+                bordes.add((min(cluster, vecino), max(cluster, vecino)))
+
+        por_recalcular = set(clusters)
+        for cluster_a, cluster_b in bordes:
+            # Quitar las aristas entre clusters de las entradas viejas
+            for celda_a, celda_b in self.entradas.get((cluster_a, cluster_b), []):
+                self.aristas_inter.get(celda_a, {}).pop(celda_b, None)
+                self.aristas_inter.get(celda_b, {}).pop(celda_a, None)
+
+            nuevas = self._calcular_entradas(cluster_a, cluster_b)
+            if nuevas != self.entradas.get((cluster_a, cluster_b), []):
+                por_recalcular.update((cluster_a, cluster_b))
+            self.entradas[(cluster_a, cluster_b)] = nuevas
+            for celda_a, celda_b in nuevas:
+                peso = self._peso_cruce(celda_a, celda_b)
+                self.aristas_inter.setdefault(celda_a, {})[celda_b] = peso
+                self.aristas_inter.setdefault(celda_b, {})[celda_a] = peso
+
+        for cluster in por_recalcular:
+            self._calcular_intra(cluster)
+            self.clusters_reconstruidos += 1
+
+    def actualizar_obstaculos(self, agregados=(), eliminados=()):
+        """
+        Aplica cambios de obstáculos reconstruyendo solo los clusters afectados
+
+        Args:
+            agregados: Celdas que pasan a ser obstáculo
+            eliminados: Celdas que dejan de ser obstáculo
+
+        Returns:
+            set: Clusters reconstruidos
+        """
+        afectados = set()
+        for celda in agregados:
+            if celda not in self.obstaculos:
+                self.obstaculos.add(celda)
+                self.mascara.cambiar_celda(celda, True)
+                afectados.add(self.cluster_de(celda))
+        for celda in eliminados:
+            if celda in self.obstaculos:
+                self.obstaculos.discard(celda)
+                self.mascara.cambiar_celda(celda, False)
+                afectados.add(self.cluster_de(celda))
+        if afectados:
+            self._reconstruir(afectados)
+        return afectados
+
+    # ===== CONSULTAS =====
+
+    def _conectar(self, celda):
+        """Aristas temporales de una celda hacia los nodos de su cluster"""
+        cluster = self.cluster_de(celda)
+        distancias = self._dijkstra_local(celda, cluster)
+        return {nodo: distancias[nodo] for nodo in self.nodos_cluster(cluster)
+                if nodo in distancias and nodo != celda}, distancias
+
+    def _vecinos_abstractos(self, nodo, temporales):
+        vecinos = dict(self.aristas_intra.get(self.cluster_de(nodo), {}).get(nodo, {}))
+        vecinos.update(self.aristas_inter.get(nodo, {}))
+        vecinos.update(temporales.get(nodo, {}))
+        return vecinos
+
+    def buscar_abstracto(self, inicio, fin):
+        """
+        Busca en el grafo abstracto
+
+        Returns:
+            tuple: (exito, nodos_abstractos, costo)
+                   nodos_abstractos va de inicio a fin, ambos incluidos
+        """
+        if inicio in self.obstaculos or fin in self.obstaculos:
+            return False, [], None
+        if inicio == fin:
+            return True, [inicio], 0
+
+        # Aristas temporales de inicio y fin (se descartan tras la consulta)
+        temporales = {}
+        aristas_inicio, desde_inicio = self._conectar(inicio)
+        aristas_fin, _ = self._conectar(fin)
+        temporales[inicio] = dict(aristas_inicio)
+        if fin in desde_inicio:
+            # Mismo cluster: camino directo sin salir de él
+            temporales[inicio][fin] = desde_inicio[fin]
+        for nodo, costo in aristas_fin.items():
+            temporales.setdefault(nodo, {})[fin] = costo
+
+        # A* sobre el grafo abstracto
+        heuristica = crear_heuristica(self.tipo_heuristica, fin, self.config_costos)
+        costo_g = {inicio: 0}
+        vino_de = {}
+        frontera = [(0, 0, inicio)]
+        contador = 1
+        cerrado = set()
+        while frontera:
+            _, _, actual = heapq.heappop(frontera)
+            if actual in cerrado:
+                continue
+            cerrado.add(actual)
+            self.nodos_explorados += 1
+            if actual == fin:
+                camino = [fin]
+                while camino[-1] in vino_de:
+                    camino.append(vino_de[camino[-1]])
+                camino.reverse()
+                return True, camino, costo_g[fin]
+            for vecino, peso in self._vecinos_abstractos(actual, temporales).items():
+                nuevo = costo_g[actual] + peso
+                if vecino not in cerrado and nuevo < costo_g.get(vecino, float('inf')):
+                    costo_g[vecino] = nuevo
+                    vino_de[vecino] = actual
+                    h = heuristica(vecino)
+                    heapq.heappush(frontera, (nuevo + h, contador, vecino))
+                    contador += 1
+
+        return False, [], None
+
+    def _refinar_tramo(self, desde, hacia):
+        """Celdas del tramo desde -> hacia (sin desde, con hacia)"""
+        if self.cluster_de(desde) != self.cluster_de(hacia):
+            # Arista entre clusters: un solo paso
+            return [hacia]
+
+        cluster = self.cluster_de(desde)
+        fila_min, col_min, fila_max, col_max = self.limites_cluster(cluster)
+        obstaculos_locales = {
+            (fila - fila_min, col - col_min)
+            for fila in range(fila_min, fila_max)
+            for col in range(col_min, col_max)
+            if (fila, col) in self.obstaculos
+        }
+        algoritmo = AlgoritmoAStar(
+            (desde[0] - fila_min, desde[1] - col_min),
+            (hacia[0] - fila_min, hacia[1] - col_min),
+            fila_max - fila_min, col_max - col_min,
+            obstaculos_locales, self.config_costos,
+            self.permitir_diagonal, self.tipo_heuristica, motor=self.motor
+        )
+        exito, camino, nodos, _ = algoritmo.ejecutar_completo()
+        self.nodos_explorados += nodos
+        celdas = [(fila + fila_min, col + col_min) for fila, col in camino]
+        celdas.append(hacia)
+        return celdas
+
+    def refinar(self, nodos_abstractos):
+        """
+        Refina un camino abstracto tramo a tramo, bajo demanda
+
+        Args:
+            nodos_abstractos: Lista retornada por buscar_abstracto
+
+        Yields:
+            tuple: Celdas del camino, sin el inicio y con el fin
+        """
+        for desde, hacia in zip(nodos_abstractos, nodos_abstractos[1:]):
+            yield from self._refinar_tramo(desde, hacia)
+
+    def buscar(self, inicio, fin):
+        """
+        Busca y refina un camino completo
+
+        Returns:
+            tuple: (exito, camino, costo)
+                   camino sin inicio ni fin, igual que reconstruir_camino
+        """
+        exito, nodos_abstractos, costo = self.buscar_abstracto(inicio, fin)
+        if not exito:
+            return False, [], None
+        camino = list(self.refinar(nodos_abstractos))
+        if camino and camino[-1] == fin:
+            camino.pop()
+        return True, camino, costo
+
+    def obtener_estadisticas(self):
+        """
+        Obtiene estadísticas del grafo abstracto
+
+        Returns:
+            dict: Diccionario con estadísticas
+        """
+        return {
+            'clusters': self.filas_clusters * self.columnas_clusters,
+            'entradas': sum(len(e) for e in self.entradas.values()),
+            'nodos_abstractos': sum(len(a) for a in self.aristas_intra.values()),
+            'nodos_explorados': self.nodos_explorados,
+            'clusters_reconstruidos': self.clusters_reconstruidos
+        }
@@ -0,0 +1,280 @@
+"""
+Control de regresiones de rendimiento con líneas base guardadas
+
+Mide AlgoritmoAStar.ejecutar_completo sobre un CORPUS FIJO de mapas y
+consultas generados con semilla, guarda los resultados como línea base
+JSON y, en modo comparación, falla si algún escenario empeora más que la
+tolerancia:
+
+    python regresion_rendimiento.py guardar base.json
+    python regresion_rendimiento.py comparar base.json    # código 1 si hay regresión
+
+Métricas por escenario:
+- expansiones: suma de nodos expandidos. Es determinista, así que por
+  defecto CUALQUIER aumento es una regresión (un cambio de desempate que
+  duplica las expansiones se detecta aunque el tiempo sea ruidoso).
+- costo: suma de costos de los caminos. Si cambia, el motor devuelve
+  otros caminos; se informa siempre.
+- tiempo_mediano: mediana de varias repeticiones del escenario completo.
+- memoria_pico: bytes pico asignados durante el escenario (tracemalloc).
+
+El corpus no debe cambiar: una línea base solo es comparable con
+mediciones del mismo corpus (se guarda su versión y se comprueba).
+"""
+import argparse
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+
+from algoritmo_astar import AlgoritmoAStar
+from benchmark import preparar_mapa
+
+# Cambiar el corpus invalida las líneas base: subir la versión
+VERSION_CORPUS = 1
+
+# (nombre, filas, columnas, densidad, semilla, consultas, motor, heurística, diagonal)
+CORPUS = (
+    ('abierto-arreglos', 128, 128, 0.10, 1, 20, 'arreglos', 'octile', True),
+    ('denso-arreglos', 128, 128, 0.30, 2, 20, 'arreglos', 'octile', True),
+    ('rectos-diccionarios', 96, 96, 0.25, 3, 20, 'diccionarios', 'manhattan', False),
+    ('denso-jps', 160, 160, 0.25, 4, 20, 'jps', 'octile', True),
+    ('bidireccional', 128, 128, 0.20, 5, 20, 'bidireccional', 'octile', True),
+)
+
+CONFIG_CORPUS = {'horizontal': 1.0, 'vertical': 1.0, 'diagonal': 1.4}
+
+# Aumento relativo tolerado por métrica (0.25 = 25 %)
+TOLERANCIAS = {
+    'expansiones': 0.0,
+    'tiempo_mediano': 0.25,
+    'memoria_pico': 0.10
+}
+
+
+# ===== CORPUS =====
+
+def generar_escenario(filas, columnas, densidad, semilla, consultas):
+    """
+    Mapa aleatorio y pares de consultas, deterministas para una semilla
+
+    Returns:
+        tuple: (obstaculos, pares)
+    """
+    generador = random.Random(semilla)
+    obstaculos = {
+        (fila, col)
+        for fila in range(filas)
+        for col in range(columnas)
+        if generador.random() < densidad
+    }
+    libres = [(fila, col) for fila in range(filas) for col in range(columnas)
+              if (fila, col) not in obstaculos]
+    pares = [tuple(generador.sample(libres, 2)) for _ in range(consultas)]
+    return obstaculos, pares
+
+
+def medir_escenario(especificacion, repeticiones=5, medir_memoria=True):
+    """
+    Mide un escenario del corpus
+
+    Args:
+        especificacion: Tupla de CORPUS
+        repeticiones: Veces que se repite el escenario para la mediana
+        medir_memoria: Si True, una ejecución más con tracemalloc
+
+    Returns:
+        dict: expansiones, costo, resueltos, tiempo_mediano, tiempos y
+              memoria_pico
+    """
+    (_, filas, columnas, densidad, semilla, consultas,
+     motor, tipo_heuristica, diagonal) = especificacion
+    obstaculos, pares = generar_escenario(filas, columnas, densidad, semilla, consultas)
+    mapa = preparar_mapa(filas, columnas, obstaculos)
+
+    def resolver():
+        expansiones = resueltos = 0
+        costo = 0.0
+        for inicio, fin in pares:
+            algoritmo = AlgoritmoAStar(
+                inicio, fin, filas, columnas, obstaculos, CONFIG_CORPUS,
+                diagonal, tipo_heuristica, motor=motor, mascara=mapa['mascara']
+            )
+            exito, _, nodos, _ = algoritmo.ejecutar_completo()
+            expansiones += nodos
+            if exito:
+                resueltos += 1
+                costo += algoritmo.obtener_estadisticas()['costo_g_objetivo']
+        return expansiones, round(costo, 6), resueltos
+
+    tiempos = []
+    for _ in range(max(1, repeticiones)):
+        inicio = time.perf_counter()
+        expansiones, costo, resueltos = resolver()
+        tiempos.append(time.perf_counter() - inicio)
+
+    memoria_pico = None
+    if medir_memoria:
+        tracemalloc.start()
+        try:
+            resolver()
+            memoria_pico = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    return {
+        'expansiones': expansiones,
+        'costo': costo,
+        'resueltos': resueltos,
+        'tiempo_mediano': statistics.median(tiempos),
+        'tiempos': tiempos,
+        'memoria_pico': memoria_pico
+    }
+
+
+def medir_corpus(repeticiones=5, medir_memoria=True, corpus=CORPUS):
+    """
+    Mide todos los escenarios del corpus
+
+    Returns:
+        dict: Línea base serializable: version_corpus, entorno y
+              escenarios {nombre: métricas}
+    """
+    return {
+        'version_corpus': VERSION_CORPUS,
+        'entorno': {
+            'python': platform.python_version(),
+            'implementacion': platform.python_implementation(),
+            'maquina': platform.machine()
+        },
+        'repeticiones': repeticiones,
+        'escenarios': {
+            especificacion[0]: medir_escenario(especificacion, repeticiones, medir_memoria)
+            for especificacion in corpus
+        }
+    }
+
+
+# ===== COMPARACIÓN =====
+
+def comparar(base, actual, tolerancias=None):
+    """
+    Compara una medición con la línea base
+
+    Args:
+        base: Dict de medir_corpus (guardado)
+        actual: Dict de medir_corpus (nuevo)
+        tolerancias: Aumento relativo tolerado por métrica (por defecto
+                     TOLERANCIAS)
+
+    Returns:
+        tuple: (regresiones, filas). regresiones es la lista de textos de
+               las métricas que empeoraron; filas son tuplas (escenario,
+               métrica, base, actual, cambio, estado) para la tabla
+    """
+    if base.get('version_corpus') != actual.get('version_corpus'):
+        raise ValueError(
+            f"La línea base es del corpus {base.get('version_corpus')} y la "
+            f"medición del corpus {actual.get('version_corpus')}: vuelva a guardarla"
+        )
+    limites = dict(TOLERANCIAS)
+    limites.update(tolerancias or {})
+
+    regresiones = []
+    filas = []
+    for nombre, metricas_base in base['escenarios'].items():
+        metricas = actual['escenarios'].get(nombre)
+        if metricas is None:
+            regresiones.append(f"{nombre}: falta en la medición actual")
+            continue
+
+        for metrica in ('costo', 'resueltos'):
+            if metricas[metrica] != metricas_base[metrica]:
+                regresiones.append(
+                    f"{nombre}: {metrica} cambió de {metricas_base[metrica]} "
+                    f"a {metricas[metrica]} (los caminos no son los mismos)"
+                )
+                filas.append((nombre, metrica, metricas_base[metrica],
+                              metricas[metrica], None, 'CAMBIO'))
+
+        for metrica, tolerancia in limites.items():
+            anterior, nuevo = metricas_base.get(metrica), metricas.get(metrica)
+            if anterior is None or nuevo is None:
+                continue
+            cambio = (nuevo - anterior) / anterior if anterior else 0.0
+            estado = 'ok'
+            if cambio > tolerancia:
+                estado = 'PEOR'
+                regresiones.append(
+                    f"{nombre}: {metrica} {anterior:g} -> {nuevo:g} "
+                    f"({cambio:+.1%}, tolerancia {tolerancia:.0%})"
+                )
+            elif cambio < -tolerancia:
+                estado = 'mejor'
+            filas.append((nombre, metrica, anterior, nuevo, cambio, estado))
+    return regresiones, filas
+
+
+def _formatear_valor(valor):
+    return f"{valor:d}" if isinstance(valor, int) else f"{valor:.6g}"
+
+
+def formatear_comparacion(filas):
+    """Tabla de texto con una fila por escenario y métrica"""
+    lineas = [f"{'escenario':<22}{'métrica':<16}{'base':>14}{'actual':>14}"
+              f"{'cambio':>10}  estado"]
+    for nombre, metrica, anterior, nuevo, cambio, estado in filas:
+        texto_cambio = '' if cambio is None else f"{cambio:+.1%}"
+        lineas.append(f"{nombre:<22}{metrica:<16}{_formatear_valor(anterior):>14}"
+                      f"{_formatear_valor(nuevo):>14}{texto_cambio:>10}  {estado}")
+    return '\n'.join(lineas)
+
+
+def guardar_linea_base(medicion, ruta):
+    with open(ruta, 'w', encoding='utf-8') as archivo:
+        json.dump(medicion, archivo, indent=2, ensure_ascii=False)
+        archivo.write('\n')
+
+
+def cargar_linea_base(ruta):
+    with open(ruta, encoding='utf-8') as archivo:
+        return json.load(archivo)
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Control de regresiones de rendimiento")
+    parser.add_argument('accion', choices=('guardar', 'comparar'))
+    parser.add_argument('linea_base', help="Archivo JSON de la línea base")
+    parser.add_argument('--repeticiones', type=int, default=5)
+    parser.add_argument('--sin-memoria', action='store_true')
+    for metrica, tolerancia in TOLERANCIAS.items():
+        parser.add_argument(f"--tolerancia-{metrica.replace('_', '-')}", type=float,
+                            default=tolerancia, dest=f"tolerancia_{metrica}",
+                            help=f"Aumento relativo tolerado (por defecto {tolerancia})")
+    opciones = parser.parse_args(argumentos)
+
+    medicion = medir_corpus(opciones.repeticiones, not opciones.sin_memoria)
+    if opciones.accion == 'guardar':
+        guardar_linea_base(medicion, opciones.linea_base)
+        print(f"Línea base guardada en {opciones.linea_base}")
+        return 0
+
+    tolerancias = {metrica: getattr(opciones, f"tolerancia_{metrica}")
+                   for metrica in TOLERANCIAS}
+    regresiones, filas = comparar(cargar_linea_base(opciones.linea_base),
+                                  medicion, tolerancias)
+    print(formatear_comparacion(filas))
+    if regresiones:
+        print(f"\n{len(regresiones)} regresión(es):")
+        for regresion in regresiones:
+            print(f"  - {regresion}")
+        return 1
+    print("\nSin regresiones")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,330 @@
+"""
+Replanificación incremental con D* Lite
+
+A* empieza de cero cada vez que cambia un obstáculo. D* Lite (una versión
+de LPA* que busca desde el fin hacia el inicio) conserva entre cambios dos
+valores por celda:
+
+- g:    costo hasta el fin según la última búsqueda
+- rhs:  costo a un paso: min(peso(s, s') + g(s')) sobre los sucesores s'
+
+Una celda es CONSISTENTE si g == rhs. Cuando cambia un obstáculo solo se
+recalcula rhs de las celdas cuyas aristas cambiaron (la celda y sus 8
+vecinas, por la regla diagonal) y la búsqueda vuelve a expandir únicamente
+las celdas que quedaron inconsistentes.
+
+Como la búsqueda va del fin al inicio, el inicio puede moverse (el robot
+avanza) sin perder el trabajo hecho: basta con mover_inicio().
+
+HEURÍSTICA:
+D* Lite solo es correcto con una heurística consistente, y con diagonales
+Manhattan, Euclidiana y Chebyshev no lo son para costos como 1.0/1.4 (la
+búsqueda podía terminar sin camino habiendo uno). Se usa siempre el costo
+en la cuadrícula vacía, consistente por construcción y nunca menor que
+ninguna de las cuatro cuando estas son consistentes; tipo_heuristica solo
+identifica la configuración.
+
+CLAVES:
+Las claves (y la comparación g == rhs) se redondean a _DECIMALES
+decimales. Dos caminos del mismo costo sumados en distinto orden (10.2 y
+10.200000000000001) daban claves distintas, y el desempate por k2
+decidía mal cuándo parar. g y rhs se guardan sin redondear: redondear
+cada suma no es asociativo con costos irracionales como sqrt(2).
+
+Uso:
+    replanificador = ReplanificadorDStarLite(inicio, fin, filas, columnas,
+                                             obstaculos, config_costos)
+    exito, camino, costo = replanificador.planificar()
+    replanificador.actualizar_obstaculos(agregados={(4, 7)})
+    exito, camino, costo = replanificador.planificar()   # solo repara
+"""
+from colas_prioridad import HeapIndexado
+from funciones_astar import calcular_peso_movimiento
+from mascara_vecinos import MascaraVecinos
+
+INFINITO = float('inf')
+
+# Decimales de las claves (round(inf) sigue siendo inf)
+_DECIMALES = 9
+
+
+def crear_distancia_libre(objetivo, config_costos, permitir_diagonal):
+    """
+    Costo mínimo hasta objetivo en la cuadrícula sin obstáculos
+
+    Con diagonales se prueban las cantidades de pasos diagonales donde el
+    costo puede ser mínimo: 0, el eje menor, el mayor y sus vecinos
+    (un eje recorrido de más se compensa con pares de pasos, rectos o en
+    zigzag).
+
+    Returns:
+        callable: h(nodo) -> float, consistente con cualquier mapa
+    """
+    fila_obj, col_obj = objetivo
+    horizontal = config_costos['horizontal']
+    vertical = config_costos['vertical']
+    diagonal = config_costos['diagonal']
+
+    if not permitir_diagonal:
+        def distancia(nodo):
+            return abs(nodo[0] - fila_obj) * vertical + abs(nodo[1] - col_obj) * horizontal
+        return distancia
+
+    def distancia(nodo):
+        df = abs(nodo[0] - fila_obj)
+        dc = abs(nodo[1] - col_obj)
+        mejor = df * vertical + dc * horizontal
+        menor, mayor = (df, dc) if df < dc else (dc, df)
+        for diagonales in (menor, menor + 1, mayor - 1, mayor, mayor + 1):
+            if diagonales <= 0:
+                continue
+            rectos_col = dc - diagonales if diagonales <= dc else (diagonales - dc) & 1
+            rectos_fila = df - diagonales if diagonales <= df else (diagonales - df) & 1
+            costo = (diagonales * diagonal + rectos_col * horizontal
+                     + rectos_fila * vertical)
+            if costo < mejor:
+                mejor = costo
+        return mejor
+    return distancia
+
+
+class ReplanificadorDStarLite:
+    """D* Lite sobre la cuadrícula, con estado g/rhs persistente entre cambios"""
+
+    def __init__(self, inicio, fin, filas, columnas, obstaculos,
+                 config_costos, permitir_diagonal=False, tipo_heuristica='manhattan',
+                 mascara=None):
+        """
+        Args:
+            inicio: Tupla (fila, col) del nodo inicial
+            fin: Tupla (fila, col) del nodo objetivo
+            filas: Número de filas de la cuadrícula
+            columnas: Número de columnas de la cuadrícula
+            obstaculos: Set de tuplas con posiciones bloqueadas (se copia)
+            config_costos: Dict con costos {'horizontal', 'vertical', 'diagonal'}
+            permitir_diagonal: Si True, permite movimientos en 8 direcciones
+            tipo_heuristica: Tipo de heurística de la configuración (la
+                             búsqueda usa crear_distancia_libre, ver arriba)
+            mascara: MascaraVecinos de estos obstáculos; el replanificador
+                     la modifica en actualizar_obstaculos
+        """
+        self.inicio = inicio
+        self.fin = fin
+        self.filas = filas
+        self.columnas = columnas
+        self.obstaculos = set(obstaculos)
+        self.config_costos = config_costos
+        self.permitir_diagonal = permitir_diagonal
+        self.tipo_heuristica = tipo_heuristica
+
+        if mascara is None:
+            mascara = MascaraVecinos(filas, columnas, self.obstaculos)
+        self.mascara = mascara
+
+        # Heurística hacia el inicio actual (la búsqueda va del fin al inicio)
+        self.heuristica = crear_distancia_libre(inicio, config_costos, permitir_diagonal)
+
+        self.g = {}
+        self.rhs = {fin: 0.0}
+        self.cola = HeapIndexado()
+        self.km = 0.0               # Corrección de claves por movimientos del inicio
+        self.contador = 0
+
+        # Estadísticas
+        self.nodos_expandidos = 0            # Total acumulado
+        self.expandidos_ultima = 0           # Última llamada a planificar()
+        self.replanificaciones = 0
+
+        self.cola.insertar(fin, self._clave(fin), self._siguiente_contador())
+
+    # ===== UTILIDADES =====
+
+    def _siguiente_contador(self):
+        self.contador += 1
+        return self.contador
+
+    def _clave(self, nodo):
+        minimo = min(self.g.get(nodo, INFINITO), self.rhs.get(nodo, INFINITO))
+        return (round(minimo + self.heuristica(nodo) + self.km, _DECIMALES),
+                round(minimo, _DECIMALES))
+
+    def _consistente(self, nodo):
+        """g == rhs a _DECIMALES decimales (el resto es ruido de redondeo)"""
+        return (round(self.g.get(nodo, INFINITO), _DECIMALES)
+                == round(self.rhs.get(nodo, INFINITO), _DECIMALES))
+
+    def _vecinos(self, nodo):
+        """Vecinos por los que se puede mover (predecesores = sucesores)"""
+        if self.mascara.esta_bloqueada(nodo):
+            return []
+        return self.mascara.vecinos(nodo, self.permitir_diagonal)
+
+    def _rhs_desde_sucesores(self, nodo):
+        g = self.g
+        mejor = INFINITO
+        for vecino in self._vecinos(nodo):
+            costo = calcular_peso_movimiento(nodo, vecino, self.config_costos) + \
+                g.get(vecino, INFINITO)
+            if costo < mejor:
+                mejor = costo
+        return mejor
+
+    def _actualizar_nodo(self, nodo):
+        """UpdateVertex: encola el nodo si es inconsistente, si no lo saca"""
+        if not self._consistente(nodo):
+            self.cola.insertar(nodo, self._clave(nodo), self._siguiente_contador())
+        else:
+            self.cola.eliminar(nodo)
+
+    # ===== BÚSQUEDA =====
+
+    def _calcular_camino_minimo(self):
+        """ComputeShortestPath: expande hasta que el inicio es consistente"""
+        g, rhs, cola = self.g, self.rhs, self.cola
+        inicio = self.inicio
+        expandidos = 0
+
+        while cola and (cola.tope()[0] < self._clave(inicio) or
+                        not self._consistente(inicio)):
+            clave_vieja, _, nodo = cola.tope()
+            clave_nueva = self._clave(nodo)
+            if clave_vieja < clave_nueva:
+                cola.insertar(nodo, clave_nueva, self._siguiente_contador())
+                continue
+
+            cola.extraer()
+            expandidos += 1
+            g_nodo = g.get(nodo, INFINITO)
+            rhs_nodo = rhs.get(nodo, INFINITO)
+
+            if g_nodo > rhs_nodo:
+                # Sobreconsistente: fijar g y propagar a los predecesores
+                g[nodo] = rhs_nodo
+                for vecino in self._vecinos(nodo):
+                    if vecino != self.fin:
+                        costo = calcular_peso_movimiento(vecino, nodo, self.config_costos) + rhs_nodo
+                        if costo < rhs.get(vecino, INFINITO):
+                            rhs[vecino] = costo
+                        self._actualizar_nodo(vecino)
+            else:
+                # Subconsistente: invalidar g y recalcular quien dependía de él
+                g[nodo] = INFINITO
+                for vecino in self._vecinos(nodo) + [nodo]:
+                    if vecino != self.fin:
+                        rhs[vecino] = self._rhs_desde_sucesores(vecino)
+                    self._actualizar_nodo(vecino)
+
+        self.expandidos_ultima = expandidos
+        self.nodos_expandidos += expandidos
+
+    def _extraer_camino(self):
+        """Sigue el mejor sucesor desde el inicio hasta el fin"""
+        camino = []
+        actual = self.inicio
+        visitados = {actual}
+        while actual != self.fin:
+            mejor, siguiente = INFINITO, None
+            for vecino in self._vecinos(actual):
+                costo = calcular_peso_movimiento(actual, vecino, self.config_costos) + \
+                    self.g.get(vecino, INFINITO)
+                if costo < mejor:
+                    mejor, siguiente = costo, vecino
+            if siguiente is None or siguiente in visitados:
+                return None
+            visitados.add(siguiente)
+            camino.append(siguiente)
+            actual = siguiente
+        return camino[:-1]
+
+    def planificar(self):
+        """
+        Calcula (o repara) el camino mínimo desde el inicio actual
+
+        Returns:
+            tuple: (exito, camino, costo)
+                   camino sin inicio ni fin, igual que reconstruir_camino
+        """
+        self._calcular_camino_minimo()
+        costo = self.g.get(self.inicio, INFINITO)
+        if self.inicio == self.fin:
+            return not self.mascara.esta_bloqueada(self.fin), [], 0.0
+        if costo == INFINITO or self.mascara.esta_bloqueada(self.inicio):
+            return False, [], None
+
+        camino = self._extraer_camino()
+        if camino is None:
+            return False, [], None
+        return True, camino, costo
+
+    # ===== CAMBIOS =====
+
+    def actualizar_obstaculos(self, agregados=(), eliminados=()):
+        """
+        Aplica cambios de obstáculos; la reparación ocurre en planificar()
+
+        Args:
+            agregados: Celdas que pasan a ser obstáculo
+            eliminados: Celdas que dejan de ser obstáculo
+
+        Returns:
+            set: Celdas que realmente cambiaron
+        """
+        cambiadas = set()
+        for celda in agregados:
+            if celda not in self.obstaculos:
+                self.obstaculos.add(celda)
+                self.mascara.cambiar_celda(celda, True)
+                cambiadas.add(celda)
+        for celda in eliminados:
+            if celda in self.obstaculos:
+                self.obstaculos.discard(celda)
+                self.mascara.cambiar_celda(celda, False)
+                cambiadas.add(celda)
+        if not cambiadas:
+            return cambiadas
+
+        # Solo cambian las aristas con un extremo en la celda o en sus 8
+        # vecinas (incluidas las diagonales que pasaban por su esquina)
+        afectados = set()
+        for fila, col in cambiadas:
+            for f in range(max(fila - 1, 0), min(fila + 2, self.filas)):
+                for c in range(max(col - 1, 0), min(col + 2, self.columnas)):
+                    afectados.add((f, c))
+        for nodo in afectados:
+            if nodo != self.fin:
+                self.rhs[nodo] = self._rhs_desde_sucesores(nodo)
+            self._actualizar_nodo(nodo)
+
+        self.replanificaciones += 1
+        return cambiadas
+
+    def mover_inicio(self, nuevo_inicio):
+        """
+        Mueve el inicio (el robot avanzó) conservando la búsqueda
+
+        Las claves de la cola se corrigen con km en vez de recalcularlas.
+        """
+        if nuevo_inicio == self.inicio:
+            return
+        self.km += self.heuristica(nuevo_inicio)
+        self.inicio = nuevo_inicio
+        self.heuristica = crear_distancia_libre(nuevo_inicio, self.config_costos,
+                                                self.permitir_diagonal)
+
+    def obtener_estadisticas(self):
+        """
+        Obtiene estadísticas del replanificador
+
+        Returns:
+            dict: Diccionario con estadísticas
+        """
+        return {
+            'nodos_expandidos': self.nodos_expandidos,
+            'nodos_expandidos_ultima': self.expandidos_ultima,
+            'nodos_en_cola': len(self.cola),
+            'nodos_con_g': len(self.g),
+            'replanificaciones': self.replanificaciones,
+            'km': self.km,
+            'costo_g_objetivo': (self.g.get(self.inicio)
+                                 if self.g.get(self.inicio, INFINITO) != INFINITO else None)
+        }
@@ -0,0 +1,39 @@
+"""
+Pruebas de resolver_lote: resultados en el orden de los pares, con y sin
+procesos trabajadores
+"""
+import math
+import random
+
+from algoritmo_astar import AlgoritmoAStar
+from busqueda_lotes import resolver_lote
+
+
+def test_orden_de_resultados():
+    config_costos = {'horizontal': 1.0, 'vertical': 1.0, 'diagonal': 1.4}
+    azar = random.Random(7)
+    filas, columnas = 30, 25
+    celdas = [(f, c) for f in range(filas) for c in range(columnas)]
+    obstaculos = set(azar.sample(celdas, len(celdas) * 3 // 10))
+    libres = [c for c in celdas if c not in obstaculos]
+    pares = [tuple(azar.sample(libres, 2)) for _ in range(40)]
+
+    esperados = []
+    for inicio, fin in pares:
+        algoritmo = AlgoritmoAStar(inicio, fin, filas, columnas, obstaculos,
+                                   config_costos, True, 'octile')
+        exito, _, _, _ = algoritmo.ejecutar_completo()
+        esperados.append(algoritmo.obtener_estadisticas()['costo_g_objetivo']
+                         if exito else None)
+    assert None in esperados     # El lote incluye pares sin camino
+
+    for procesos in (1, 3):
+        resultados = resolver_lote(filas, columnas, obstaculos, pares, config_costos,
+                                   True, 'octile', procesos=procesos, tamano_bloque=4)
+        assert len(resultados) == len(pares)
+        for (inicio, fin), esperado, (exito, camino, costo, _) in zip(pares, esperados,
+                                                                      resultados):
+            assert exito == (esperado is not None), (procesos, inicio, fin)
+            if exito:
+                assert math.isclose(costo, esperado, abs_tol=1e-6), (procesos, inicio, fin)
+                assert not set(camino) & obstaculos
@@ -0,0 +1,39 @@
+"""
+Pruebas de las componentes conexas: la actualización incremental contra un
+etiquetado completo desde cero
+"""
+import random
+
+from componentes_conexas import ComponentesConexas
+
+
+def particion(componentes):
+    """Conjunto de grupos de celdas libres (independiente de las etiquetas)"""
+    grupos = {}
+    for fila in range(componentes.filas):
+        for col in range(componentes.columnas):
+            if (fila, col) not in componentes.obstaculos:
+                grupos.setdefault(componentes.componente((fila, col)), set()).add((fila, col))
+    return {frozenset(grupo) for grupo in grupos.values()}
+
+
+def test_actualizacion_como_etiquetado_completo():
+    for permitir_diagonal in (False, True):
+        for semilla in range(60):
+            azar = random.Random(semilla)
+            filas, columnas = azar.randint(2, 15), azar.randint(2, 15)
+            celdas = [(f, c) for f in range(filas) for c in range(columnas)]
+            obstaculos = set(azar.sample(celdas, len(celdas) // 3))
+            componentes = ComponentesConexas(filas, columnas, obstaculos, permitir_diagonal)
+            for paso in range(20):
+                lote = azar.sample(celdas, azar.randint(1, 3))
+                if azar.random() < 0.5:
+                    componentes.actualizar_obstaculos(agregados=lote)
+                    obstaculos.update(lote)
+                else:
+                    componentes.actualizar_obstaculos(eliminados=lote)
+                    obstaculos.difference_update(lote)
+                nuevas = ComponentesConexas(filas, columnas, obstaculos, permitir_diagonal)
+                contexto = (permitir_diagonal, semilla, paso)
+                assert particion(componentes) == particion(nuevas), contexto
+                assert componentes.total == nuevas.total, contexto
@@ -0,0 +1,105 @@
+"""
+Pruebas de los motores y colas: mismo costo que 'diccionarios' en mapas
+aleatorios con semilla
+"""
+import math
+import random
+
+from algoritmo_astar import AlgoritmoAStar
+from colas_prioridad import COLAS
+
+CONFIGURACIONES = [
+    ({'horizontal': 1.0, 'vertical': 1.0, 'diagonal': 1.4}, True),
+    ({'horizontal': 1.0, 'vertical': 1.0, 'diagonal': math.sqrt(2)}, True),
+    ({'horizontal': 0.1, 'vertical': 0.2, 'diagonal': 0.3}, True),
+    ({'horizontal': 1.0, 'vertical': 1.0, 'diagonal': 1.4}, False),
+]
+
+# Motores que devuelven el camino óptimo en la cuadrícula
+MOTORES_OPTIMOS = ('arreglos', 'bidireccional', 'ara', 'ida')
+
+
+def mapa_aleatorio(semilla):
+    """(filas, columnas, obstaculos, inicio, fin) con ~25% de obstáculos"""
+    azar = random.Random(semilla)
+    filas, columnas = azar.randint(3, 20), azar.randint(3, 20)
+    celdas = [(f, c) for f in range(filas) for c in range(columnas)]
+    obstaculos = set(azar.sample(celdas, len(celdas) // 4))
+    inicio, fin = azar.sample([c for c in celdas if c not in obstaculos], 2)
+    return filas, columnas, obstaculos, inicio, fin
+
+
+def resolver(mapa, config_costos, permitir_diagonal, **opciones):
+    """(exito, costo) de una consulta; costo es None sin camino"""
+    filas, columnas, obstaculos, inicio, fin = mapa
+    heuristica = 'octile' if permitir_diagonal else 'manhattan'
+    algoritmo = AlgoritmoAStar(inicio, fin, filas, columnas, obstaculos, config_costos,
+                               permitir_diagonal, heuristica, **opciones)
+    exito, camino, _, _ = algoritmo.ejecutar_completo()
+    assert not set(camino) & obstaculos
+    estadisticas = algoritmo.obtener_estadisticas()
+    return exito, estadisticas['costo_g_objetivo'] if exito else None
+
+
+def iguales(a, b):
+    if a is None or b is None:
+        return a is b
+    return math.isclose(a, b, abs_tol=1e-6)
+
+
+def test_motores_como_diccionarios():
+    for config_costos, permitir_diagonal in CONFIGURACIONES:
+        for semilla in range(60):
+            mapa = mapa_aleatorio(semilla)
+            _, esperado = resolver(mapa, config_costos, permitir_diagonal,
+                                   motor='diccionarios')
+            for motor in MOTORES_OPTIMOS:
+                _, costo = resolver(mapa, config_costos, permitir_diagonal, motor=motor)
+                assert iguales(costo, esperado), (motor, config_costos, semilla)
+
+
+def test_jps_como_diccionarios():
+    """JPS y JPS+ solo admiten diagonal y costo recto uniforme"""
+    config_costos = {'horizontal': 1.0, 'vertical': 1.0, 'diagonal': 1.4}
+    for semilla in range(150):
+        mapa = mapa_aleatorio(semilla)
+        _, esperado = resolver(mapa, config_costos, True, motor='diccionarios')
+        for motor in ('jps', 'jps+'):
+            _, costo = resolver(mapa, config_costos, True, motor=motor)
+            assert iguales(costo, esperado), (motor, semilla)
+
+
+def test_theta_cotas():
+    """
+    Theta* y Lazy Theta* no buscan en la cuadrícula: encuentran camino en los
+    mismos casos que A*, no bajan de la línea recta, y su camino llevado a la
+    cuadrícula (costo_cuadricula) no baja del óptimo de A*
+    """
+    config_costos = {'horizontal': 1.0, 'vertical': 1.0, 'diagonal': math.sqrt(2)}
+    for semilla in range(150):
+        mapa = mapa_aleatorio(semilla)
+        _, _, obstaculos, inicio, fin = mapa
+        _, esperado = resolver(mapa, config_costos, True, motor='diccionarios')
+        for motor in ('theta', 'lazy-theta'):
+            algoritmo = AlgoritmoAStar(inicio, fin, mapa[0], mapa[1], obstaculos,
+                                       config_costos, True, 'octile', motor=motor)
+            exito, _, _, _ = algoritmo.ejecutar_completo()
+            assert exito == (esperado is not None), (motor, semilla)
+            if exito:
+                estadisticas = algoritmo.obtener_estadisticas()
+                recta = math.hypot(fin[0] - inicio[0], fin[1] - inicio[1])
+                assert estadisticas['costo_g_objetivo'] >= recta - 1e-6, (motor, semilla)
+                assert estadisticas['costo_cuadricula'] >= esperado - 1e-6, (motor, semilla)
+
+
+def test_colas_como_heapq():
+    for config_costos, permitir_diagonal in CONFIGURACIONES:
+        for semilla in range(60):
+            mapa = mapa_aleatorio(semilla)
+            _, esperado = resolver(mapa, config_costos, permitir_diagonal,
+                                   motor='diccionarios')
+            for motor in ('diccionarios', 'arreglos'):
+                for cola in COLAS:
+                    _, costo = resolver(mapa, config_costos, permitir_diagonal,
+                                        motor=motor, cola=cola)
+                    assert iguales(costo, esperado), (motor, cola, config_costos, semilla)
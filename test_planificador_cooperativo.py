@@ -0,0 +1,73 @@
+"""
+Pruebas del planificador cooperativo: los caminos devueltos no chocan
+"""
+import random
+
+from planificador_cooperativo import PlanificadorCooperativo
+
+CONFIG_COSTOS = {'horizontal': 1.0, 'vertical': 1.0, 'diagonal': 1.4}
+
+
+def posicion(camino, t):
+    """Después del último instante el agente sigue en su última celda"""
+    return camino[min(t, len(camino) - 1)]
+
+
+def comprobar_caminos(agentes, resultados, obstaculos, permitir_diagonal, contexto):
+    caminos = [camino for _, camino in resultados]
+    for (inicio, fin), (exito, camino) in zip(agentes, resultados):
+        assert camino and camino[0] == inicio, contexto
+        assert not exito or camino[-1] == fin, contexto
+        for desde, hacia in zip(camino, camino[1:]):
+            assert hacia not in obstaculos, contexto
+            df, dc = abs(hacia[0] - desde[0]), abs(hacia[1] - desde[1])
+            assert max(df, dc) <= 1 and (permitir_diagonal or df + dc <= 1), contexto
+
+    duracion = max(len(camino) for camino in caminos)
+    for t in range(duracion):
+        ocupadas = {}
+        for agente, camino in enumerate(caminos):
+            celda = posicion(camino, t)
+            assert celda not in ocupadas, ('vértice', t, celda, ocupadas.get(celda),
+                                           agente, contexto)
+            ocupadas[celda] = agente
+        if t == 0:
+            continue
+        movimientos = {(posicion(camino, t - 1), posicion(camino, t)) for camino in caminos}
+        for desde, hacia in movimientos:
+            if desde != hacia:
+                assert (hacia, desde) not in movimientos, ('arista', t, desde, hacia, contexto)
+
+
+def escenario(semilla):
+    azar = random.Random(semilla)
+    filas, columnas = azar.randint(4, 9), azar.randint(4, 9)
+    celdas = [(f, c) for f in range(filas) for c in range(columnas)]
+    obstaculos = set(azar.sample(celdas, len(celdas) // 5))
+    libres = [c for c in celdas if c not in obstaculos]
+    cantidad = min(azar.randint(2, 6), len(libres) // 2)
+    inicios = azar.sample(libres, cantidad)
+    fines = azar.sample(libres, cantidad)
+    return filas, columnas, obstaculos, list(zip(inicios, fines))
+
+
+def test_agente_sin_plan():
+    """Con ventana, un agente sin plan esperaba en una celda ya reservada"""
+    obstaculos = {(3, 3), (4, 0), (4, 3), (5, 2)}
+    agentes = [((0, 0), (5, 0)), ((1, 2), (1, 2)), ((2, 0), (5, 1))]
+    planificador = PlanificadorCooperativo(6, 4, obstaculos, CONFIG_COSTOS, ventana=2)
+    resultados = planificador.planificar(agentes)
+    comprobar_caminos(agentes, resultados, obstaculos, False, 'ventana=2')
+
+
+def test_sin_conflictos():
+    for semilla in range(150):
+        filas, columnas, obstaculos, agentes = escenario(semilla)
+        for permitir_diagonal in (False, True):
+            for ventana in (None, 2, 4, 8):
+                planificador = PlanificadorCooperativo(filas, columnas, obstaculos,
+                                                       CONFIG_COSTOS, permitir_diagonal,
+                                                       ventana=ventana)
+                resultados = planificador.planificar(agentes)
+                comprobar_caminos(agentes, resultados, obstaculos, permitir_diagonal,
+                                  (semilla, permitir_diagonal, ventana))
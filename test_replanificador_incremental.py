@@ -0,0 +1,92 @@
+"""
+Pruebas de D* Lite: cada replanificación contra una búsqueda A* nueva
+"""
+import math
+import random
+
+from algoritmo_astar import AlgoritmoAStar
+from replanificador_incremental import ReplanificadorDStarLite
+
+CONFIGURACIONES = [
+    ({'horizontal': 1.0, 'vertical': 1.0, 'diagonal': 1.4}, True),
+    ({'horizontal': 1.0, 'vertical': 1.0, 'diagonal': math.sqrt(2)}, True),
+    ({'horizontal': 0.1, 'vertical': 0.2, 'diagonal': 0.3}, True),
+    ({'horizontal': 1.0, 'vertical': 1.0, 'diagonal': 1.4}, False),
+]
+
+
+def costo_astar(inicio, fin, filas, columnas, obstaculos, config_costos, permitir_diagonal):
+    """Costo óptimo con A* desde cero (None si no hay camino)"""
+    heuristica = 'octile' if permitir_diagonal else 'manhattan'
+    algoritmo = AlgoritmoAStar(inicio, fin, filas, columnas, obstaculos, config_costos,
+                               permitir_diagonal, heuristica, motor='diccionarios')
+    exito, _, _, _ = algoritmo.ejecutar_completo()
+    return algoritmo.obtener_estadisticas()['costo_g_objetivo'] if exito else None
+
+
+def comprobar(replanificador, obstaculos, config_costos, permitir_diagonal, contexto):
+    exito, camino, costo = replanificador.planificar()
+    esperado = costo_astar(replanificador.inicio, replanificador.fin,
+                           replanificador.filas, replanificador.columnas,
+                           obstaculos, config_costos, permitir_diagonal)
+    assert exito == (esperado is not None), contexto
+    if exito:
+        assert math.isclose(costo, esperado, abs_tol=1e-6), (contexto, costo, esperado)
+        assert not set(camino) & obstaculos, contexto
+
+
+def test_caso_reportado():
+    """Empate de claves por redondeo: terminaba sin camino habiendo uno"""
+    config_costos = {'horizontal': 1.0, 'vertical': 1.0, 'diagonal': 1.4}
+    obstaculos = {(0, 1), (1, 1), (2, 1), (3, 2), (6, 0), (7, 0), (7, 2), (9, 0), (10, 0)}
+    replanificador = ReplanificadorDStarLite((4, 1), (3, 0), 11, 3, obstaculos,
+                                             config_costos, True)
+    replanificador.planificar()
+    cambios = [('agregar', (1, 2)), ('eliminar', (9, 0)), ('eliminar', (6, 0)),
+               ('eliminar', (7, 2)), ('mover', (5, 2)), ('agregar', (4, 0)),
+               ('mover', (8, 2))]
+    for accion, celda in cambios:
+        if accion == 'agregar':
+            obstaculos.add(celda)
+            replanificador.actualizar_obstaculos(agregados={celda})
+        elif accion == 'eliminar':
+            obstaculos.discard(celda)
+            replanificador.actualizar_obstaculos(eliminados={celda})
+        else:
+            replanificador.mover_inicio(celda)
+        comprobar(replanificador, obstaculos, config_costos, True, (accion, celda))
+
+    exito, _, costo = replanificador.planificar()
+    assert exito and math.isclose(costo, 6.4)
+
+
+def test_cambios_aleatorios():
+    for config_costos, permitir_diagonal in CONFIGURACIONES:
+        for tipo_heuristica in ('manhattan', 'euclidiana', 'octile', 'chebyshev'):
+            for semilla in range(40):
+                azar = random.Random(semilla)
+                filas, columnas = azar.randint(3, 12), azar.randint(3, 12)
+                celdas = [(f, c) for f in range(filas) for c in range(columnas)]
+                obstaculos = set(azar.sample(celdas, len(celdas) // 4))
+                inicio, fin = azar.sample([c for c in celdas if c not in obstaculos], 2)
+                replanificador = ReplanificadorDStarLite(
+                    inicio, fin, filas, columnas, obstaculos, config_costos,
+                    permitir_diagonal, tipo_heuristica
+                )
+                comprobar(replanificador, obstaculos, config_costos, permitir_diagonal,
+                          (semilla, 'inicial'))
+                for paso in range(15):
+                    celda = azar.choice(celdas)
+                    sorteo = azar.random()
+                    if celda == fin:
+                        continue
+                    if sorteo < 0.3 and celda != replanificador.inicio:
+                        obstaculos.add(celda)
+                        replanificador.actualizar_obstaculos(agregados={celda})
+                    elif sorteo < 0.7:
+                        obstaculos.discard(celda)
+                        replanificador.actualizar_obstaculos(eliminados={celda})
+                    elif celda not in obstaculos:
+                        replanificador.mover_inicio(celda)
+                    comprobar(replanificador, obstaculos, config_costos, permitir_diagonal,
+                              (config_costos, tipo_heuristica, semilla, paso))